@@ -0,0 +1,147 @@
+import os
+from exceptions import FileFormatError
+
+
+# Dataset format used by pyarrow for each columnar extension
+ARROW_FORMATS = {'.parquet': 'parquet', '.feather': 'ipc', '.arrow': 'ipc'}
+# Prefix of the columns where pandas stores a non-default index
+INDEX_PREFIX = "__index_level_"
+
+
+def _import_pyarrow():
+    """
+    Import the optional pyarrow modules used to read columnar files.
+
+    Returns:
+        - tuple: The pyarrow.dataset, pyarrow.fs and pyarrow.parquet modules.
+
+    Raises:
+        - FileFormatError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.fs as pafs
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise FileFormatError(
+            "Parquet, Feather and Arrow files require the optional "
+            "dependency pyarrow (pip install pyarrow).")
+    return ds, pafs, pq
+
+
+def open_dataset(file_path):
+    """
+    Open a Parquet, Feather (v2) or Arrow IPC file as a lazy pyarrow dataset.
+
+    The file is memory-mapped, so only the pages of the columns and row
+    groups that are actually read are loaded from disk.
+
+    Parameters:
+        - file_path (str): Path to the file.
+
+    Returns:
+        - pyarrow.dataset.Dataset: Dataset over the file, no data is read yet.
+
+    Raises:
+        - FileFormatError: If pyarrow is not installed or the file is damaged
+          or not in the format of its extension.
+    """
+    ds, pafs, _ = _import_pyarrow()
+    extension = os.path.splitext(file_path)[1].lower()
+    try:
+        return ds.dataset(os.path.abspath(file_path), format=ARROW_FORMATS[extension],
+                          filesystem=pafs.LocalFileSystem(use_mmap=True))
+    except (OSError, ValueError) as e:  # pyarrow.ArrowInvalid is a ValueError
+        raise FileFormatError(f"The file could not be read as {extension}: {e}")
+
+
+def read_arrow(file_path, columns=None, filters=None):
+    """
+    Read a Parquet, Feather (v2) or Arrow IPC file into a DataFrame.
+
+    Only the requested columns are read. Filters are checked against the
+    statistics of each Parquet row group first, so row groups that cannot
+    match are skipped without reading them.
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - columns (list, optional): Columns to read. By default every column is read.
+        - filters (list, optional): Row filters in the pyarrow/pandas format,
+          e.g. [("year", ">=", 2020)], or a list of such lists joined with OR.
+
+    Returns:
+        - pandas.DataFrame: DataFrame with the selected columns and rows and a
+          default index.
+
+    Raises:
+        - FileFormatError: If pyarrow is not installed, the file cannot be
+          read or the filters are not valid.
+    """
+    _, _, pq = _import_pyarrow()
+    dataset = open_dataset(file_path)
+    if columns is None:
+        columns = data_columns(dataset.schema)
+    try:
+        expression = None if not filters else pq.filters_to_expression(filters)
+        table = dataset.to_table(columns=columns, filter=expression)
+    except (TypeError, ValueError, NotImplementedError) as e:
+        raise FileFormatError(f"The filters could not be applied: {e}")
+
+    # One block per column avoids copying the columns into a single 2D block;
+    # the pandas index stored in the file is not kept, rows may have been filtered
+    return table.to_pandas(split_blocks=True, ignore_metadata=True)
+
+
+def head_arrow(file_path, rows):
+    """
+    Read the first rows of a Parquet, Feather (v2) or Arrow IPC file.
+
+    Only the row groups or record batches that hold those rows are read.
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - rows (int): Maximum number of rows.
+
+    Returns:
+        - pandas.DataFrame: DataFrame with the first rows and a default index.
+
+    Raises:
+        - FileFormatError: If pyarrow is not installed or the file cannot be read.
+    """
+    dataset = open_dataset(file_path)
+    table = dataset.head(rows, columns=data_columns(dataset.schema))
+    return table.to_pandas(split_blocks=True, ignore_metadata=True)
+
+
+def arrow_schema(file_path):
+    """
+    Get the columns of a Parquet, Feather or Arrow file and their pandas dtypes.
+
+    Only the schema stored in the file footer is read.
+
+    Parameters:
+        - file_path (str): Path to the file.
+
+    Returns:
+        - dict: Column names mapped to their pandas dtype names, in file order.
+
+    Raises:
+        - FileFormatError: If pyarrow is not installed or the file cannot be read.
+    """
+    schema = open_dataset(file_path).schema
+    empty = schema.empty_table().select(data_columns(schema))
+    return {column: str(dtype) for column, dtype in
+            empty.to_pandas(ignore_metadata=True).dtypes.items()}
+
+
+def data_columns(schema):
+    """
+    Get the data columns of a schema, without the index saved by pandas.
+
+    Parameters:
+        - schema (pyarrow.Schema): Schema of the file.
+
+    Returns:
+        - list: Names of the data columns.
+    """
+    return [name for name in schema.names if not name.startswith(INDEX_PREFIX)]
@@ -0,0 +1,53 @@
+"""
+Benchmark of the bootstrap against resampling the rows and refitting each replicate.
+
+Usage:
+    python benchmarks/bench_bootstrap.py [--rows 1000000] [--replicates 10000] [--workers N] [--refits 20]
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bootstrap import bootstrap  # noqa: E402
+from linear_regression import LinearRegression  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--replicates", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes of the bootstrap, one per CPU core by default")
+    parser.add_argument("--refits", type=int, default=20,
+                        help="Replicates refitted one by one to estimate the time of all of them")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = pd.Series(rng.uniform(0, 100, args.rows), name="x")
+    y = pd.Series(3 + 2 * x + rng.normal(0, 1, args.rows), name="y")
+
+    start = time.perf_counter()
+    result = bootstrap(x, y, args.replicates, seed=0, workers=args.workers)
+    pooled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.refits):
+        rows = rng.integers(0, args.rows, args.rows)
+        LinearRegression(x.iloc[rows], y.iloc[rows])
+    refits = (time.perf_counter() - start) / args.refits * args.replicates
+
+    workers = args.workers or os.cpu_count() or 1
+    print(f"{args.rows:,} rows, {args.replicates:,} replicates, {workers} workers")
+    print(f"Slope 95% interval: {result.slope_interval[0]:.6f} to {result.slope_interval[1]:.6f}")
+    print(f"{'Bootstrap':<24}{pooled:>10.2f} s")
+    print(f"{'Refits (est.)':<24}{refits:>10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
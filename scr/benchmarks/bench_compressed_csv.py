@@ -0,0 +1,93 @@
+"""
+Benchmark of reading compressed CSV files in streaming mode.
+
+Writes the same table as plain CSV and with each supported codec, then reads
+every file with iter_csv_chunks, which decompresses while parsing. Throughput
+is measured in MB of uncompressed CSV per second.
+
+Usage:
+    python benchmarks/bench_compressed_csv.py [--rows 5000000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_files import iter_csv_chunks  # noqa: E402
+
+# Suffix of each file, the compression is inferred from it
+CODECS = {"none": ".csv", "gzip": ".csv.gz", "bz2": ".csv.bz2", "xz": ".csv.xz",
+          "zip": ".zip"}
+
+
+def create_table(rows):
+    """
+    Create a table with integer, real and text columns.
+
+    Parameters:
+        - rows (int): Number of rows.
+
+    Returns:
+        - pandas.DataFrame: The table.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 100, rows)
+    return pd.DataFrame({
+        "id": np.arange(rows),
+        "x": x,
+        "y": 3 + 2 * x + rng.normal(0, 1, rows),
+        "label": rng.choice(["north", "south", "east", "west"], rows),
+    })
+
+
+def measure(file_path, repeat):
+    """
+    Get the best time of several streaming reads of a file.
+
+    Parameters:
+        - file_path (str): Path to the CSV file.
+        - repeat (int): Number of reads.
+
+    Returns:
+        - float: Best time in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in iter_csv_chunks(file_path):
+            pass
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = create_table(args.rows)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for codec, suffix in CODECS.items():
+            file_path = os.path.join(tmp_dir, f"bench{suffix}")
+            print(f"Writing {args.rows:,} rows with {codec}...")
+            df.to_csv(file_path, index=False)
+            results.append((codec, os.path.getsize(file_path),
+                            measure(file_path, args.repeat)))
+
+    raw_size = results[0][1]  # Uncompressed CSV
+    print(f"{'Codec':<8}{'Size (MB)':>11}{'Ratio':>8}{'Best time (s)':>15}{'MB/s':>9}")
+    for codec, size, seconds in results:
+        print(f"{codec:<8}{size / 1e6:>11.1f}{raw_size / size:>8.1f}"
+              f"{seconds:>15.2f}{raw_size / 1e6 / seconds:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark of reloading a growing CSV file in full and incrementally.
+
+Writes a CSV file, then appends a batch of rows several times and measures
+after each append the time of open_file and of IncrementalCSVReader.reload.
+
+Usage:
+    python benchmarks/bench_incremental_reload.py [--rows 2000000] [--append 10000] [--times 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_files import open_file  # noqa: E402
+from incremental_csv import IncrementalCSVReader  # noqa: E402
+
+
+def create_rows(start, rows):
+    """
+    Create log rows with a timestamp, a real value and a text column.
+
+    Parameters:
+        - start (int): Timestamp of the first row.
+        - rows (int): Number of rows.
+
+    Returns:
+        - pandas.DataFrame: The rows.
+    """
+    rng = np.random.default_rng(start)
+    return pd.DataFrame({
+        "t": np.arange(start, start + rows),
+        "value": rng.normal(0, 1, rows),
+        "level": rng.choice(["info", "warning", "error"], rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--append", type=int, default=10_000)
+    parser.add_argument("--times", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "log.csv")
+        print(f"Writing {args.rows:,} rows...")
+        create_rows(0, args.rows).to_csv(file_path, index=False)
+        reader = IncrementalCSVReader(file_path)
+        reader.read()
+
+        print(f"{'Rows':>12}{'open_file (s)':>15}{'reload (s)':>12}")
+        rows = args.rows
+        for _ in range(args.times):
+            create_rows(rows, args.append).to_csv(file_path, mode="a", header=False,
+                                                  index=False)
+            rows += args.append
+
+            start = time.perf_counter()
+            open_file(file_path)
+            full = time.perf_counter() - start
+
+            start = time.perf_counter()
+            result = reader.reload()
+            incremental = time.perf_counter() - start
+            assert len(result.data) == rows and not result.full
+
+            print(f"{rows:>12,}{full:>15.3f}{incremental:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark of creating a model again with the model cache against refitting it.
+
+Usage:
+    python benchmarks/bench_model_cache.py [--rows 1000000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cross_validation import CV_FOLDS  # noqa: E402
+from linear_regression import LinearRegression  # noqa: E402
+from model_cache import ModelCache, fit_key  # noqa: E402
+
+
+def fit(feature, target):
+    """Fit and cross-validate a model, as the interface does."""
+    model = LinearRegression(feature, target)
+    model.cross_validate(CV_FOLDS, seed=0)
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.uniform(0, 100, args.rows)})
+    df["y"] = 3 + 2 * df["x"] + rng.normal(0, 1, args.rows)
+
+    cache = ModelCache()
+
+    def cached():
+        return cache.get_or_fit(fit_key(df["x"], df["y"]), lambda: fit(df["x"], df["y"]))
+
+    cached()  # The first model is fitted
+    refit = min(timeit.repeat(lambda: fit(df["x"], df["y"]), number=1, repeat=args.repeat))
+    hit = min(timeit.repeat(cached, number=1, repeat=args.repeat))
+
+    print(f"{args.rows:,} rows, {cache.stats.hits} hits, {cache.stats.misses} misses")
+    print(f"{'Refit':<24}{refit * 1000:>10.1f} ms")
+    print(f"{'Cache hit':<24}{hit * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark of the regression engines: closed-form NumPy against statsmodels.
+
+Usage:
+    python benchmarks/bench_ols_engine.py [--rows 10000000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linear_regression import LinearRegression  # noqa: E402
+from ols import ENGINES  # noqa: E402
+
+
+def measure(x, y, engine, repeat):
+    """
+    Get the best time of several fits.
+
+    Parameters:
+        - x (pandas.Series): Feature.
+        - y (pandas.Series): Target.
+        - engine (str): Name of the engine.
+        - repeat (int): Number of fits.
+
+    Returns:
+        - float: Best time in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        LinearRegression(x, y, engine=engine)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = pd.Series(rng.uniform(0, 100, args.rows), name="x")
+    y = pd.Series(3 + 2 * x + rng.normal(0, 1, args.rows), name="y")
+
+    results = []
+    for engine in ENGINES:
+        try:
+            results.append((engine, measure(x, y, engine, args.repeat)))
+        except ImportError as e:
+            print(f"Skipping {engine}: {e}")
+
+    print(f"{'Engine':<13}{'Best time (s)':>14}")
+    for engine, seconds in results:
+        print(f"{engine:<13}{seconds:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
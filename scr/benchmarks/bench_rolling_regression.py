@@ -0,0 +1,48 @@
+"""
+Benchmark of the rolling regression against one LinearRegression per window.
+
+Usage:
+    python benchmarks/bench_rolling_regression.py [--rows 1000000] [--window 1000] [--refits 200]
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linear_regression import LinearRegression  # noqa: E402
+from rolling_regression import rolling_regression  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--window", type=int, default=1000)
+    parser.add_argument("--refits", type=int, default=200,
+                        help="Windows refitted one by one to estimate the time of all of them")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    x = pd.Series(rng.uniform(0, 100, args.rows), name="x")
+    y = pd.Series(3 + 2 * x + rng.normal(0, 1, args.rows), name="y")
+
+    start = time.perf_counter()
+    rolling_regression(x, y, args.window)
+    rolling = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for end in range(args.window, args.window + args.refits):
+        LinearRegression(x.iloc[end - args.window:end], y.iloc[end - args.window:end])
+    refits = (time.perf_counter() - start) / args.refits * (args.rows - args.window + 1)
+
+    print(f"{args.rows:,} rows, windows of {args.window:,} rows")
+    print(f"{'Rolling regression':<24}{rolling:>10.2f} s")
+    print(f"{'Refits (est.)':<24}{refits:>10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark of the all-pairs regression screening against one LinearRegression per pair.
+
+Usage:
+    python benchmarks/bench_screening.py [--rows 100000] [--columns 500] [--pairs 200]
+"""
+import argparse
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from linear_regression import LinearRegression  # noqa: E402
+from screening import screen_regressions  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=500)
+    parser.add_argument("--pairs", type=int, default=200,
+                        help="Pairs fitted one by one to estimate the time of all of them")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(args.rows, args.columns)),
+                      columns=[f"col{i}" for i in range(args.columns)])
+    pairs = args.columns * (args.columns - 1)
+
+    start = time.perf_counter()
+    screen_regressions(df)
+    screening = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(args.pairs):
+        LinearRegression(df.iloc[:, i % args.columns], df.iloc[:, (i + 1) % args.columns])
+    one_by_one = (time.perf_counter() - start) / args.pairs * pairs
+
+    print(f"{pairs:,} regressions of {args.rows:,} rows")
+    print(f"{'Screening':<24}{screening:>10.2f} s")
+    print(f"{'LinearRegression (est.)':<24}{one_by_one:>10.2f} s")
+
+
+if __name__ == "__main__":
+    main()
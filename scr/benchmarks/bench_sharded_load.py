@@ -0,0 +1,82 @@
+"""
+Benchmark of loading a directory of CSV shards with a growing number of processes.
+
+Usage:
+    python benchmarks/bench_sharded_load.py [--shards 16] [--rows 1000000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_files import open_file  # noqa: E402
+
+
+def create_shards(directory, shards, rows):
+    """
+    Write CSV shards with integer, real and text columns.
+
+    Parameters:
+        - directory (str): Directory of the shards.
+        - shards (int): Number of files.
+        - rows (int): Number of rows of each file.
+    """
+    rng = np.random.default_rng(0)
+    for shard in range(shards):
+        x = rng.uniform(0, 100, rows)
+        pd.DataFrame({
+            "id": np.arange(rows),
+            "x": x,
+            "y": 3 + 2 * x + rng.normal(0, 1, rows),
+            "label": rng.choice(["north", "south", "east", "west"], rows),
+        }).to_csv(os.path.join(directory, f"shard-{shard:03}.csv"), index=False)
+
+
+def measure(directory, workers, repeat):
+    """
+    Get the best time of several loads of the shards.
+
+    Parameters:
+        - directory (str): Directory of the shards.
+        - workers (int): Number of processes.
+        - repeat (int): Number of loads.
+
+    Returns:
+        - float: Best time in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        open_file(directory, workers=workers)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, *(2 ** i for i in range(1, cores.bit_length())), cores})
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"Writing {args.shards} shards of {args.rows:,} rows...")
+        create_shards(tmp_dir, args.shards, args.rows)
+        results = [(workers, measure(tmp_dir, workers, args.repeat)) for workers in counts]
+
+    single = results[0][1]
+    print(f"{'Workers':<9}{'Best time (s)':>14}{'Speed-up':>10}")
+    for workers, seconds in results:
+        print(f"{workers:<9}{seconds:>14.2f}{single / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
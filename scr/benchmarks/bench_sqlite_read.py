@@ -0,0 +1,124 @@
+"""
+Benchmark of the SQLite read path of open_sql.
+
+Compares the previous implementation (sqlite_master query on a sqlite3
+connection, then read_sql_table through a new SQLAlchemy engine) with the
+pooled read-only connection and batched reads into NumPy arrays.
+
+Usage:
+    python benchmarks/bench_sqlite_read.py [--rows 10000000] [--repeat 3]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+# Make the application modules importable when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_files import open_sql  # noqa: E402
+from sqlite_reader import close_connections  # noqa: E402
+
+
+def create_database(file_path, rows):
+    """
+    Create a table with integer, real and text columns.
+
+    Parameters:
+        - file_path (str): Path of the new database.
+        - rows (int): Number of rows of the table.
+    """
+    rng = np.random.default_rng(0)
+    conn = sqlite3.connect(file_path)
+    conn.execute("CREATE TABLE data (id INTEGER, x REAL, y REAL, label TEXT)")
+    chunk = 1_000_000
+    for start in range(0, rows, chunk):
+        size = min(chunk, rows - start)
+        x = rng.uniform(0, 100, size)
+        df = pd.DataFrame({
+            "id": np.arange(start, start + size),
+            "x": x,
+            "y": 3 + 2 * x + rng.normal(0, 1, size),
+            "label": rng.choice(["north", "south", "east", "west"], size),
+        })
+        df.to_sql("data", conn, index=False, if_exists="append")
+    conn.commit()
+    conn.close()
+
+
+def previous_open_sql(file_path):
+    """
+    Read the first table as open_sql did before the pooled reader.
+
+    Parameters:
+        - file_path (str): Path to the database.
+
+    Returns:
+        - pandas.DataFrame: The table data.
+    """
+    conn = sqlite3.connect(file_path)
+    try:
+        table_name = conn.execute("SELECT name FROM sqlite_master").fetchone()[0]
+        engine = create_engine('sqlite:///' + str(file_path))
+        df = pd.read_sql_table(table_name, engine)
+        engine.dispose()
+        return df
+    finally:
+        conn.close()
+
+
+def measure(function, file_path, repeat):
+    """
+    Get the best time of several calls.
+
+    Parameters:
+        - function: Function that reads the database.
+        - file_path (str): Path to the database.
+        - repeat (int): Number of calls.
+
+    Returns:
+        - float: Best time in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(file_path)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "bench.db")
+        print(f"Creating a table of {args.rows:,} rows...")
+        create_database(file_path, args.rows)
+
+        previous = measure(previous_open_sql, file_path, args.repeat)
+
+        def cold_open_sql(path):
+            close_connections()  # Every call pays for a new connection
+            return open_sql(path)
+
+        cold = measure(cold_open_sql, file_path, args.repeat)
+        warm = measure(open_sql, file_path, args.repeat)  # Reuses the pooled connection
+        close_connections()
+
+    print(f"{'Read path':<32}{'Best time (s)':>14}{'Speed-up':>10}")
+    for name, seconds in (("read_sql_table (previous)", previous),
+                          ("pooled reader, new connection", cold),
+                          ("pooled reader, reused connection", warm)):
+        print(f"{name:<32}{seconds:>14.2f}{previous / seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
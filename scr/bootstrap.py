@@ -0,0 +1,132 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+
+# Replicates computed together: their resample counts take
+# BATCH_SIZE · rows · 8 bytes (64 MB for a million rows)
+BATCH_SIZE = 8
+
+# Bootstrap replicates of the coefficients, their percentile confidence
+# intervals and the seed that reproduces them
+BootstrapResult = namedtuple("BootstrapResult", ["slopes", "intercepts", "slope_interval",
+                                                 "intercept_interval", "confidence", "seed"])
+
+# Columns of the data of each worker process, set by _init_worker
+_worker_data = None
+
+
+def bootstrap(feature, target, replicates=1000, confidence=0.95, seed=None, workers=None,
+              batch_size=BATCH_SIZE):
+    """
+    Estimate confidence intervals of the slope and intercept by resampling the rows.
+
+    Each replicate draws as many row indices as rows, with replacement, and
+    counts how many times each row was drawn. Its coefficients come from the
+    sums of x, y, x² and xy weighted by those counts, a matrix product done
+    for a batch of replicates at once, so the rows are never copied.
+
+    Batches are spread over a process pool. Each batch has its own seed,
+    spawned from the main seed with numpy.random.SeedSequence, so the result
+    only depends on the seed, not on the number of processes.
+
+    Parameters:
+        - feature (pd.Series or array): The independent variable.
+        - target (pd.Series or array): The dependent variable, as many values as feature.
+        - replicates (int, optional): Number of resamples.
+        - confidence (float, optional): Confidence level of the intervals.
+        - seed (int, optional): Seed of the resamples. By default a random one,
+          returned in the result.
+        - workers (int, optional): Number of processes. By default, one per
+          CPU core. 1 computes everything in this process.
+        - batch_size (int, optional): Replicates computed together.
+
+    Returns:
+        - BootstrapResult: Slope and intercept of each replicate (NaN if its
+          feature is constant), and the percentile intervals.
+
+    Raises:
+        - ValueError: If there are fewer than two rows, missing values, lengths
+          don't match, or replicates or confidence are not valid.
+    """
+    x = np.asarray(feature, dtype=np.float64)
+    y = np.asarray(target, dtype=np.float64)
+    if len(x) != len(y):
+        raise ValueError("Feature and target must have the same length")
+    if len(x) < 2:
+        raise ValueError("There isn't enough data to resample")
+    if np.isnan(x).any() or np.isnan(y).any():
+        raise ValueError("Input data must not contain missing values")
+    if replicates < 1:
+        raise ValueError("The number of replicates must be a positive integer")
+    if not 0 < confidence < 1:
+        raise ValueError("The confidence must be between 0 and 1")
+
+    # Centered values keep the weighted sums accurate
+    mean_x, mean_y = x.mean(), y.mean()
+    x, y = x - mean_x, y - mean_y
+    data = np.column_stack([x, y, x * x, x * y])
+
+    seed_sequence = np.random.SeedSequence(seed)
+    sizes = [min(batch_size, replicates - start) for start in range(0, replicates, batch_size)]
+    seeds = seed_sequence.spawn(len(sizes))
+
+    workers = min(len(sizes), workers or os.cpu_count() or 1)
+    if workers == 1:
+        sums = [_bootstrap_batch(batch_seed, size, data) for batch_seed, size in zip(seeds, sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data,)) as pool:
+            sums = list(pool.map(_bootstrap_batch, seeds, sizes))
+    sum_x, sum_y, sum_xx, sum_xy = np.concatenate(sums).T
+
+    n = len(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_xx = sum_xx - sum_x * sum_x / n
+        slopes = np.where(s_xx > 1e-12 * sum_xx, (sum_xy - sum_x * sum_y / n) / s_xx, np.nan)
+    # Intercepts back in the original scale
+    intercepts = (sum_y - slopes * sum_x) / n + mean_y - slopes * mean_x
+
+    tails = [50 * (1 - confidence), 50 * (1 + confidence)]
+    return BootstrapResult(
+        slopes,
+        intercepts,
+        tuple(np.nanpercentile(slopes, tails)),
+        tuple(np.nanpercentile(intercepts, tails)),
+        confidence,
+        seed_sequence.entropy,
+    )
+
+
+def _init_worker(data):
+    """
+    Keep the data in a worker process, so it is sent once and not with every batch.
+
+    Parameters:
+        - data (numpy.ndarray): Columns x, y, x² and xy.
+    """
+    global _worker_data
+    _worker_data = data
+
+
+def _bootstrap_batch(seed, size, data=None):
+    """
+    Compute the weighted sums of a batch of replicates.
+
+    Parameters:
+        - seed (numpy.random.SeedSequence): Seed of the batch.
+        - size (int): Number of replicates.
+        - data (numpy.ndarray, optional): Columns x, y, x² and xy. By default
+          the data of the worker process.
+
+    Returns:
+        - numpy.ndarray: Sums of x, y, x² and xy of each replicate, one row each.
+    """
+    data = _worker_data if data is None else data
+    n = len(data)
+    rng = np.random.default_rng(seed)
+    counts = np.empty((size, n))
+    for replicate in range(size):
+        counts[replicate] = np.bincount(rng.integers(0, n, n), minlength=n)
+    return counts @ data
@@ -1,15 +1,20 @@
 import tkinter as tk
+from tkinter import ttk
 
 class ColumnMenu:
     """
     A graphical interface for selecting input and output columns from a DataFrame.
-    This class provides a GUI that allows users to select one input column (feature)
-    and one output column (target) from a DataFrame using Tkinter widgets. It includes
+    This class provides a GUI that allows users to select one or more input columns
+    (features) and one output column (target) from a DataFrame using Tkinter widgets.
+    Selecting several features creates a multiple linear regression, and an optional
+    group column creates one regression per group. It includes
     scrollable listboxes for both feature and target selection, along with a confirmation
     button to validate the selection.
     """
 
-    def __init__(self, frame: tk.Frame, columns: list, manager):
+    NO_GROUP = "(none)"  # Group selector option to fit a single model
+
+    def __init__(self, frame: tk.Frame, columns: list, manager, group_columns: list = None):
         """
         Initialize the column selection interface.
 
@@ -17,13 +22,17 @@ class ColumnMenu:
             - frame: Parent frame where widgets will be placed
             - columns: List of available column names
             - manager: Reference to the MenuManager controller
+            - group_columns: Columns that can split the rows in groups (any
+              type). By default the same as columns.
         """
 
         self._frame = frame
         self._columns = columns
+        self._group_columns = list(columns if group_columns is None else group_columns)
         self._manager = manager
         self._selected_feature = []
         self._selected_target = []
+        self._selected_group = None
 
         self._menu_frame = tk.Frame(self._frame, bg='#d0d7f2')
         self._menu_frame.pack(fill = tk.X, padx = 80, pady = 20) 
@@ -35,6 +44,7 @@ class ColumnMenu:
         # Create the UI elements for feature and target selection
         self.create_features_selector()
         self.create_target_selector()
+        self.create_group_selector()
         self.create_confirm_button()
 
     @property
@@ -57,6 +67,16 @@ class ColumnMenu:
         """
         return self._selected_target
 
+    @property
+    def selected_group(self):
+        """
+        Get the selected group column.
+
+        Returns:
+            - str: Name of the group column, None if the rows are not grouped
+        """
+        return self._selected_group
+
     def _add_scrollbar_to_listbox(self, listbox: tk.Listbox, container: tk.Frame):
         """
         Add a scrollbar to a listbox and configure their interaction.
@@ -78,7 +98,7 @@ class ColumnMenu:
     def create_features_selector(self):
         """
         Create the feature columns selector.
-        Creates a frame containing a label, a single-selection listbox, and a scrollbar
+        Creates a frame containing a label, a multiple-selection listbox, and a scrollbar
         for selecting input features. The listbox is bound to the manager's selection
         handler.
         """
@@ -86,12 +106,12 @@ class ColumnMenu:
         # Create frame for feature selection on the left side
         features_frame = self._create_selector_frame(
             relx=0.03,
-            title="Select an input column (feature):"
+            title="Select input columns (features):"
         )
 
         # Create listbox container and components
         container = self._create_listbox_container(features_frame)
-        self._feature_listbox = self._create_listbox(container)
+        self._feature_listbox = self._create_listbox(container, selectmode=tk.MULTIPLE)
         self._populate_listbox(self._feature_listbox)
         self._add_scrollbar_to_listbox(self._feature_listbox, container)
 
@@ -115,6 +135,36 @@ class ColumnMenu:
         self._populate_listbox(self._target_listbox)
         self._add_scrollbar_to_listbox(self._target_listbox, container)
 
+    def create_group_selector(self):
+        """
+        Create the optional group column selector.
+
+        Creates a frame between the feature and target selectors with a
+        dropdown of the columns. Choosing one fits a regression per group.
+        """
+        group_frame = tk.Frame(self._menu_frame, bg='#d0d7f2')
+        group_frame.pack(side='left', expand=True)
+
+        label = tk.Label(
+            group_frame,
+            text="Group by (optional):",
+            fg='#4d598a',
+            bg='#d0d7f2',
+            font=("DejaVu Sans Mono", 10, 'bold')
+        )
+        label.pack(side='top')
+
+        self._group_combobox = ttk.Combobox(
+            group_frame,
+            values=[self.NO_GROUP, *self._group_columns],
+            state="readonly",
+            width=18
+        )
+        self._group_combobox.set(self.NO_GROUP)
+        self._group_combobox.pack(side='top', pady=5)
+        # A new group resets the selection like the listboxes
+        self._group_combobox.bind("<<ComboboxSelected>>", self._manager.on_listbox_select)
+
     def _create_selector_frame(self, relx: float, title: str) -> tk.Frame:
         """
         Create a frame with title for column selection.
@@ -165,20 +215,21 @@ class ColumnMenu:
         container.pack( side = 'top', fill = tk.X, padx = 30)
         return container
 
-    def _create_listbox(self, container: tk.Frame) -> tk.Listbox:
+    def _create_listbox(self, container: tk.Frame, selectmode: str = tk.SINGLE) -> tk.Listbox:
         """
         Create and configure a listbox for column selection.
 
         Parameters:
             - container: Parent frame for the listbox
+            - selectmode: Selection mode, single by default
 
         Returns:
             - tk.Listbox: Configured listbox widget
         """
-        # Create listbox with single selection mode
+        # Create listbox with the given selection mode
         listbox = tk.Listbox(
             container,
-            selectmode=tk.SINGLE,
+            selectmode=selectmode,
             height=5,
             exportselection=False
         )
@@ -224,7 +275,8 @@ class ColumnMenu:
         Store the currently selected columns from both listboxes.
 
         Updates the internal _selected_features and _selected_target lists with
-        the current selections from the respective listboxes.
+        the current selections from the respective listboxes, and the group
+        column from the dropdown.
 
         Returns:
             - None: Updates internal selected columns lists
@@ -238,4 +290,7 @@ class ColumnMenu:
         self._selected_target = [
             self._target_listbox.get(i)
             for i in self._target_listbox.curselection()
-        ]
\ No newline at end of file
+        ]
+        # Get selected group column from dropdown
+        group = self._group_combobox.get()
+        self._selected_group = None if group == self.NO_GROUP else group
\ No newline at end of file
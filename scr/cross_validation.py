@@ -0,0 +1,135 @@
+from collections import namedtuple
+import numpy as np
+
+
+# Folds of the cross-validation run for every simple regression in the interface
+CV_FOLDS = 5
+
+# Out-of-sample R² and MSE of every fold (repeats × folds of them)
+CVScores = namedtuple("CVScores", ["folds", "repeats", "r_squared", "mse"])
+
+# Keys of the summary of a cross-validation, as it is saved with a model
+CV_KEYS = {"folds", "repeats", "r_squared_mean", "r_squared_std", "mse_mean", "mse_std"}
+
+
+def cross_validate(feature, target, folds=CV_FOLDS, repeats=1, seed=None):
+    """
+    Estimate the out-of-sample R² and MSE of a simple linear regression with
+    (repeated) k-fold cross-validation.
+
+    The rows are split into folds of equal size at random, and the sums of
+    x, y, x², xy and y² of every fold are computed with segmented sums
+    (numpy.bincount). The training sums of each fold are the totals minus
+    the fold sums, and its test error follows from the fold sums too, so
+    the k fits of a repeat cost one pass over the data instead of k.
+
+    Parameters:
+        - feature (pd.Series or array): The independent variable.
+        - target (pd.Series or array): The dependent variable, as many values as feature.
+        - folds (int, optional): Number of folds.
+        - repeats (int, optional): Number of random splits into folds.
+        - seed (int, optional): Seed of the splits.
+
+    Returns:
+        - CVScores: R² and MSE of each test fold, the folds of each repeat
+          after each other. The scores of a fold whose training feature is
+          constant are NaN, as is the R² of a fold whose target is constant.
+
+    Raises:
+        - ValueError: If the lengths don't match, there are missing values or
+          fewer rows than folds, or folds or repeats are not valid.
+    """
+    x = np.asarray(feature, dtype=np.float64)
+    y = np.asarray(target, dtype=np.float64)
+    if len(x) != len(y):
+        raise ValueError("Feature and target must have the same length")
+    if folds < 2:
+        raise ValueError("There must be at least two folds")
+    if repeats < 1:
+        raise ValueError("The number of repeats must be a positive integer")
+    if len(x) < folds:
+        raise ValueError("There must be at least as many rows as folds")
+    if np.isnan(x).any() or np.isnan(y).any():
+        raise ValueError("Input data must not contain missing values")
+
+    # Center the values on their overall means to keep the sums small
+    x = x - x.mean()
+    y = y - y.mean()
+    products = [x, y, x * x, x * y, y * y]
+
+    rng = np.random.default_rng(seed)
+    r_squared, mse = [], []
+    for _ in range(repeats):
+        # Fold of each row, every fold with the same number of rows (±1)
+        codes = rng.permutation(len(x)) % folds
+        fold = np.array([np.bincount(codes, minlength=folds)]
+                        + [np.bincount(codes, values, folds) for values in products])
+        train = fold.sum(axis=1, keepdims=True) - fold
+        fold_r_squared, fold_mse = _test_scores(train, fold)
+        r_squared.append(fold_r_squared)
+        mse.append(fold_mse)
+
+    return CVScores(folds, repeats, np.concatenate(r_squared), np.concatenate(mse))
+
+
+def _test_scores(train, test):
+    """
+    Fit the line of each training set and score it on its test fold.
+
+    Parameters:
+        - train, test (numpy.ndarray): Number of rows and sums of x, y, x²,
+          xy and y² (one row each) of the training set and test fold of
+          every fold (one column each).
+
+    Returns:
+        - tuple: R² and MSE of each test fold.
+    """
+    n, sum_x, sum_y, sum_xx, sum_xy, _ = train
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_xx = sum_xx - sum_x * sum_x / n
+        # A constant feature can leave a rounding error instead of 0
+        slope = np.where(s_xx > 1e-12 * sum_xx, (sum_xy - sum_x * sum_y / n) / s_xx, np.nan)
+        intercept = (sum_y - slope * sum_x) / n
+
+        n, sum_x, sum_y, sum_xx, sum_xy, sum_yy = test
+        mean_x, mean_y = sum_x / n, sum_y / n
+        s_xx = sum_xx - sum_x * mean_x
+        s_xy = sum_xy - sum_x * mean_y
+        s_yy = np.maximum(sum_yy - sum_y * mean_y, 0.0)
+        # Residual sum of squares of the fold: the spread of the residuals
+        # around their mean plus the squared mean residual of every row
+        bias = mean_y - intercept - slope * mean_x
+        rss = np.maximum(s_yy - 2 * slope * s_xy + slope * slope * s_xx, 0.0) + n * bias * bias
+        r_squared = np.where(s_yy > 1e-12 * sum_yy, 1 - rss / s_yy, np.nan)
+    return r_squared, rss / n
+
+
+def summarize(scores):
+    """
+    Get the mean and standard deviation of the scores of a cross-validation.
+
+    Parameters:
+        - scores (CVScores): Scores of every fold.
+
+    Returns:
+        - dict: The summary with the keys CV_KEYS, as it is saved with a model.
+          NaN scores are left out; the statistics are NaN if all of them are.
+    """
+    def mean_std(values):
+        """Mean and sample standard deviation of the values that are not NaN."""
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return float("nan"), float("nan")
+        std = values.std(ddof=1) if len(values) > 1 else 0.0
+        return float(values.mean()), float(std)
+
+    r_squared_mean, r_squared_std = mean_std(scores.r_squared)
+    mse_mean, mse_std = mean_std(scores.mse)
+    return {
+        "folds": scores.folds,
+        "repeats": scores.repeats,
+        "r_squared_mean": r_squared_mean,
+        "r_squared_std": r_squared_std,
+        "mse_mean": mse_mean,
+        "mse_std": mse_std,
+    }
@@ -0,0 +1,398 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+
+# Default location and maximum size of the cache of opened datasets
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".modelmaker", "cache")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+# Size of each block read to compute the content hash of a file
+HASH_BLOCK_SIZE = 1024 ** 2
+META_FILE = "meta.json"
+
+# Identity of a file: if any field changes, the file is considered different
+Fingerprint = namedtuple("Fingerprint", ["path", "size", "mtime_ns", "content_hash"])
+
+
+def file_fingerprint(file_path):
+    """
+    Compute the fingerprint of a file.
+
+    The content hash covers the first, middle and last blocks of the file,
+    so it takes the same time for a file of 10 MB or 10 GB. Together with the
+    size and modification time it detects files that have been rewritten.
+
+    Parameters:
+        - file_path (str): Path to the file.
+
+    Returns:
+        - Fingerprint: Absolute path, size, modification time and content hash.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    return Fingerprint(path, stat.st_size, stat.st_mtime_ns, prefix_hash(path, stat.st_size))
+
+
+def prefix_hash(file_path, length):
+    """
+    Hash the first bytes of a file from its first, middle and last blocks.
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - length (int): Number of bytes covered, at most the size of the file.
+
+    Returns:
+        - str: Hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        if length <= 3 * HASH_BLOCK_SIZE:  # Small file, hash everything
+            digest.update(f.read(length))
+        else:
+            for offset in (0, length // 2, length - HASH_BLOCK_SIZE):
+                f.seek(offset)
+                digest.update(f.read(HASH_BLOCK_SIZE))
+    return digest.hexdigest()
+
+
+def fingerprint_key(fingerprint, table=None):
+    """
+    Get the name of the cache entry of a fingerprint.
+
+    Parameters:
+        - fingerprint (Fingerprint): Fingerprint of the source file.
+        - table (str, optional): Table of a database file stored in the entry.
+
+    Returns:
+        - str: Hexadecimal key identifying the entry.
+    """
+    identity = tuple(fingerprint) if table is None else (*fingerprint, table)
+    return hashlib.blake2b(repr(identity).encode(), digest_size=16).hexdigest()
+
+
+class DatasetCache:
+    """
+    Persistent cache of parsed datasets stored as one .npy file per column.
+
+    Numeric, boolean and datetime columns are memory-mapped when an entry is
+    loaded, so a cached dataset is opened without parsing and without copying
+    its values into the Python heap. Text columns are stored as integer codes
+    plus the list of their distinct values. The least recently used entries
+    are removed when the total size exceeds the configured limit.
+
+    Note that memory-mapped columns are read-only, so DataFrames loaded from
+    the cache must not be modified in place.
+
+    Parameters:
+        _cache_dir (str): Directory where the entries are stored.
+        _max_bytes (int): Maximum total size of the entries.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache, creating its directory if needed.
+
+        Parameters:
+            - cache_dir: Directory where the entries are stored.
+            - max_bytes: Maximum total size of the entries in bytes.
+        """
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @property
+    def size(self):
+        """Total size in bytes of the cached entries."""
+        return sum(entry["nbytes"] for entry in self.info())
+
+    def entry_dir(self, fingerprint, table=None):
+        """
+        Get the directory of the entry of a fingerprint (it may not exist).
+
+        Parameters:
+            - fingerprint (Fingerprint): Fingerprint of the source file.
+            - table (str, optional): Table of a database file.
+
+        Returns:
+            - str: Path of the entry directory.
+        """
+        return os.path.join(self._cache_dir, fingerprint_key(fingerprint, table))
+
+    def load(self, fingerprint, table=None):
+        """
+        Load a cached dataset.
+
+        Parameters:
+            - fingerprint (Fingerprint): Fingerprint of the source file.
+            - table (str, optional): Table of a database file. Each table of
+              a database is cached in its own entry.
+
+        Returns:
+            - pandas.DataFrame: The cached dataset, or None if it is not cached.
+        """
+        entry = self.entry_dir(fingerprint, table)
+        meta_path = os.path.join(entry, META_FILE)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            columns = {
+                column["name"]: self._load_column(entry, index, column, meta["rows"])
+                for index, column in enumerate(meta["columns"])
+            }
+        except (OSError, ValueError, KeyError):  # Missing or damaged entry
+            return None
+
+        self._touch(meta_path)
+        df = pd.DataFrame(columns, columns=list(columns), copy=False)
+        if meta.get("optimized"):
+            df.attrs["optimized"] = True
+        return df
+
+    def store(self, fingerprint, df, table=None, optimized=False):
+        """
+        Store a dataset in the cache and evict old entries if needed.
+
+        Datasets that cannot be represented in the columnar layout (a custom
+        index, non-unique or non-text column names, or values that are not
+        JSON serializable in a text column) or that are larger than the cache are
+        silently skipped.
+
+        Parameters:
+            - fingerprint (Fingerprint): Fingerprint of the source file.
+            - df (pandas.DataFrame): Dataset read from the source file.
+            - table (str, optional): Table of a database file the dataset was read from.
+            - optimized (bool, optional): True if the dtypes of df were already
+              narrowed by optimize_dtypes. The loaded dataset then has
+              attrs["optimized"] set, so it is not optimized again.
+
+        Returns:
+            - bool: True if the dataset has been stored.
+        """
+        if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 \
+                or df.index.step != 1 or not df.columns.is_unique \
+                or not all(isinstance(name, (str, int)) for name in df.columns):
+            return False
+
+        entry = self.entry_dir(fingerprint, table)
+        # Write in a temporary directory first so readers never see half an entry
+        tmp_entry = f"{entry}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+        os.makedirs(tmp_entry)
+
+        try:
+            columns = [self._store_column(tmp_entry, index, name, df[name])
+                       for index, name in enumerate(df.columns)]
+        except (TypeError, ValueError):
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            return False
+
+        nbytes = sum(os.path.getsize(os.path.join(tmp_entry, name))
+                     for name in os.listdir(tmp_entry))
+        if nbytes > self._max_bytes:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            return False
+
+        meta = {
+            "source": fingerprint.path,
+            "table": table,
+            "size": fingerprint.size,
+            "mtime_ns": fingerprint.mtime_ns,
+            "content_hash": fingerprint.content_hash,
+            "rows": len(df),
+            "columns": columns,
+            "nbytes": nbytes,
+            "optimized": optimized,
+        }
+        with open(os.path.join(tmp_entry, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        # Older versions of the same file will never be hit again
+        self._remove_stale(fingerprint)
+        try:
+            os.replace(tmp_entry, entry)
+        except OSError:  # Another process stored the same entry meanwhile
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+        self._touch(os.path.join(entry, META_FILE))
+
+        self.evict()
+        return True
+
+    def info(self):
+        """
+        Describe the cached entries, from the most to the least recently used.
+
+        Returns:
+            - list: One dict per entry with its key, source path, table (None
+              for files without tables), number of rows, column names, size in
+              bytes and last access time (epoch seconds).
+        """
+        entries = []
+        for key in os.listdir(self._cache_dir):
+            if key.endswith(".tmp"):  # Entry still being written
+                continue
+            meta_path = os.path.join(self._cache_dir, key, META_FILE)
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+                last_access = os.path.getmtime(meta_path)
+            except (OSError, ValueError):  # Temporary or damaged entry
+                continue
+            entries.append({
+                "key": key,
+                "source": meta["source"],
+                "table": meta.get("table"),
+                "rows": meta["rows"],
+                "columns": [column["name"] for column in meta["columns"]],
+                "nbytes": meta["nbytes"],
+                "last_access": last_access,
+            })
+
+        return sorted(entries, key=lambda entry: entry["last_access"], reverse=True)
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits its size limit.
+
+        Returns:
+            - int: Number of removed entries.
+        """
+        entries = self.info()
+        total = sum(entry["nbytes"] for entry in entries)
+        removed = 0
+        while entries and total > self._max_bytes:
+            entry = entries.pop()  # Least recently used
+            self._remove_entry(entry["key"])
+            total -= entry["nbytes"]
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove every entry of the cache."""
+        for key in os.listdir(self._cache_dir):
+            self._remove_entry(key)
+
+    @staticmethod
+    def _touch(meta_path):
+        """
+        Record an access to an entry in the modification time of its metadata.
+
+        The time is set explicitly with nanosecond precision, because the
+        clock used by the file system may be too coarse to order accesses.
+
+        Parameters:
+            - meta_path: Path of the metadata file of the entry.
+        """
+        now = time.time_ns()
+        os.utime(meta_path, ns=(now, now))
+
+    def _remove_entry(self, key):
+        """
+        Remove an entry directory.
+
+        Parameters:
+            - key: Name of the entry directory.
+        """
+        # On Windows, files still memory-mapped by a DataFrame cannot be deleted
+        shutil.rmtree(os.path.join(self._cache_dir, key), ignore_errors=True)
+
+    def _remove_stale(self, fingerprint):
+        """
+        Remove the entries created from other versions of a source file.
+
+        Entries of other tables of the same version are kept.
+
+        Parameters:
+            - fingerprint (Fingerprint): Fingerprint of the current version.
+        """
+        for entry in self.info():
+            if entry["source"] != fingerprint.path:
+                continue
+            meta_path = os.path.join(self._cache_dir, entry["key"], META_FILE)
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):  # Removed meanwhile
+                continue
+            if (meta["size"], meta["mtime_ns"], meta["content_hash"]) != \
+                    (fingerprint.size, fingerprint.mtime_ns, fingerprint.content_hash):
+                self._remove_entry(entry["key"])
+
+    @staticmethod
+    def _store_column(entry, index, name, column):
+        """
+        Write one column in an entry directory.
+
+        Parameters:
+            - entry: Entry directory.
+            - index: Position of the column, used to name its files.
+            - name: Name of the column.
+            - column (pandas.Series): Values of the column.
+
+        Returns:
+            - dict: Metadata needed to load the column again.
+
+        Raises:
+            - TypeError: If the values of a text column are not JSON serializable.
+        """
+        if column.dtype.kind in "biufcmM":  # Plain NumPy arrays
+            np.save(os.path.join(entry, f"{index}.npy"), column.to_numpy())
+            return {"name": name, "kind": "array"}
+
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes = column.cat.codes.to_numpy()
+            values = column.cat.categories.tolist()
+            kind = "category"
+        else:
+            codes, values = pd.factorize(column)
+            values = values.tolist()
+            kind = "codes"
+
+        # Only values that survive a JSON round trip can be restored exactly
+        if not all(isinstance(value, (str, int, float, bool)) for value in values):
+            raise TypeError("The column values cannot be stored in the cache.")
+
+        np.save(os.path.join(entry, f"{index}.npy"), codes)
+        return {"name": name, "kind": kind, "values": values}
+
+    @staticmethod
+    def _load_column(entry, index, column, rows):
+        """
+        Read one column from an entry directory.
+
+        Parameters:
+            - entry: Entry directory.
+            - index: Position of the column.
+            - column (dict): Metadata of the column.
+            - rows: Number of rows of the dataset.
+
+        Returns:
+            - numpy.ndarray or pandas.Categorical: Values of the column.
+        """
+        # Plain ndarray view of the mapped file, the data is not copied
+        values = np.load(os.path.join(entry, f"{index}.npy"),
+                         mmap_mode="r").view(np.ndarray)
+        if len(values) != rows:
+            raise ValueError("Damaged cache entry.")
+
+        if column["kind"] == "array":
+            return values
+        if column["kind"] == "category":
+            return pd.Categorical.from_codes(values, categories=column["values"])
+
+        # Code -1 marks a missing value, it selects the trailing NaN
+        uniques = np.array(column["values"] + [np.nan], dtype=object)
+        return uniques[values]
+
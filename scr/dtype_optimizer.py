@@ -0,0 +1,129 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+
+# Text columns with at most this ratio of distinct values become categories
+CATEGORY_RATIO = 0.5
+
+# Memory footprint of a DataFrame before and after optimizing its dtypes
+MemoryReport = namedtuple("MemoryReport", ["before", "after"])
+
+
+def memory_footprint(df):
+    """
+    Get the memory used by a DataFrame, including the Python strings it holds.
+
+    Parameters:
+        - df (pandas.DataFrame): DataFrame to measure.
+
+    Returns:
+        - int: Size in bytes.
+    """
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _downcast_integers(column):
+    """
+    Store an integer column in the narrowest integer dtype that holds its values.
+
+    Parameters:
+        - column (pandas.Series): Integer column.
+
+    Returns:
+        - pandas.Series: Column with an int8/16/32/64 or uint8/16/32/64 dtype.
+    """
+    if column.empty:
+        return column
+    # Unsigned types reach twice as far for columns without negative values
+    return pd.to_numeric(column, downcast="unsigned" if column.min() >= 0 else "integer")
+
+
+def _downcast_floats(column):
+    """
+    Store a float column in a narrower dtype if no value changes.
+
+    Columns of whole numbers without missing values become integers, and
+    columns whose values are exactly representable in float32 become float32.
+
+    Parameters:
+        - column (pandas.Series): Float column.
+
+    Returns:
+        - pandas.Series: Column with the narrowest lossless dtype.
+    """
+    values = column.to_numpy()
+    finite = np.isfinite(values)
+    if finite.all() and np.array_equal(values, np.trunc(values)) \
+            and np.abs(values).max(initial=0) < 2 ** 53:
+        return _downcast_integers(column.astype(np.int64))
+
+    narrow = values.astype(np.float32)
+    # NaN and infinity survive the round trip, so they are compared as equal
+    if np.array_equal(narrow.astype(values.dtype), values, equal_nan=True):
+        return pd.Series(narrow, index=column.index, name=column.name)
+    return column
+
+
+def _to_category(column, category_ratio):
+    """
+    Store a text column as a category if it has few distinct values.
+
+    Parameters:
+        - column (pandas.Series): Column with object dtype.
+        - category_ratio (float): Maximum ratio of distinct values to rows.
+
+    Returns:
+        - pandas.Series: Categorical column, or the same column if it has
+          too many distinct values or values that are not strings.
+    """
+    values = column.dropna()
+    if values.empty or not all(isinstance(value, str) for value in values):
+        return column
+    if values.nunique() > category_ratio * len(column):
+        return column
+    return column.astype("category")
+
+
+def optimize_dtypes(df, category_ratio=CATEGORY_RATIO):
+    """
+    Reduce the memory of a DataFrame by storing each column in a narrower dtype.
+
+    Integer columns get the narrowest integer dtype that holds their range,
+    float columns are only narrowed when every value is kept exactly, and
+    text columns with repeated values become categories. Other columns
+    (booleans, dates, categories) are left as they are.
+
+    Parameters:
+        - df (pandas.DataFrame): DataFrame to optimize, it is not modified.
+        - category_ratio (float, optional): Maximum ratio of distinct values to
+          rows of a text column to convert it into a category.
+
+    Returns:
+        - tuple: The optimized DataFrame and a MemoryReport with its size in
+          bytes before and after the conversion. Columns that are not
+          narrowed keep their values without copying them (e.g. memory-mapped
+          columns of the dataset cache stay mapped), and if no column is
+          narrowed the DataFrame is a shallow copy of df.
+    """
+    before = memory_footprint(df)
+    columns = {}
+    changed = False
+    for name in df.columns:
+        column = df[name]
+        if isinstance(column.dtype, np.dtype):  # Extension dtypes are kept
+            if column.dtype.kind in "iu":
+                column = _downcast_integers(column)
+            elif column.dtype.kind == "f":
+                column = _downcast_floats(column)
+            elif column.dtype.kind == "O":
+                column = _to_category(column, category_ratio)
+        changed = changed or column.dtype != df[name].dtype
+        columns[name] = column
+
+    if not changed:
+        return df.copy(deep=False), MemoryReport(before, before)
+
+    optimized = pd.DataFrame(columns, index=df.index, columns=df.columns, copy=False)
+    optimized.attrs = dict(df.attrs)
+    return optimized, MemoryReport(before, memory_footprint(optimized))
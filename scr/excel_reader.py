@@ -0,0 +1,347 @@
+import os
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from exceptions import EmptyDataError
+
+
+# Rows of a worksheet converted into a DataFrame at a time
+EXCEL_BATCH_SIZE = 10_000
+# Approximate memory of a cell while its row is buffered (Python objects)
+EXCEL_CELL_BYTES = 64
+# Extensions that can be streamed with openpyxl, .xls needs xlrd
+STREAMING_EXTENSIONS = ('.xlsx',)
+
+
+def _open_workbook(file_path):
+    """
+    Open a workbook in read-only mode.
+
+    In read-only mode the cells are parsed while the rows are iterated, so
+    memory does not grow with the size of the sheet, and sheets that are not
+    iterated are never parsed.
+
+    Parameters:
+        - file_path (str): Path to the .xlsx file.
+
+    Returns:
+        - openpyxl.Workbook: Read-only workbook, it must be closed after use.
+    """
+    # data_only returns the cached results of formulas instead of the formulas
+    return load_workbook(file_path, read_only=True, data_only=True)
+
+
+def _get_sheet(workbook, sheet):
+    """
+    Get a worksheet by name or position.
+
+    Parameters:
+        - workbook (openpyxl.Workbook): Workbook.
+        - sheet (str or int): Name or position of the sheet, None for the first one.
+
+    Returns:
+        - openpyxl worksheet.
+
+    Raises:
+        - EmptyDataError: If the sheet does not exist.
+    """
+    try:
+        if sheet is None:
+            return workbook.worksheets[0]
+        if isinstance(sheet, int):
+            return workbook.worksheets[sheet]
+        return workbook[sheet]
+    except (IndexError, KeyError):
+        raise EmptyDataError(f"The Excel file does not contain the sheet '{sheet}'.")
+
+
+def _column_names(header):
+    """
+    Name the columns of a sheet from its header row, as pandas does.
+
+    Empty cells are named "Unnamed: <position>" and repeated names get a
+    ".1", ".2"... suffix.
+
+    Parameters:
+        - header (tuple): Values of the first row.
+
+    Returns:
+        - list: Column names.
+    """
+    names = []
+    seen = {}
+    for position, value in enumerate(header):
+        name = f"Unnamed: {position}" if value is None else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _trim_header(header):
+    """
+    Remove the empty cells at the end of the header row.
+
+    Parameters:
+        - header (tuple): Values of the first row.
+
+    Returns:
+        - tuple: Header without trailing empty cells.
+    """
+    end = len(header)
+    while end and header[end - 1] is None:
+        end -= 1
+    return header[:end]
+
+
+def _to_frame(rows, columns, dtypes):
+    """
+    Convert a batch of rows into a DataFrame with typed columns.
+
+    A column without values in the batch would get the object dtype, so it
+    gets the dtype the column had in previous batches instead (float64 if the
+    column was integer, to hold NaN), and the batches can be concatenated
+    without changing the dtype of the column.
+
+    Parameters:
+        - rows (list): Tuples of cell values.
+        - columns (list): Column names.
+        - dtypes (dict): Known dtype of each column, updated with this batch.
+
+    Returns:
+        - pandas.DataFrame: Batch with one typed array per column.
+    """
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    for column in columns:
+        series = df[column]
+        if not series.isna().all():
+            dtypes.setdefault(column, series.dtype)
+            continue
+        dtype = dtypes.get(column, np.dtype("float64"))
+        if dtype.kind in "iub":  # Integers and booleans cannot hold NaN
+            dtype = np.dtype("float64") if dtype.kind != "b" else np.dtype(object)
+        df[column] = series.astype(dtype)
+    return df
+
+
+def iter_excel(file_path, sheet=None, batch_size=EXCEL_BATCH_SIZE, columns=None):
+    """
+    Read a sheet of an .xlsx file as a sequence of DataFrames.
+
+    The rows are streamed from the file and converted into typed columns
+    (int64, float64, bool, datetime64 or object) every batch_size rows, so
+    memory stays constant whatever the size of the sheet. The first row is
+    the header and, as in pandas.read_excel, empty rows at the end of the
+    sheet are dropped.
+
+    Parameters:
+        - file_path (str): Path to the .xlsx file.
+        - sheet (str or int, optional): Name or position of the sheet. By
+          default, the first sheet.
+        - batch_size (int, optional): Number of rows of each DataFrame.
+        - columns (list, optional): Columns to convert. By default every column.
+
+    Returns:
+        - generator: Generator of pandas.DataFrame batches with the same columns.
+
+    Raises:
+        - ValueError: If batch_size is not positive.
+        - EmptyDataError: If the sheet does not exist or is empty.
+    """
+    if batch_size <= 0:
+        raise ValueError("The batch size must be a positive integer.")
+
+    workbook = _open_workbook(file_path)
+    try:
+        rows = _get_sheet(workbook, sheet).iter_rows(values_only=True)
+        header = _trim_header(next(rows, ()))
+    except EmptyDataError:
+        workbook.close()
+        raise
+    if not header:
+        workbook.close()
+        raise EmptyDataError("The Excel file does not contain data.")
+
+    names = _column_names(header)
+    if columns is None:
+        columns = names
+    positions = [names.index(column) for column in columns]
+
+    def batches():
+        dtypes = {}  # Dtype of each column in the first batch where it has values
+        try:
+            buffer = []
+            blank_rows = 0  # Only kept if a row with values comes after them
+            empty_row = (None,) * len(positions)
+            for row in rows:
+                if all(value is None for value in row):
+                    blank_rows += 1
+                    continue
+                buffer.extend([empty_row] * blank_rows)
+                blank_rows = 0
+                # Rows may be shorter than the header if their last cells are empty
+                buffer.append(tuple(row[i] if i < len(row) else None for i in positions))
+                while len(buffer) >= batch_size:
+                    yield _to_frame(buffer[:batch_size], columns, dtypes)
+                    buffer = buffer[batch_size:]
+            if buffer:
+                yield _to_frame(buffer, columns, dtypes)
+        finally:
+            workbook.close()
+
+    return batches()
+
+
+def read_excel(file_path, sheet=None, columns=None):
+    """
+    Read a sheet of an Excel file into a DataFrame.
+
+    .xlsx files are streamed in batches with openpyxl, .xls files are read
+    with pandas.
+
+    Parameters:
+        - file_path (str): Path to the Excel file.
+        - sheet (str or int, optional): Name or position of the sheet. By
+          default, the first sheet.
+        - columns (list, optional): Columns to read. By default every column.
+
+    Returns:
+        - pandas.DataFrame: Data of the sheet (empty if it only has a header).
+
+    Raises:
+        - EmptyDataError: If the sheet does not exist or is empty.
+    """
+    if os.path.splitext(file_path)[1].lower() not in STREAMING_EXTENSIONS:
+        try:
+            df = pd.read_excel(file_path, sheet_name=0 if sheet is None else sheet,
+                               usecols=columns)
+        except (ValueError, IndexError):  # The sheet does not exist
+            if sheet is None:
+                raise
+            raise EmptyDataError(f"The Excel file does not contain the sheet '{sheet}'.")
+        return df if columns is None else df[columns]
+
+    batches = list(iter_excel(file_path, sheet=sheet, columns=columns))
+    if not batches:  # Only the header
+        names = columns if columns is not None else \
+            excel_columns(file_path, sheet)
+        return pd.DataFrame(columns=names)
+    if len(batches) == 1:
+        return batches[0]
+    return pd.concat(batches, ignore_index=True)
+
+
+def excel_columns(file_path, sheet=None):
+    """
+    Get the column names of a sheet of an .xlsx file from its header row.
+
+    Parameters:
+        - file_path (str): Path to the .xlsx file.
+        - sheet (str or int, optional): Name or position of the sheet.
+
+    Returns:
+        - list: Column names.
+
+    Raises:
+        - EmptyDataError: If the sheet does not exist.
+    """
+    workbook = _open_workbook(file_path)
+    try:
+        rows = _get_sheet(workbook, sheet).iter_rows(values_only=True)
+        return _column_names(_trim_header(next(rows, ())))
+    finally:
+        workbook.close()
+
+
+class ExcelCatalog:
+    """
+    Description of the sheets of an .xlsx workbook.
+
+    It offers the same interface as SQLiteCatalog, so the sheets can be
+    chosen with the same dialog as the tables of a database. The workbook is
+    opened once, and only the header row and the dimensions of each sheet
+    are read.
+
+    Parameters:
+        _file_path (str): Path to the .xlsx file.
+        _names (list): Sheet names, in workbook order.
+        _columns (dict): Columns of each sheet.
+        _rows (dict): Row count estimate of each sheet.
+    """
+
+    def __init__(self, file_path):
+        """
+        Initialize the catalog with the names, columns and dimensions of the sheets.
+
+        Parameters:
+            - file_path: Path to the .xlsx file.
+        """
+        self._file_path = file_path
+        self._columns = {}
+        self._rows = {}
+        workbook = _open_workbook(file_path)
+        try:
+            self._names = list(workbook.sheetnames)
+            for worksheet in workbook.worksheets:
+                # Only the first row of the sheet is parsed
+                header = next(worksheet.iter_rows(values_only=True), ())
+                self._columns[worksheet.title] = _column_names(_trim_header(header))
+                # max_row comes from the stored dimensions, None if there are none
+                max_row = worksheet.max_row
+                self._rows[worksheet.title] = None if max_row is None else max(max_row - 1, 0)
+        finally:
+            workbook.close()
+
+    @property
+    def names(self):
+        """Names of the sheets, in workbook order."""
+        return list(self._names)
+
+    def kind(self, name):
+        """
+        Get the kind of an object of the workbook.
+
+        Parameters:
+            - name: Name of the sheet.
+
+        Returns:
+            - str: Always "sheet".
+        """
+        return "sheet"
+
+    def default_table(self):
+        """
+        Get the sheet opened when the user does not choose one.
+
+        Returns:
+            - str: First sheet.
+        """
+        return self._names[0] if self._names else None
+
+    def columns(self, name):
+        """
+        Get the columns of a sheet from its header row.
+
+        Parameters:
+            - name: Name of the sheet.
+
+        Returns:
+            - list: Column names.
+        """
+        return list(self._columns[name])
+
+    def estimated_rows(self, name):
+        """
+        Estimate the number of data rows of a sheet from its stored dimensions.
+
+        Parameters:
+            - name: Name of the sheet.
+
+        Returns:
+            - int: Estimated number of rows, or None if the file does not
+              store the dimensions of the sheet.
+        """
+        return self._rows[name]
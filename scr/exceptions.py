@@ -4,10 +4,22 @@ class FileNotSelectedError(Exception):
     """Exception for non selected files."""
     pass
 
+class TableNotSelectedError(Exception):
+    """Exception for databases opened without selecting a table."""
+    pass
+
 class FileFormatError(Exception):
     """Exception for invalid file formats."""
     pass
 
 class EmptyDataError(Exception):
     """Exception for empty files or non-existent tables."""
-    pass
\ No newline at end of file
+    pass
+
+class ColumnNotFoundError(Exception):
+    """Exception for columns that do not exist in a file."""
+    pass
+
+class SchemaMismatchError(Exception):
+    """Exception for files of a dataset that do not share the same columns."""
+    pass
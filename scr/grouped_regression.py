@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+from ols import BLOCK_SIZE, Moments, merge_moment_arrays
+
+
+# Columns of the table returned by fit_grouped, besides the group key index
+GROUPED_COLUMNS = ["rows", "slope", "intercept", "r_squared", "mse"]
+
+
+def fit_grouped(feature, target, groups, block_size=BLOCK_SIZE):
+    """
+    Fit a simple linear regression for each group of rows in one pass.
+
+    The rows are numbered by group once, and the statistics of every group
+    are accumulated with segmented sums (numpy.bincount) over blocks of
+    rows, centered on the means of each group in the block, so the cost
+    does not depend on the number of groups.
+
+    Rows with a missing feature, target or group are not used. Groups whose
+    feature is constant or that have fewer than two rows get NaN
+    coefficients.
+
+    Parameters:
+        - feature (pd.Series): The independent variable.
+        - target (pd.Series): The dependent variable, aligned with feature.
+        - groups (pd.Series): Group key of each row (e.g. a store or region column).
+        - block_size (int, optional): Rows processed at a time.
+
+    Returns:
+        - pandas.DataFrame: One row per group, indexed by the sorted group keys,
+          with the columns GROUPED_COLUMNS.
+
+    Raises:
+        - TypeError: If the feature or target are not numeric.
+        - ValueError: If the lengths don't match or no row can be used.
+    """
+    if not len(feature) == len(target) == len(groups):
+        raise ValueError("Feature, target and groups must have the same length")
+    if not np.issubdtype(feature.dtype, np.number) or not np.issubdtype(target.dtype, np.number):
+        raise TypeError("Feature and target must contain only numeric values")
+
+    codes, keys = pd.factorize(groups, sort=True)  # Missing keys get code -1
+    x = feature.to_numpy(dtype=np.float64, na_value=np.nan)
+    y = target.to_numpy(dtype=np.float64, na_value=np.nan)
+    used = (codes >= 0) & ~np.isnan(x) & ~np.isnan(y)
+    if not used.any():
+        raise ValueError("Input data cannot be empty")
+    codes, x, y = codes[used], x[used], y[used]
+
+    count = len(keys)
+    zeros = np.zeros(count)
+    total = Moments(np.zeros(count, dtype=np.int64), zeros, zeros, zeros, zeros, zeros)
+    for start in range(0, len(x), block_size):
+        block = slice(start, start + block_size)
+        total = merge_moment_arrays(total, _group_moments(codes[block], x[block], y[block], count))
+
+    return _solve_groups(total, pd.Index(keys, name=groups.name))
+
+
+def _group_moments(codes, x, y, count):
+    """
+    Compute the statistics of each group in a block of rows.
+
+    Parameters:
+        - codes (numpy.ndarray): Group number of each row.
+        - x, y (numpy.ndarray): Feature and target of each row.
+        - count (int): Number of groups.
+
+    Returns:
+        - Moments: Arrays with the statistics of each group (0 for groups
+          without rows in the block).
+    """
+    n = np.bincount(codes, minlength=count)
+    safe_n = np.maximum(n, 1)  # Groups without rows have zero sums
+    mean_x = np.bincount(codes, x, count) / safe_n
+    mean_y = np.bincount(codes, y, count) / safe_n
+    dx = x - mean_x[codes]
+    dy = y - mean_y[codes]
+    return Moments(n, mean_x, mean_y,
+                   np.bincount(codes, dx * dx, count),
+                   np.bincount(codes, dx * dy, count),
+                   np.bincount(codes, dy * dy, count))
+
+
+def _solve_groups(moments, keys):
+    """
+    Get the least squares line of each group from its statistics.
+
+    Parameters:
+        - moments (Moments): Arrays with the statistics of each group.
+        - keys (pandas.Index): Key of each group.
+
+    Returns:
+        - pandas.DataFrame: Coefficients and metrics of each group.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fitted = (moments.n >= 2) & (moments.s_xx > 0)
+        slope = np.where(fitted, moments.s_xy / moments.s_xx, np.nan)
+        intercept = moments.mean_y - slope * moments.mean_x
+        # Residual sum of squares, clipped because of rounding errors
+        rss = np.maximum(moments.s_yy - slope * moments.s_xy, 0.0)
+        r_squared = np.where(moments.s_yy > 0, 1 - rss / moments.s_yy, 0.0)
+        r_squared = np.where(fitted, r_squared, np.nan)
+        mse = np.where(fitted, rss / moments.n, np.nan)
+
+    return pd.DataFrame({
+        "rows": moments.n,
+        "slope": slope,
+        "intercept": intercept,
+        "r_squared": r_squared,
+        "mse": mse,
+    }, index=keys, columns=GROUPED_COLUMNS)
@@ -1,12 +1,16 @@
 import tkinter as tk
-from tkinter import messagebox, filedialog, ttk
-from open_files import open_file, EmptyDataError
+from tkinter import messagebox, filedialog, simpledialog, ttk
+from open_files import open_file, open_preview, EmptyDataError, SAMPLE_EXTENSIONS
 from scroll_table import ScrollTable
 from menu_manager import MenuManager
 from model_handler import open_model
 import model_interface
-from progress_bar import run_with_loading
-from exceptions import FileNotSelectedError, FileFormatError
+from progress_bar import run_with_loading, BackgroundTask
+from exceptions import FileNotSelectedError, FileFormatError, TableNotSelectedError
+from dataset_cache import DatasetCache
+from sqlite_reader import close_connections
+from table_picker import ask_table
+from line_index import LineIndex
 from os import path
 
 
@@ -25,6 +29,8 @@ class ScrollApp:
     """
 
     MAX_PATH_LENGTH = 50  # Maximum length for displayed file paths
+    SAMPLE_PROMPT_BYTES = 1024 ** 3  # Files from this size offer to load a sample
+    DEFAULT_SAMPLE_ROWS = 1_000_000  # Sample size suggested for large files
 
     def __init__(self, window: tk.Tk):
         """
@@ -34,7 +40,11 @@ class ScrollApp:
             - window: The main Tkinter window object
         """
         self._file = None
+        self._cache = DatasetCache()  # Parsed datasets, reused between openings
         self._file_path = tk.StringVar()  # Stores the current file path for display
+        self._status = tk.StringVar()  # Progress of the dataset loaded in the background
+        self._full_load = None  # BackgroundTask loading the full dataset
+        self._index_load = None  # BackgroundTask building the line index of a CSV file
         self._window = window
         # Setting up the main window and application structure
         self._setup_window()
@@ -138,6 +148,15 @@ class ScrollApp:
         separator = tk.Frame(self._main_frame, bg='#6677B8', height=3)
         separator.pack(fill=tk.X, side='top')
 
+        # Loading status, only shown while a dataset is loaded in the background
+        self._status_label = tk.Label(
+            self._main_frame,
+            textvariable=self._status,
+            fg='#6677B8',
+            bg="#d0d7f2",
+            font=("DejaVu Sans Mono", 11)
+        )
+
     def _create_path_label(self, parent):
         """
         Create 'PATH' label in header.
@@ -230,8 +249,9 @@ class ScrollApp:
         """
         # Define allowed file types
         filetypes = (
-            ("Compatible files (CSV, EXCEL, SQL)",
-             "*.csv *.xlsx *.xls *.db *.sqlite"),
+            ("Compatible files (CSV, EXCEL, SQL, PARQUET, ARROW, compressed CSV)",
+             "*.csv *.xlsx *.xls *.db *.sqlite *.parquet *.feather *.arrow "
+             "*.csv.gz *.csv.bz2 *.csv.xz *.zip"),
         )
 
         # Open file dialog
@@ -241,9 +261,14 @@ class ScrollApp:
         )
 
         try:
-            # Wrap file loading process in a function for progress bar
-            def full_load_process():
-                self._data = open_file(self._file)  # Read file data
+            # Databases and workbooks with several tables ask which one to open first
+            table = ask_table(self._window, self._file) if self._file else None
+            sample = self._ask_sample_size(self._file)
+
+            # Wrap preview loading process in a function for progress bar
+            def preview_process():
+                # Only the first rows are read, the rest is loaded afterwards
+                self._data = open_preview(self._file, table=table)
                 self._app.data = self._data  # Update app data
                 self._app.prepare_data_display()  # Prepare UI
                 return self._data
@@ -251,16 +276,18 @@ class ScrollApp:
             # Display loading progress while processing file
             run_with_loading(
                 self._window,
-                full_load_process,
+                preview_process,
                 "Reading and opening file..."
             )
 
-            self._update_interface_with_file()
+            self._file_path.set(self._shorten_route_text(self._file))
 
-            # Display the processed data in the UI
-            self._app.show_prepared_data()
+            # Display the first rows in the UI, the model waits for the full data
+            self._app.show_prepared_data(loading=True)
+            self._start_full_load(self._file, table, sample)
+            self._start_line_index(self._file)
 
-        except FileNotSelectedError as e:
+        except (FileNotSelectedError, TableNotSelectedError) as e:
             messagebox.showwarning("Warning", e)
         except FileNotFoundError as e:
             messagebox.showerror("Error", str(e))
@@ -272,12 +299,167 @@ class ScrollApp:
             messagebox.showerror(
                 "Error", f"The file could not be loaded: {str(e)}")
 
+    def _start_line_index(self, file_path):
+        """
+        Build the line index of a plain CSV file in the background, so its
+        rows can be browsed straight from the file while it is fully loaded.
+        The index is stored with the dataset cache.
+
+        Parameters:
+            - file_path: Path to the file
+        """
+        if self._index_load is not None:  # Index of a file opened before
+            self._index_load.cancel()
+            self._index_load = None
+        if not (path.isfile(file_path) and file_path.endswith('.csv')):
+            return
+
+        self._index_load = BackgroundTask(
+            self._window,
+            lambda progress: LineIndex.load_or_build(file_path,
+                                                     cache_dir=self._cache.cache_dir),
+            on_done=self._on_line_index_done,
+            on_error=self._on_line_index_error
+        )
+
+    def _on_line_index_done(self, index):
+        """
+        Show the rows of the file through its line index, unless the full
+        dataset is already shown.
+
+        Parameters:
+            - index: LineIndex of the file
+        """
+        self._index_load = None
+        if self._full_load is not None:
+            self._app.show_line_index(index)
+
+    def _on_line_index_error(self, error):
+        """
+        Keep the preview if the file cannot be indexed (e.g. it cannot be
+        read), the full load reports the errors of the file.
+
+        Parameters:
+            - error: Exception raised while indexing
+        """
+        self._index_load = None
+
+    def _ask_sample_size(self, file_path):
+        """
+        Offer to load a random sample of a large file instead of every row.
+
+        Parameters:
+            - file_path: Path to the file
+
+        Returns:
+            - int: Number of rows of the sample, or None to load every row
+        """
+        if not (file_path and path.isfile(file_path)
+                and file_path.endswith(SAMPLE_EXTENSIONS)
+                and path.getsize(file_path) >= self.SAMPLE_PROMPT_BYTES):
+            return None
+        return simpledialog.askinteger(
+            "Large file",
+            f"This file takes {path.getsize(file_path) / 1024 ** 3:.1f} GB.\n\n"
+            "Enter the number of rows of a random sample to explore it faster,\n"
+            "or press Cancel to load every row.",
+            parent=self._window,
+            initialvalue=self.DEFAULT_SAMPLE_ROWS,
+            minvalue=2
+        )
+
+    def _start_full_load(self, file_path, table, sample=None):
+        """
+        Load the full dataset in the background while its first rows are shown.
+
+        Parameters:
+            - file_path: Path to the file
+            - table: Table or sheet to read, or None for the first one
+            - sample: Number of rows of a random sample, or None for every row
+        """
+        self._cancel_full_load()  # A file opened before is no longer needed
+        self._show_status("Loading the full dataset...")
+
+        def full_load_process(progress):
+            return open_file(file_path, cache=self._cache, table=table,
+                             optimize=True, progress=progress, sample=sample)
+
+        self._full_load = BackgroundTask(
+            self._window,
+            full_load_process,
+            on_done=self._on_full_load_done,
+            on_error=self._on_full_load_error,
+            on_progress=lambda fraction: self._show_status(
+                f"Loading {fraction:.0%} complete...")
+        )
+
+    def _cancel_full_load(self):
+        """Discard the dataset being loaded in the background, if any."""
+        if self._full_load is not None:
+            self._full_load.cancel()
+            self._full_load = None
+        self._show_status(None)
+
+    def _on_full_load_done(self, data):
+        """
+        Replace the preview with the full dataset.
+
+        Parameters:
+            - data: DataFrame with every row of the file
+        """
+        self._full_load = None
+        self._show_status(None)
+        self._data = data
+        self._app.finish_loading(data)
+        sample = data.attrs.get("sample")
+        if sample is not None:  # Remind that the rows shown are not every row
+            self._show_status(f"Random sample of {sample.rows:,} of "
+                              f"{sample.total_rows:,} rows")
+        self._update_interface_with_file()
+
+    def _on_full_load_error(self, error):
+        """
+        Report that the full dataset could not be loaded. The preview is kept,
+        but the model cannot be created from it.
+
+        Parameters:
+            - error: Exception raised while loading
+        """
+        self._full_load = None
+        self._show_status(None)
+        messagebox.showerror(
+            "Error", f"The file could not be fully loaded: {str(error)}")
+
+    def _show_status(self, text):
+        """
+        Show a loading status under the header.
+
+        Parameters:
+            - text: Text to show, or None to hide the status
+        """
+        if text is None:
+            self._status_label.pack_forget()
+            return
+        self._status.set(text)
+        if not self._status_label.winfo_ismapped():
+            self._status_label.pack(fill=tk.X, side='top', before=self._my_canvas)
+
     def _update_interface_with_file(self):
         """Update interface after successful file load."""
         text = self._shorten_route_text(self._file)
         self._file_path.set(text)
 
-        messagebox.showinfo("Success", "The file has been read correctly.")
+        message = "The file has been read correctly."
+        # Only datasets have a memory report, models are dictionaries
+        report = getattr(self._data, "attrs", {}).get("memory_report")
+        if report is not None and report.after < report.before:
+            message += (f"\nMemory used: {report.before / 1024 ** 2:.1f} MB -> "
+                        f"{report.after / 1024 ** 2:.1f} MB")
+        sample = getattr(self._data, "attrs", {}).get("sample")
+        if sample is not None:
+            message += (f"\nRandom sample of {sample.rows:,} rows out of "
+                        f"{sample.total_rows:,}.")
+        messagebox.showinfo("Success", message)
 
     def search_model(self, event=None):
         """
@@ -309,6 +491,9 @@ class ScrollApp:
                 "Loading and processing model..."
             )
 
+            # The dataset being loaded is replaced by the model
+            self._cancel_full_load()
+
             # Update the interface and show success message
             self._update_interface_with_file()
 
@@ -361,6 +546,7 @@ class ScrollApp:
 
     def on_closing(self):
         """Handle window closing event."""
+        close_connections()  # Release the opened databases
         self._window.quit()
         self._window.destroy()
 
@@ -437,8 +623,14 @@ class App:
         self._table = ScrollTable(self._table_frame)
         self._table.create_from_df(self._data)  # Fill with new data
 
-    def show_prepared_data(self):
-        """Show the prepared data in the interface."""
+    def show_prepared_data(self, loading=False):
+        """
+        Show the prepared data in the interface.
+
+        Parameters:
+            - loading: True if the data is a preview and the full dataset is
+              still being loaded, so the model cannot be created yet
+        """
         # Show the table
         self._table.show()
 
@@ -446,7 +638,34 @@ class App:
         self._create_separator()
 
         # Setup column selection
-        self._setup_column_selection()
+        self._setup_column_selection(loading)
+
+    def show_line_index(self, index):
+        """
+        Show the rows of the CSV file straight from disk instead of the
+        preview, while the full dataset is loaded.
+
+        Parameters:
+            - index: LineIndex of the file
+        """
+        self._table.create_from_line_index(index)
+
+    def finish_loading(self, data):
+        """
+        Replace the preview with the full dataset, keeping the column selection.
+
+        Parameters:
+            - data: DataFrame with every row of the file
+        """
+        preview_columns = list(self._table.numeric_columns())
+        self._data = data
+        if list(data.select_dtypes(include=['number']).columns) != preview_columns:
+            # The first rows did not reveal the type of every column
+            self.prepare_data_display()
+            self.show_prepared_data()
+            return
+        self._table.create_from_df(data)
+        self._menu.set_full_data(data)
 
     def _create_table_frame(self):
         """Create frame for data table."""
@@ -470,12 +689,15 @@ class App:
         separator = tk.Frame(self._frame, bg='#6677B8', height=3)
         separator.pack(fill=tk.X, side=tk.TOP, anchor="center")
 
-    def _setup_column_selection(self):
+    def _setup_column_selection(self, loading=False):
         """
         Set up column selection interface for data analysis.
 
         Creates frames for column selection and chart display,
         initializes MenuManager for handling column operations.
+
+        Parameters:
+            - loading: True while the full dataset is being loaded
         """
         # Get columns that contain numeric data
         numeric_columns = self._table.numeric_columns()
@@ -499,7 +721,8 @@ class App:
             column_selector_frame,
             numeric_columns,
             self._data,
-            chart_frame
+            chart_frame,
+            loading
         )
         self._processed_data = self._menu.new_df
 
@@ -527,16 +750,7 @@ class App:
 
     def show_prepared_model(self):
         """Display prepared model information."""
-        model_interface.show(
-            self._info_frame,
-            self._model_info["feature_name"],
-            self._model_info["target_name"],
-            self._model_info["intercept"],
-            self._model_info["slope"],
-            self._model_info["r_squared"],
-            self._model_info["mse"],
-            self._model_info["description"]
-        )
+        model_interface.show_model_data(self._info_frame, self._model_info)
 
         self._scroll_window.update()
 
@@ -547,8 +761,29 @@ class App:
         Returns:
             - dict: Dictionary containing model parameters and statistics
                    Including feature_name, target_name, intercept, slope,
-                   r_squared, mse, and description
+                   r_squared, mse, description and cv, or for multiple
+                   regressions feature_names, coefficients and adjusted_r_squared
+                   instead of feature_name and slope
         """
+        if "coefficients" in self.data:
+            return {
+                # Independent variable names
+                "feature_names": self.data.get("feature_names"),
+                # Dependent variable name
+                "target_name": self.data.get("target_name"),
+                # Intercept of the regression hyperplane
+                "intercept": self.data.get("intercept"),
+                # Coefficient of each independent variable
+                "coefficients": self.data.get("coefficients"),
+                # R-squared value (model fit), also adjusted for the number of features
+                "r_squared": self.data.get("r_squared"),
+                "adjusted_r_squared": self.data.get("adjusted_r_squared"),
+                # Mean Squared Error
+                "mse": self.data.get("mse"),
+                # User-provided description
+                "description": self.data.get("description")
+            }
+
         # Retrieve all model parameters and statistics from data dictionary
         return {
             # Independent variable name
@@ -564,7 +799,9 @@ class App:
             # Mean Squared Error
             "mse": self.data.get("mse"),
             # User-provided description
-            "description": self.data.get("description")
+            "description": self.data.get("description"),
+            # Cross-validated scores, None if the model was not cross-validated
+            "cv": self.data.get("cv")
         }
 
     def _show_model_info(self, model_info):
@@ -578,16 +815,7 @@ class App:
         info_frame.pack(side=tk.TOP, fill=tk.X, anchor="center")
         info_frame.pack_propagate(False)
 
-        model_interface.show(
-            info_frame,
-            model_info["feature_name"],
-            model_info["target_name"],
-            model_info["intercept"],
-            model_info["slope"],
-            model_info["r_squared"],
-            model_info["mse"],
-            model_info["description"]
-        )
+        model_interface.show_model_data(info_frame, model_info)
 
         self._scroll_window.update()
 
@@ -0,0 +1,239 @@
+import io
+import os
+from collections import namedtuple
+import pandas as pd
+from dataset_cache import prefix_hash
+from exceptions import FileFormatError, EmptyDataError
+
+
+# Result of a reload: the dataset, the rows added to it and whether the
+# whole file had to be read again
+ReloadResult = namedtuple("ReloadResult", ["data", "new_rows", "full"])
+
+# Bytes read at a time when looking for the last newline of the file
+SCAN_BLOCK_SIZE = 1024 ** 2
+
+
+class _ByteRange(io.RawIOBase):
+    """
+    Read-only stream of some bytes followed by a byte range of a file, so
+    pandas can parse the range with a header without copying it in memory.
+
+    Parameters:
+        _prefix (bytes): Bytes returned before the range (e.g. a header line).
+        _file (file): File opened in binary mode, positioned at the range.
+        _remaining (int): Bytes of the range not read yet.
+    """
+
+    def __init__(self, prefix, f, start, end):
+        """
+        Initialize the stream at the beginning of the prefix.
+
+        Parameters:
+            - prefix (bytes): Bytes returned first.
+            - f (file): File opened in binary mode.
+            - start (int): First byte of the range.
+            - end (int): Byte after the last one of the range.
+        """
+        super().__init__()
+        self._prefix = prefix
+        self._file = f
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        """Copy the next bytes into a buffer, returning how many there were (0 at the end)."""
+        if self._prefix:
+            size = min(len(buffer), len(self._prefix))
+            buffer[:size] = self._prefix[:size]
+            self._prefix = self._prefix[size:]
+            return size
+        size = min(len(buffer), self._remaining)
+        data = self._file.read(size)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
+class IncrementalCSVReader:
+    """
+    Reader of a CSV file that only parses the rows appended since the last read.
+
+    It remembers the byte offset where the last read stopped and a hash of
+    the bytes before it. If the file has grown and those bytes have not
+    changed, only the new tail is parsed and appended to the dataset, so a
+    reload takes time proportional to the new rows. If the file has been
+    truncated or rewritten, it is read again from the start.
+
+    A last line without a final newline may still be being written, so it
+    is parsed again on the next reload. Quoted fields with newlines are not
+    supported.
+
+    Parameters:
+        _file_path (str): Path to the CSV file.
+        _columns (list): Columns to read, None for every column.
+        _data (pandas.DataFrame): Rows read so far.
+        _header (bytes): Header line of the file, prepended to each new tail.
+        _offset (int): Byte where the rows that have not been read completely start.
+        _size (int): Size of the file at the last read.
+        _prefix_hash (str): Hash of the first _offset bytes.
+        _partial_rows (int): Rows at the end of _data parsed from a line
+            without a final newline.
+    """
+
+    def __init__(self, file_path, columns=None):
+        """
+        Initialize a reader, no data is read until read is called.
+
+        Parameters:
+            - file_path (str): Path to the CSV file.
+            - columns (list, optional): Columns to read. By default every column.
+
+        Raises:
+            - FileFormatError: If the file is not a plain (uncompressed) CSV file.
+        """
+        if os.path.splitext(str(file_path))[1] != '.csv':
+            raise FileFormatError("Incremental reloads are only available for plain CSV files.")
+        self._file_path = file_path
+        self._columns = columns
+        self._data = None
+        self._header = b""
+        self._offset = 0
+        self._size = 0
+        self._prefix_hash = None
+        self._partial_rows = 0
+
+    @property
+    def data(self):
+        return self._data
+
+    def read(self):
+        """
+        Read the whole file.
+
+        Returns:
+            - pandas.DataFrame: Every row of the file.
+
+        Raises:
+            - EmptyDataError: If the file is empty.
+        """
+        with open(self._file_path, "rb") as f:
+            header = f.readline()
+            if not header.strip():
+                raise EmptyDataError("The CSV file does not contain data.")
+            self._header = header if header.endswith(b"\n") else header + b"\n"
+            self._offset = len(header)
+            self._data = None
+            self._partial_rows = 0
+            self._read_tail(f)
+        return self._data
+
+    def reload(self):
+        """
+        Bring the dataset up to date with the file.
+
+        Returns:
+            - ReloadResult: The dataset, the number of rows added to it and
+              whether the whole file was read again.
+
+        Raises:
+            - EmptyDataError: If the file is empty.
+        """
+        if self._data is None or self._has_changed():
+            data = self.read()
+            return ReloadResult(data, len(data), True)
+
+        if os.path.getsize(self._file_path) == self._size:  # Nothing appended
+            return ReloadResult(self._data, 0, False)
+
+        rows = len(self._data) - self._partial_rows
+        with open(self._file_path, "rb") as f:
+            self._read_tail(f)
+        return ReloadResult(self._data, len(self._data) - rows, False)
+
+    def _has_changed(self):
+        """
+        Check if the bytes already read are no longer the same.
+
+        Returns:
+            - bool: True if the file is shorter than when it was read, or its
+              beginning has been rewritten.
+        """
+        if os.path.getsize(self._file_path) < self._size:  # Truncated
+            return True
+        return prefix_hash(self._file_path, self._offset) != self._prefix_hash
+
+    def _read_tail(self, f):
+        """
+        Parse the rows from the stored offset to the end of the file and
+        append them to the dataset.
+
+        The rows are parsed straight from the file, so only the dataset and
+        the last line (if it has no final newline) are held in memory.
+
+        Parameters:
+            - f (file): The CSV file, opened in binary mode.
+        """
+        size = os.fstat(f.fileno()).st_size  # Bytes appended later wait for the next reload
+        # The last complete line ends at the last newline
+        complete = self._last_line_end(f, self._offset, size)
+        f.seek(complete)
+        unfinished = f.read(size - complete)
+
+        new_rows = self._parse(_ByteRange(self._header, f, self._offset, size))
+        # The rows of an unfinished line are replaced by the ones parsed now
+        kept = None if self._data is None else \
+            self._data.iloc[:len(self._data) - self._partial_rows]
+        if kept is None or kept.empty:
+            self._data = new_rows
+        elif not new_rows.empty:
+            self._data = pd.concat([kept, new_rows], ignore_index=True)
+        else:
+            self._data = kept
+
+        self._partial_rows = 0 if not unfinished else \
+            len(self._parse(io.BytesIO(self._header + unfinished)))
+        self._offset = complete
+        self._size = size
+        self._prefix_hash = prefix_hash(self._file_path, self._offset)
+
+    @staticmethod
+    def _last_line_end(f, start, end):
+        """
+        Find where the last complete line of a byte range ends, reading the
+        file backwards from the end of the range.
+
+        Parameters:
+            - f (file): File opened in binary mode.
+            - start (int): First byte of the range.
+            - end (int): Byte after the last one of the range.
+
+        Returns:
+            - int: Byte after the last newline of the range, start if it has none.
+        """
+        position = end
+        while position > start:
+            block_start = max(start, position - SCAN_BLOCK_SIZE)
+            f.seek(block_start)
+            block = f.read(position - block_start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                return block_start + newline + 1
+            position = block_start
+        return start
+
+    def _parse(self, stream):
+        """
+        Parse lines of the file with its header.
+
+        Parameters:
+            - stream (file): Binary stream of the header followed by lines of the file.
+
+        Returns:
+            - pandas.DataFrame: Their rows.
+        """
+        df = pd.read_csv(stream, usecols=self._columns)
+        return df if self._columns is None else df[self._columns]
@@ -0,0 +1,249 @@
+import io
+import os
+import numpy as np
+import pandas as pd
+from dataset_cache import DEFAULT_CACHE_DIR, file_fingerprint, fingerprint_key
+from exceptions import FileFormatError, EmptyDataError
+
+
+# Bytes read at a time when scanning a file for newlines
+SCAN_BLOCK_SIZE = 16 * 1024 ** 2
+# A byte offset is kept every this many lines, so the index of a file with
+# 200 million rows takes 1.6 MB instead of 1.6 GB
+INDEX_STRIDE = 1024
+# Subdirectory of the cache directory where the indexes are stored
+LINE_INDEX_DIR = "line_index"
+
+NEWLINE = ord("\n")
+
+
+class LineIndex:
+    """
+    Byte offsets of the lines of a CSV file, for random access to its rows.
+
+    The file is scanned once for newline bytes with NumPy, keeping the offset
+    of every stride-th line. Reading rows N..N+k then seeks to the closest
+    indexed line and only scans forward less than stride lines, so the cost
+    does not depend on the size of the file.
+
+    Lines are physical lines: files with quoted fields that contain newlines
+    are not supported.
+
+    Parameters:
+        _file_path (str): Path to the CSV file.
+        _offsets (numpy.ndarray): Byte offset of lines 0, stride, 2·stride...
+        _lines (int): Number of lines of the file, including the header.
+        _stride (int): Number of lines between two indexed offsets.
+    """
+
+    def __init__(self, file_path, offsets, lines, stride):
+        """
+        Initialize an index from its offsets (use build or load_or_build).
+
+        Parameters:
+            - file_path: Path to the CSV file.
+            - offsets: Byte offsets of every stride-th line.
+            - lines: Number of lines of the file.
+            - stride: Number of lines between two offsets.
+        """
+        self._file_path = file_path
+        self._offsets = offsets
+        self._lines = lines
+        self._stride = stride
+
+    @classmethod
+    def build(cls, file_path, stride=INDEX_STRIDE, block_size=SCAN_BLOCK_SIZE):
+        """
+        Scan a CSV file and build its line index.
+
+        Parameters:
+            - file_path (str): Path to the CSV file.
+            - stride (int, optional): Number of lines between indexed offsets.
+              A stride of 1 indexes every line.
+            - block_size (int, optional): Bytes read at a time.
+
+        Returns:
+            - LineIndex: Index of the file.
+
+        Raises:
+            - FileFormatError: If the file is not a plain (uncompressed) CSV file.
+            - EmptyDataError: If the file is empty.
+        """
+        if os.path.splitext(str(file_path))[1] != '.csv':
+            raise FileFormatError("Line indexes are only available for plain CSV files.")
+
+        offsets = [np.zeros(1, dtype=np.int64)]  # Line 0 starts at byte 0
+        newlines = 0
+        last_byte = None
+        with open(file_path, "rb") as f:
+            position = 0
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    break
+                found = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == NEWLINE)
+                # Line number of the line that starts after each newline
+                starts = newlines + 1 + np.arange(len(found), dtype=np.int64)
+                offsets.append(found[starts % stride == 0] + position + 1)
+                newlines += len(found)
+                position += len(block)
+                last_byte = block[-1]
+
+        if last_byte is None:
+            raise EmptyDataError("The CSV file does not contain data.")
+
+        # A last line without a final newline is a line too
+        lines = newlines + (last_byte != NEWLINE)
+        offsets = np.concatenate(offsets).astype(np.int64)
+        if len(offsets) and offsets[-1] >= position:  # Start of a line that does not exist
+            offsets = offsets[:-1]
+        return cls(file_path, offsets, lines, stride)
+
+    @classmethod
+    def load_or_build(cls, file_path, cache_dir=DEFAULT_CACHE_DIR, stride=INDEX_STRIDE):
+        """
+        Load the index of a file from the cache directory, or build and store it.
+
+        Indexes are stored next to the dataset cache, named after the file
+        fingerprint, so an index is rebuilt when the file changes.
+
+        Parameters:
+            - file_path (str): Path to the CSV file.
+            - cache_dir (str, optional): Cache directory.
+            - stride (int, optional): Stride used when the index is built.
+
+        Returns:
+            - LineIndex: Index of the file.
+        """
+        fingerprint = file_fingerprint(file_path)
+        directory = os.path.join(cache_dir, LINE_INDEX_DIR)
+        index_path = os.path.join(directory, f"{fingerprint_key(fingerprint)}.npz")
+        try:
+            with np.load(index_path) as stored:
+                return cls(file_path, stored["offsets"], int(stored["lines"]),
+                           int(stored["stride"]))
+        except (OSError, KeyError, ValueError):  # Not indexed yet, or damaged
+            pass
+
+        index = cls.build(file_path, stride=stride)
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{index_path}.{os.getpid()}.tmp.npz"
+        np.savez(tmp_path, offsets=index._offsets, lines=index._lines, stride=index._stride)
+        os.replace(tmp_path, index_path)
+        return index
+
+    @property
+    def rows(self):
+        """Number of data rows (lines after the header)."""
+        return max(self._lines - 1, 0)
+
+    @property
+    def stride(self):
+        return self._stride
+
+    def line_offset(self, line, f=None):
+        """
+        Get the byte offset where a line starts.
+
+        Parameters:
+            - line (int): Line number (0 is the header). The number of lines
+              gives the end of the file.
+            - f (file, optional): File opened in binary mode, to avoid opening it again.
+
+        Returns:
+            - int: Byte offset.
+        """
+        if not 0 <= line <= self._lines:
+            raise IndexError(f"Line {line} is out of range.")
+        if line == self._lines:
+            return os.path.getsize(self._file_path)
+
+        checkpoint, remaining = divmod(line, self._stride)
+        offset = int(self._offsets[checkpoint])
+        if remaining == 0:
+            return offset
+
+        if f is None:
+            with open(self._file_path, "rb") as f:
+                return self._scan_forward(f, offset, remaining)
+        return self._scan_forward(f, offset, remaining)
+
+    @staticmethod
+    def _scan_forward(f, offset, lines):
+        """
+        Find the start of the line that is some lines after a given offset.
+
+        Parameters:
+            - f (file): File opened in binary mode.
+            - offset (int): Start of a line.
+            - lines (int): Number of lines to skip.
+
+        Returns:
+            - int: Byte offset of the line.
+        """
+        f.seek(offset)
+        while True:
+            block = f.read(1024 ** 2)
+            if not block:
+                return offset
+            found = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == NEWLINE)
+            if len(found) >= lines:
+                return offset + int(found[lines - 1]) + 1
+            lines -= len(found)
+            offset += len(block)
+
+    def read_rows(self, start, stop, **read_csv_options):
+        """
+        Read the data rows start..stop-1 straight from the file.
+
+        Parameters:
+            - start (int): First row (0 is the first row after the header).
+            - stop (int): Row after the last one, clipped to the number of rows.
+            - **read_csv_options: Extra arguments of pandas.read_csv (e.g. usecols).
+
+        Returns:
+            - pandas.DataFrame: The rows, with an index starting at start.
+        """
+        start = max(0, start)
+        stop = min(stop, self.rows)
+        with open(self._file_path, "rb") as f:
+            header_end = self.line_offset(1, f)  # It may move the file position
+            f.seek(0)
+            header = f.read(header_end)
+            if stop <= start:
+                body = b""
+            else:
+                begin = self.line_offset(start + 1, f)
+                end = self.line_offset(stop + 1, f)
+                f.seek(begin)
+                body = f.read(end - begin)
+
+        if header and not header.endswith(b"\n"):  # Header without rows
+            header += b"\n"
+        df = pd.read_csv(io.BytesIO(header + body), **read_csv_options)
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def split(self, parts):
+        """
+        Split the rows into ranges that start on exact row boundaries.
+
+        The ranges are aligned on indexed lines, so finding their byte
+        offsets does not scan the file.
+
+        Parameters:
+            - parts (int): Maximum number of ranges.
+
+        Returns:
+            - list: (first row, row after the last, first byte, byte after the
+              last) of each range, in order.
+        """
+        if self.rows == 0:
+            return []
+        # Boundaries in lines: the first data line, then multiples of the stride
+        step = -(-self.rows // max(parts, 1))
+        step = -(-step // self._stride) * self._stride
+        boundaries = [1, *range(step, self._lines, step), self._lines]
+        boundaries = sorted(set(boundaries))
+        return [(first - 1, last - 1, self.line_offset(first), self.line_offset(last))
+                for first, last in zip(boundaries[:-1], boundaries[1:])]
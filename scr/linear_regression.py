@@ -1,15 +1,19 @@
-import statsmodels.api as sm
 import numpy as np
 import pandas as pd
+from cross_validation import CV_FOLDS, cross_validate, summarize
+from ols import (ENGINES, DEFAULT_ENGINE, Moments, compute_moments, merge_moments, solve,
+                 compute_cross_moments, empty_cross_moments, merge_cross_moments,
+                 solve_multiple)
+from nan_handler import NaNHandler
 
 
 class LinearRegression:
     """
     A class to perform simple linear regression analysis.
 
-    This class implements a simple linear regression model using statsmodels,
-    calculating the relationship between a single feature (independent variable)
-    and a target (dependent variable).
+    This class implements a simple linear regression model with the closed-form
+    least squares solution (see ols.py), calculating the relationship between a
+    single feature (independent variable) and a target (dependent variable).
 
     Parameters:
 
@@ -22,9 +26,14 @@ class LinearRegression:
         _slope (float): Slope of the regression line
         _r_squared (float): R-squared value of the model
         _mse (float): Mean squared error of the model
+        _sample (SampleInfo): Size of the sample the model was fitted on and of
+            the dataset it was drawn from, None if it was fitted on every row
+        _cv (dict): Summary of the last cross-validation (see
+            cross_validation.summarize), None if it has not been run
     """
 
-    def __init__(self, feature: pd.Series, target: pd.Series):
+    def __init__(self, feature: pd.Series, target: pd.Series, sample=None,
+                 engine=DEFAULT_ENGINE):
         """
         Initialize the LinearRegression model with feature and target data.
 
@@ -32,10 +41,16 @@ class LinearRegression:
 
             - feature: The independent variable series
             - target: The dependent variable series
+            - sample: SampleInfo if the rows are a random sample of the dataset.
+              By default it is taken from feature.attrs["sample"], which
+              open_file sets when it reads a sample.
+            - engine: Name of the fitting engine in ols.ENGINES. "numpy" by
+              default, "statsmodels" is the reference implementation.
 
         Raises:
             - TypeError: If the input data contains non-numeric values
-            - ValueError: If the input data is empty or lengths don't match
+            - ValueError: If the input data is empty, lengths don't match,
+              the feature is constant or the engine does not exist
         """
         # Validate input data
         if len(feature) != len(target):
@@ -49,19 +64,126 @@ class LinearRegression:
             raise TypeError(
                 "Feature and target must contain only numeric values")
 
-        # Store the data series from selected columns
+        # Store the data series from selected columns, fitting always in float64
+        # even if the columns were loaded with narrower dtypes (e.g. int8, float32)
         self._feature_name = feature.name
-        self._feature = feature
+        self._feature = feature.astype(np.float64, copy=False)
         self._target_name = target.name
-        self._target = target
+        self._target = target.astype(np.float64, copy=False)
 
         self._predictions = None
         self._intercept = None
         self._slope = None
         self._r_squared = None
         self._mse = None
+        self._sample = sample if sample is not None else feature.attrs.get("sample")
+        self._cv = None
 
-        self.create_regression(self._feature, self._target)
+        self.create_regression(self._feature, self._target, engine)
+
+    @classmethod
+    def from_chunks(cls, chunks, feature_name, target_name, method=None, constant_value=None):
+        """
+        Create a LinearRegression model from an iterable of DataFrame chunks.
+
+        Each chunk is reduced to its statistics (ols.Moments) after its missing
+        values are handled, so only one chunk is in memory at a time. The model
+        has no predictions, they can be computed with predict.
+
+        Parameters:
+            - chunks: Iterable of DataFrames (e.g. from open_files.iter_csv_chunks)
+            - feature_name: Name of the feature column
+            - target_name: Name of the target column
+            - method: NaNHandler method applied to the missing values, None if
+              there are none. "Fill with Mean" uses the means of every row,
+              computed in the same pass. "Fill with Median" is not supported.
+            - constant_value: Value used by the method "Fill with a Constant Value"
+
+        Returns:
+            - LinearRegression: Model fitted on all the rows of the chunks
+
+        Raises:
+            - TypeError: If the columns contain non-numeric values
+            - ValueError: If there are no rows, the feature is constant or the
+              method cannot be applied chunk by chunk
+            - ConstantValueError: If method is "Fill with a Constant Value" and
+              no constant value is provided
+        """
+        if method == "Fill with Mean":
+            moments = _mean_filled_moments(chunks, feature_name, target_name)
+            return cls.from_moments(feature_name, target_name, moments)
+
+        if method is not None:
+            columns = list(dict.fromkeys([feature_name, target_name]))  # No duplicates
+            chunks = NaNHandler(chunks, columns).preprocess(method, constant_value)
+
+        model = IncrementalLinearRegression(feature_name, target_name)
+        for chunk in chunks:
+            model.partial_fit(chunk[feature_name], chunk[target_name])
+        return model.finalize()
+
+    @classmethod
+    def from_sums(cls, feature_name, target_name, n, sum_x, sum_y, sum_xx, sum_xy, sum_yy):
+        """
+        Create a LinearRegression model from the sufficient statistics of the data.
+
+        The coefficients, R² and MSE of a simple linear regression only depend on
+        these sums, so the rows do not need to be available (e.g. when they are
+        aggregated inside a database). The model has no predictions.
+
+        Parameters:
+            - feature_name: Name of the feature
+            - target_name: Name of the target
+            - n: Number of observations
+            - sum_x, sum_y: Sums of the feature and target values
+            - sum_xx, sum_xy, sum_yy: Sums of the products x·x, x·y and y·y
+
+        Returns:
+            - LinearRegression: Model with the same parameters as if it had been
+              fitted on the rows
+
+        Raises:
+            - ValueError: If there are no observations or the feature is constant
+        """
+        if n == 0:
+            raise ValueError("Input data cannot be empty")
+
+        # Centered sums of squares and cross products
+        moments = Moments(n, sum_x / n, sum_y / n,
+                          sum_xx - sum_x * sum_x / n,
+                          sum_xy - sum_x * sum_y / n,
+                          sum_yy - sum_y * sum_y / n)
+        return cls.from_moments(feature_name, target_name, moments)
+
+    @classmethod
+    def from_moments(cls, feature_name, target_name, moments):
+        """
+        Create a LinearRegression model from the means and centered sums of the data.
+
+        Parameters:
+            - feature_name: Name of the feature
+            - target_name: Name of the target
+            - moments: ols.Moments of the rows
+
+        Returns:
+            - LinearRegression: Model with the same parameters as if it had been
+              fitted on the rows, without predictions
+
+        Raises:
+            - ValueError: If there are no observations or the feature is constant
+        """
+        result = solve(moments)
+
+        model = cls.__new__(cls)
+        model._feature_name = feature_name
+        model._feature = None
+        model._target_name = target_name
+        model._target = None
+        model._predictions = None
+        model._sample = None
+        model._cv = None
+        model._intercept, model._slope, model._r_squared, model._mse = result
+        return model
 
     @property
     def feature_name(self):
@@ -73,7 +195,20 @@ class LinearRegression:
 
     @property
     def predictions(self):
-        return np.array(self._predictions)
+        # Models created from sufficient statistics have no predictions
+        return None if self._predictions is None else np.array(self._predictions)
+
+    def predict(self, feature):
+        """
+        Predict the target of new rows.
+
+        Parameters:
+            - feature: Values of the feature (pd.Series or array)
+
+        Returns:
+            - np.array: Predicted target of each row
+        """
+        return self._intercept + self._slope * np.asarray(feature, dtype=np.float64)
 
     @property
     def intercept(self):
@@ -91,40 +226,404 @@ class LinearRegression:
     def mse(self):
         return self._mse
 
-    def create_regression(self, feature, target):
+    @property
+    def sample(self):
+        return self._sample
+
+    @property
+    def trained_on_sample(self):
+        """True if the model was fitted on a random sample of the dataset."""
+        return self._sample is not None
+
+    @property
+    def cv(self):
+        return self._cv
+
+    def cross_validate(self, folds=CV_FOLDS, repeats=1, seed=None):
+        """
+        Estimate the out-of-sample R² and MSE of the model with (repeated)
+        k-fold cross-validation (see cross_validation.cross_validate).
+
+        The summary of the scores is kept in the cv property, and saved with
+        the model.
+
+        Parameters:
+            - folds: Number of folds
+            - repeats: Number of random splits into folds
+            - seed: Seed of the splits
+
+        Returns:
+            - CVScores: R² and MSE of each test fold
+
+        Raises:
+            - ValueError: If the model has no rows (it was created from
+              sufficient statistics) or there are fewer rows than folds
+        """
+        if self._feature is None:
+            raise ValueError("The model has no rows to cross-validate")
+
+        scores = cross_validate(self._feature, self._target, folds, repeats, seed)
+        self._cv = summarize(scores)
+        return scores
+
+    def create_regression(self, feature, target, engine=DEFAULT_ENGINE):
         """
         Create and fit the linear regression model.
 
         This method performs the following steps:
-        1. Adds a constant term to the feature for the intercept
-        2. Fits the OLS model
-        3. Extracts model parameters and statistics
-        4. Generates predictions
-        5. Calculates mean squared error
+        1. Fits the least squares line with the chosen engine
+        2. Stores the model parameters and statistics
+        3. Generates predictions
 
         Parameters:
 
             - feature: The independent variable
             - target: The dependent variable
+            - engine: Name of the fitting engine in ols.ENGINES
+
+        Raises:
+            - ValueError: If the engine does not exist or the feature is constant
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown regression engine: {engine}")
+
+        (self._intercept, self._slope,
+         self._r_squared, self._mse) = ENGINES[engine](feature, target)
+
+        # Generate model predictions as a numpy array
+        self._predictions = self._intercept + self._slope * np.asarray(feature, dtype=np.float64)
+
+
+class IncrementalLinearRegression:
+    """
+    A simple linear regression fitted one chunk of rows at a time.
+
+    Its state is the number of rows, the means and the centered sums of
+    squares and cross products seen so far (ols.Moments), which takes the
+    same memory whatever the size of the data. States built on different
+    parts of a dataset (chunks of a file, files, processes) can be merged,
+    and give the same model as one fit on every row.
+
+    Parameters:
+        _feature_name (str): Name of the feature/independent variable
+        _target_name (str): Name of the target/dependent variable
+        _moments (Moments): Statistics of the rows seen so far
+    """
+
+    def __init__(self, feature_name, target_name):
+        """
+        Initialize a model that has not seen any row.
+
+        Parameters:
+            - feature_name: Name of the feature
+            - target_name: Name of the target
+        """
+        self._feature_name = feature_name
+        self._target_name = target_name
+        self._moments = Moments(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    @property
+    def feature_name(self):
+        return self._feature_name
+
+    @property
+    def target_name(self):
+        return self._target_name
+
+    @property
+    def moments(self):
+        return self._moments
+
+    @property
+    def n(self):
+        """Number of rows seen so far."""
+        return self._moments.n
+
+    def partial_fit(self, feature_chunk, target_chunk):
+        """
+        Add a chunk of rows to the model.
+
+        Parameters:
+            - feature_chunk: Values of the feature (pd.Series or array)
+            - target_chunk: Values of the target, as many as feature_chunk
+
+        Returns:
+            - IncrementalLinearRegression: The model itself
+
+        Raises:
+            - TypeError: If the chunk contains non-numeric values
+            - ValueError: If the lengths don't match
+        """
+        feature_chunk = np.asarray(feature_chunk)
+        target_chunk = np.asarray(target_chunk)
+        if len(feature_chunk) != len(target_chunk):
+            raise ValueError("Feature and target must have the same length")
+        if len(feature_chunk) == 0:  # Nothing to add
+            return self
+
+        # Check for non-numeric data
+        if not np.issubdtype(feature_chunk.dtype, np.number) or \
+                not np.issubdtype(target_chunk.dtype, np.number):
+            raise TypeError(
+                "Feature and target must contain only numeric values")
+
+        self._moments = merge_moments(self._moments,
+                                      compute_moments(feature_chunk, target_chunk))
+        return self
+
+    def merge(self, other):
+        """
+        Add the rows seen by another model, fitted on different rows.
+
+        Parameters:
+            - other: IncrementalLinearRegression of the same columns
+
+        Returns:
+            - IncrementalLinearRegression: The model itself
+
+        Raises:
+            - ValueError: If the models are not of the same columns
         """
-        # Add a column of ones for the intercept term
-        feature_with_intercept = sm.add_constant(feature)
+        if (other.feature_name, other.target_name) != (self._feature_name, self._target_name):
+            raise ValueError("Only models of the same feature and target can be merged")
+        self._moments = merge_moments(self._moments, other.moments)
+        return self
+
+    def finalize(self):
+        """
+        Get the regression of every row seen so far.
+
+        Returns:
+            - LinearRegression: Model without predictions
+
+        Raises:
+            - ValueError: If no rows have been seen or the feature is constant
+        """
+        return LinearRegression.from_moments(self._feature_name, self._target_name,
+                                             self._moments)
+
+
+def _mean_filled_moments(chunks, feature_name, target_name):
+    """
+    Compute in one pass the statistics of two columns whose missing values
+    are filled with the mean of their column.
 
-        # Train the model
-        model_training = sm.OLS(target, feature_with_intercept)
-        modelofin = model_training.fit()
+    A filled value equals the mean, so it adds nothing to the centered sums:
+    s_xx and s_yy are those of the values of each column that are present,
+    and s_xy that of the rows where both are, shifted from the means of
+    those rows to the means of each column.
 
-        # Get intercept and slope coefficients
-        self._intercept, self._slope = modelofin.params
+    Parameters:
+        - chunks: Iterable of DataFrames with both columns
+        - feature_name: Name of the feature column
+        - target_name: Name of the target column
+
+    Returns:
+        - Moments: Statistics of every row once the missing values are filled
+
+    Raises:
+        - TypeError: If the columns contain non-numeric values
+    """
+    empty = Moments(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    n, feature, target, both = 0, empty, empty, empty
+    for chunk in chunks:
+        x = chunk[feature_name]
+        y = chunk[target_name]
+        if not np.issubdtype(x.dtype, np.number) or not np.issubdtype(y.dtype, np.number):
+            raise TypeError(
+                "Feature and target must contain only numeric values")
+
+        x = x.to_numpy(dtype=np.float64)
+        y = y.to_numpy(dtype=np.float64)
+        has_x = ~np.isnan(x)
+        has_y = ~np.isnan(y)
+        has_both = has_x & has_y
+        n += len(x)
+        # The statistics of one column are those of the column with itself
+        if has_x.any():
+            feature = merge_moments(feature, compute_moments(x[has_x], x[has_x]))
+        if has_y.any():
+            target = merge_moments(target, compute_moments(y[has_y], y[has_y]))
+        if has_both.any():
+            both = merge_moments(both, compute_moments(x[has_both], y[has_both]))
 
-        # Handle constant target case
-        if np.var(target) == 0:
-            self._r_squared = 0.0
-        else:
-            self._r_squared = modelofin.rsquared
+    s_xy = both.s_xy + both.n * (both.mean_x - feature.mean_x) * (both.mean_y - target.mean_x)
+    return Moments(n, feature.mean_x, target.mean_x, feature.s_xx, s_xy, target.s_xx)
 
-        # Generate model predictions and convert to numpy array
-        self._predictions = np.array(modelofin.predict(feature_with_intercept))
 
-        # Calculate MSE (Mean Squared Error)
-        self._mse = np.mean((np.array(target) - self._predictions) ** 2)
+class MultipleLinearRegression:
+    """
+    A class to perform multiple linear regression analysis.
+
+    The coefficients are the least squares solution of several features
+    (independent variables) and a target (dependent variable), computed from
+    the centered Gram matrix of the data (see ols.solve_multiple). Only that
+    matrix is needed, so the model can also be fitted on chunks of rows.
+
+    Parameters:
+        _feature_names (list): Names of the features/independent variables
+        _target_name (str): Name of the target/dependent variable
+        _predictions (np.array): Model predictions, None if fitted on chunks
+        _intercept (float): Intercept of the regression hyperplane
+        _coefficients (np.array): Coefficient of each feature
+        _r_squared (float): R-squared value of the model
+        _adjusted_r_squared (float): R-squared adjusted for the number of features
+        _mse (float): Mean squared error of the model
+        _sample (SampleInfo): Size of the sample the model was fitted on and of
+            the dataset it was drawn from, None if it was fitted on every row
+    """
+
+    def __init__(self, features: pd.DataFrame, target: pd.Series, sample=None):
+        """
+        Initialize the MultipleLinearRegression model with feature and target data.
+
+        Parameters:
+            - features: DataFrame with a column per independent variable
+            - target: The dependent variable series
+            - sample: SampleInfo if the rows are a random sample of the dataset.
+              By default it is taken from features.attrs["sample"].
+
+        Raises:
+            - TypeError: If the input data contains non-numeric values
+            - ValueError: If the input data is empty, lengths don't match or
+              the features are constant or collinear
+        """
+        # Validate input data
+        if len(features) != len(target):
+            raise ValueError("Features and target must have the same length")
+
+        if len(features) == 0 or features.shape[1] == 0:
+            raise ValueError("Input data cannot be empty")
+
+        # Check for non-numeric data
+        if not all(np.issubdtype(dtype, np.number) for dtype in features.dtypes) or \
+                not np.issubdtype(target.dtype, np.number):
+            raise TypeError(
+                "Features and target must contain only numeric values")
+
+        X = features.to_numpy(dtype=np.float64)
+        self._init_fit(list(features.columns), target.name,
+                       compute_cross_moments(X, target.to_numpy(dtype=np.float64)))
+        self._predictions = self._intercept + X @ self._coefficients
+        self._sample = sample if sample is not None else features.attrs.get("sample")
+
+    def _init_fit(self, feature_names, target_name, moments):
+        """
+        Store the names and the fitted parameters.
+
+        Parameters:
+            - feature_names: Names of the features
+            - target_name: Name of the target
+            - moments: ols.CrossMoments of the rows
+        """
+        self._feature_names = feature_names
+        self._target_name = target_name
+        (self._intercept, self._coefficients, self._r_squared,
+         self._adjusted_r_squared, self._mse) = solve_multiple(moments)
+        self._predictions = None
+        self._sample = None
+
+    @classmethod
+    def from_cross_moments(cls, feature_names, target_name, moments):
+        """
+        Create a MultipleLinearRegression model from the statistics of the data.
+
+        Parameters:
+            - feature_names: Names of the features
+            - target_name: Name of the target
+            - moments: ols.CrossMoments of the rows
+
+        Returns:
+            - MultipleLinearRegression: Model without predictions
+
+        Raises:
+            - ValueError: If there are no observations or the features are
+              constant or collinear
+        """
+        model = cls.__new__(cls)
+        model._init_fit(list(feature_names), target_name, moments)
+        return model
+
+    @classmethod
+    def from_chunks(cls, chunks, feature_names, target_name):
+        """
+        Create a MultipleLinearRegression model from an iterable of DataFrame chunks.
+
+        Each chunk is reduced to its Gram matrix, so only one chunk is in
+        memory at a time. The model has no predictions.
+
+        Parameters:
+            - chunks: Iterable of DataFrames (e.g. from open_files.iter_csv_chunks)
+            - feature_names: Names of the feature columns
+            - target_name: Name of the target column
+
+        Returns:
+            - MultipleLinearRegression: Model fitted on all the rows of the chunks
+
+        Raises:
+            - ValueError: If there are no rows
+        """
+        feature_names = list(feature_names)
+        moments = empty_cross_moments(len(feature_names))
+        for chunk in chunks:
+            moments = merge_cross_moments(
+                moments, compute_cross_moments(chunk[feature_names], chunk[target_name]))
+        return cls.from_cross_moments(feature_names, target_name, moments)
+
+    @property
+    def feature_names(self):
+        return list(self._feature_names)
+
+    @property
+    def target_name(self):
+        return self._target_name
+
+    @property
+    def predictions(self):
+        # Models created from chunks have no predictions
+        return None if self._predictions is None else np.array(self._predictions)
+
+    @property
+    def intercept(self):
+        return self._intercept
+
+    @property
+    def coefficients(self):
+        return np.array(self._coefficients)
+
+    @property
+    def r_squared(self):
+        return self._r_squared
+
+    @property
+    def adjusted_r_squared(self):
+        return self._adjusted_r_squared
+
+    @property
+    def mse(self):
+        return self._mse
+
+    @property
+    def sample(self):
+        return self._sample
+
+    @property
+    def trained_on_sample(self):
+        """True if the model was fitted on a random sample of the dataset."""
+        return self._sample is not None
+
+    def predict(self, features):
+        """
+        Predict the target of new rows.
+
+        Parameters:
+            - features: DataFrame with the feature columns, or an array with
+              one column per feature in the order of feature_names
+
+        Returns:
+            - np.array: Predicted target of each row
+        """
+        if isinstance(features, pd.DataFrame):
+            features = features[self._feature_names]
+        X = np.asarray(features, dtype=np.float64)
+        return self._intercept + np.atleast_2d(X) @ self._coefficients
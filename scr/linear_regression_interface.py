@@ -2,8 +2,9 @@ import tkinter as tk
 from tkinter import messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
-from linear_regression import LinearRegression
-import statsmodels.api as sm
+import pandas as pd
+from linear_regression import LinearRegression, MultipleLinearRegression
+from cross_validation import CV_FOLDS
 from model_handler import save_model
 import model_interface
 
@@ -13,25 +14,32 @@ class LinearRegressionInterface:
     A class that provides a graphical user interface for linear regression analysis.
 
     This class creates a visualization of the linear regression model, including the scatter plot
-    of the data points, the regression line, and model statistics. It also provides functionality
+    of the data points, the regression line, and model statistics. With several features, the
+    plot compares the predicted and actual values instead. It also provides functionality
     to save the model with an optional description.
 
     Attributes:
         _frame (tk.Frame): The main frame where the interface elements will be placed
-        _feature (pd.Series): The independent variable (X) for the regression
+        _feature (pd.Series or pd.DataFrame): The independent variable (X) for the regression,
+            or a DataFrame with one column per variable for a multiple regression
         _target (pd.Series): The dependent variable (y) for the regression
         _comment (tk.Text): Text widget for model description input
-        _linear_regression (LinearRegression): Object that handles the regression calculations
+        _linear_regression (LinearRegression or MultipleLinearRegression): Object that handles
+            the regression calculations
     """
 
-    def __init__(self, frame, feature, target):
+    def __init__(self, frame, feature, target, model_cache=None, cache_key=None):
         """
         Initialize the LinearRegressionInterface with the provided data.
 
         Parameters:
             - frame: The main frame to contain the interface elements
-            - feature: The independent variable data
+            - feature: The independent variable data, or a DataFrame with the
+              independent variables for a multiple regression
             - target: The dependent variable data
+            - model_cache: ModelCache to take the model from, if it was already
+              fitted on the same data, and to keep it in otherwise
+            - cache_key: Key of the model in model_cache (see model_cache.fit_key)
         """
         self._frame = frame   # Main frame of the interface
         self._feature = feature  # Will be passed to the calculation class
@@ -40,7 +48,10 @@ class LinearRegressionInterface:
 
         try:
             # Try creating the linear regression object
-            self._linear_regression = LinearRegression(feature, target)
+            if model_cache is None:
+                self._linear_regression = self._fit_model()
+            else:
+                self._linear_regression = model_cache.get_or_fit(cache_key, self._fit_model)
             # Create and display the plot in the interface if successful
             self.create_plot()
         except ValueError as ve:
@@ -53,6 +64,21 @@ class LinearRegressionInterface:
             # Handle any other unforeseen errors
             messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
 
+    def _fit_model(self):
+        """
+        Fits the regression model on the data of the interface.
+
+        Simple regressions are also cross-validated, with the same folds every time.
+
+        Returns:
+            - LinearRegression or MultipleLinearRegression: The fitted model
+        """
+        if isinstance(self._feature, pd.DataFrame):
+            return MultipleLinearRegression(self._feature, self._target)
+        model = LinearRegression(self._feature, self._target)
+        if len(self._feature) >= CV_FOLDS:
+            model.cross_validate(CV_FOLDS, seed=0)
+        return model
 
     def create_plot(self):
         """
@@ -77,12 +103,15 @@ class LinearRegressionInterface:
         # Change background color of the entire figure (light blue)
         fig.patch.set_facecolor('#d0d7f2')
 
-        ax.scatter(self._feature, self._target, color='#808ec6',
-                   label='Data', s=10)  # Real data points
-        ax.plot(self._feature, predictions, color='#bc2716',
-                label='Regression line', linewidth=2)  # Regression line
-        ax.set_xlabel(self._linear_regression._feature_name, fontsize=8)
-        ax.set_ylabel(self._linear_regression._target_name, fontsize=8)
+        if isinstance(self._linear_regression, MultipleLinearRegression):
+            self._plot_predicted_vs_actual(ax, predictions)
+        else:
+            ax.scatter(self._feature, self._target, color='#808ec6',
+                       label='Data', s=10)  # Real data points
+            ax.plot(self._feature, predictions, color='#bc2716',
+                    label='Regression line', linewidth=2)  # Regression line
+            ax.set_xlabel(self._linear_regression._feature_name, fontsize=8)
+            ax.set_ylabel(self._linear_regression._target_name, fontsize=8)
         # Size of numbers on axes
         ax.tick_params(axis='both', which='major', labelsize=8)
         ax.legend(fontsize=8)
@@ -93,12 +122,45 @@ class LinearRegressionInterface:
         canvas.draw()
         canvas.get_tk_widget().pack()
 
-        model_interface.show(self._frame, self._linear_regression.feature_name, self._linear_regression.target_name, self._linear_regression.intercept,
-                             self._linear_regression.slope, self._linear_regression.r_squared,
-                             self._linear_regression.mse, None)
+        model = self._linear_regression
+        if isinstance(model, MultipleLinearRegression):
+            model_interface.show_multiple(self._frame, model.feature_names, model.target_name,
+                                          model.intercept, model.coefficients, model.r_squared,
+                                          model.adjusted_r_squared, model.mse, None)
+        else:
+            model_interface.show(self._frame, model.feature_name, model.target_name, model.intercept,
+                                 model.slope, model.r_squared, model.mse, None, model.cv)
+
+        if self._linear_regression.trained_on_sample:
+            sample = self._linear_regression.sample
+            sample_label = tk.Label(
+                self._frame,
+                text=f"Fitted on a random sample of {sample.rows:,} of "
+                     f"{sample.total_rows:,} rows",
+                fg='#bc2716', bg='#d0d7f2', font=('Arial Black', 10, 'bold'))
+            sample_label.pack(side='top', pady=(10, 0))
 
         self.comment()
 
+    def _plot_predicted_vs_actual(self, ax, predictions):
+        """
+        Plots the predicted values of a multiple regression against the actual ones.
+
+        A perfect model puts every point on the diagonal line.
+
+        Parameters:
+            - ax: Matplotlib axes to draw on
+            - predictions: Predicted target values
+        """
+        ax.scatter(self._target, predictions, color='#808ec6',
+                   label='Data', s=10)  # Actual against predicted values
+        low = min(self._target.min(), predictions.min())
+        high = max(self._target.max(), predictions.max())
+        ax.plot([low, high], [low, high], color='#bc2716',
+                label='Perfect prediction', linewidth=2)  # Diagonal line
+        ax.set_xlabel(f"Actual {self._linear_regression.target_name}", fontsize=8)
+        ax.set_ylabel(f"Predicted {self._linear_regression.target_name}", fontsize=8)
+
     def comment(self):
         """
         Creates and displays the interface elements for adding a model description
@@ -5,6 +5,11 @@ from nan_handler import NaNHandler, ConstantValueError
 from linear_regression_interface import LinearRegressionInterface
 from column_menu import ColumnMenu
 from method_menu import MethodMenu
+from progress_bar import run_with_loading
+from scroll_table import ScrollTable
+from screening import screen_regressions
+from grouped_regression import fit_grouped
+from model_cache import ModelCache, fit_key
 
 
 class MenuManager:
@@ -22,7 +27,8 @@ class MenuManager:
         frame: tk.Frame,
         columns: list,
         df: pd.DataFrame,
-        chart_frame: tk.Frame
+        chart_frame: tk.Frame,
+        loading: bool = False
     ):
         """
         Initialize menu manager with necessary components.
@@ -33,21 +39,29 @@ class MenuManager:
             - columns: List of available column names
             - df: Input DataFrame
             - chart_frame: Frame for displaying charts
+            - loading: True if df only has the first rows of the dataset. The
+              model cannot be created until set_full_data is called.
         """
         self._app = app
         self._frame = frame
         self._columns = columns
         self._df = df
         self._new_df = None  # Will store processed DataFrame
+        self._nan_method = (None, None)  # Method and constant value that produced it
+        self._model_cache = ModelCache()  # Models fitted on this dataset
         self._chart_frame = chart_frame
+        self._loading = loading
+        self._nan_handler = None  # Handler of the confirmed selection
 
         self._init_components()
 
     def _init_components(self):
         """Initialize menu components."""
-        self._column_menu = ColumnMenu(self._frame, self._columns, self)
+        self._column_menu = ColumnMenu(self._frame, self._columns, self, list(self._df.columns))
         self._method_menu = MethodMenu(self._frame, self)
         self.create_regression_button()
+        self.create_screening_button()
+        self._create_separator()
         self._app.scroll_window.update()
 
     @property
@@ -70,6 +84,16 @@ class MenuManager:
         """
         return self._new_df
 
+    @property
+    def model_cache(self) -> ModelCache:
+        """
+        Get the cache of fitted models.
+
+        Returns:
+            - ModelCache: Models fitted so far, with its hit and miss counters
+        """
+        return self._model_cache
+
     def _reset_chart_and_controls(self):
         """
         Resets the chart and disables relevant controls.
@@ -88,6 +112,7 @@ class MenuManager:
             - event: Selection change event
         """
         # Reset method selection when columns change
+        self._nan_handler = None
         self._method_menu.disable_selector()
         self._method_menu.disable_selector()
         self._method_menu.hide_constant_input()
@@ -126,9 +151,26 @@ class MenuManager:
             activeforeground="#FAF8F9",
             cursor="hand2"
         )
-        self._regression_button.pack(side='top', pady=(20, 30))
+        self._regression_button.pack(side='top', pady=(20, 10))
 
-        self._create_separator()
+    def create_screening_button(self):
+        """
+        Create the button that ranks the regressions of every pair of columns.
+        It is disabled until the full dataset is loaded.
+        """
+        self._screening_button = tk.Button(
+            self._frame,
+            text="Find Best Predictors",
+            command=self.show_screening,
+            state="disabled" if self._loading else "normal",
+            font=("Arial", 10, 'bold'),
+            fg="#FAF8F9",
+            bg='#6677B8',
+            activebackground="#808ec6",
+            activeforeground="#FAF8F9",
+            cursor="hand2"
+        )
+        self._screening_button.pack(side='top', pady=(0, 30))
 
     def _create_separator(self):
         """Create visual separator."""
@@ -137,9 +179,31 @@ class MenuManager:
         separator.pack(fill=tk.X, side='top')
 
     def enable_regression_button(self):
-        """Enable regression model creation."""
+        """Enable regression model creation, once the full dataset is loaded."""
+        if self._loading:
+            return
         self._regression_button.config(state="normal")
 
+    def set_full_data(self, df: pd.DataFrame):
+        """
+        Replace the preview with the full dataset and allow creating the model.
+
+        A selection confirmed on the preview is checked again for missing
+        values, since only the first rows were checked.
+
+        Parameters:
+            - df: DataFrame with every row of the dataset
+        """
+        self._df = df
+        self._loading = False
+        self._screening_button.config(state="normal")
+        self._new_df = None
+        self._method_menu.hide_constant_input()
+        self._method_menu.apply_button_disable()
+        self._reset_chart_and_controls()
+        if self._nan_handler is not None:
+            self._handle_nan_checking()
+
     def disable_regression_button(self):
         """Disable regression model creation."""
         self._regression_button.config(state="disabled")
@@ -182,7 +246,7 @@ class MenuManager:
         if not self._column_menu.selected_features:
             messagebox.showerror(
                 "Error",
-                "You must select an input column (feature)."
+                "You must select at least one input column (feature)."
             )
             return False
 
@@ -205,11 +269,12 @@ class MenuManager:
         # Cleans preprocessed DataFrame
         self._new_df = None
 
+        message = f"Feature: {f_cols}\nTarget: {t_col}"
+        if self._column_menu.selected_group is not None:
+            message += f"\nGroup by: {self._column_menu.selected_group}"
+
         # Show selection confirmation
-        messagebox.showinfo(
-            "Success",
-            f"Feature: {f_cols}\nTarget: {t_col}"
-        )
+        messagebox.showinfo("Success", message)
 
     def _handle_nan_checking(self):
         """Check for NaN values and update UI accordingly."""
@@ -259,6 +324,7 @@ class MenuManager:
         try:
             # Process data with selected method
             self._new_df = self._nan_handler.preprocess(method, constant_value)
+            self._nan_method = (method, constant_value)
             self._show_preprocessing_success()
         except ConstantValueError as e:
             messagebox.showerror("Error", str(e))
@@ -303,8 +369,11 @@ class MenuManager:
         """
         Create and display the linear regression model.
 
-        Creates a linear regression model using the selected feature and target columns.
+        Creates a linear regression model using the selected feature and target columns,
+        a multiple linear regression if several features are selected.
         Validates data sufficiency and displays the regression results in the chart frame.
+        A model already fitted on the same data and preprocessing is taken from the
+        model cache instead of being fitted again.
 
         Displays appropriate error messages if there are issues with the data or selection.
         """
@@ -314,7 +383,7 @@ class MenuManager:
         # Use processed DataFrame if available, otherwise use original        
         df_to_use = self._new_df if self._new_df is not None else self._df
         # Get selected feature and target columns
-        feature = df_to_use[self._column_menu.selected_features[0]]
+        feature = self._selected_feature_data(df_to_use)
         target = df_to_use[self._column_menu.selected_target[0]]
         # Check data sufficiency
         if not self._validate_data_sufficiency(feature, target):
@@ -322,6 +391,20 @@ class MenuManager:
 
         self._show_model_creation()
 
+    def _selected_feature_data(self, df: pd.DataFrame):
+        """
+        Get the values of the selected features.
+
+        Parameters:
+            - df: DataFrame to take the columns from
+
+        Returns:
+            - pd.Series: The feature column if only one is selected
+            - pd.DataFrame: The feature columns if several are selected
+        """
+        features = self._column_menu.selected_features
+        return df[features[0]] if len(features) == 1 else df[features]
+
     def _validate_model_prerequisites(self) -> bool:
         """
         Validate that necessary columns are selected.
@@ -336,14 +419,22 @@ class MenuManager:
                 "You must select input and output columns before creating the model."
             )
             return False
+        # Grouped models are simple regressions
+        if self._column_menu.selected_group is not None and \
+                len(self._column_menu.selected_features) > 1:
+            messagebox.showerror(
+                "Error",
+                "Models by group can only use one input column (feature)."
+            )
+            return False
         return True
 
-    def _validate_data_sufficiency(self, feature: pd.Series, target: pd.Series) -> bool:
+    def _validate_data_sufficiency(self, feature, target: pd.Series) -> bool:
         """
         Check if there's enough data for regression.
 
         Parameters:
-            - feature: Feature column data
+            - feature: Feature column data (a DataFrame if there are several)
             - target: Target column data
 
         Returns:
@@ -372,14 +463,95 @@ class MenuManager:
             self.clear_frame(self._chart_frame)
             self._chart_frame.pack()
             df_to_use = self._new_df if self._new_df is not None else self._df
-            # Clear previous chart
+            if self._column_menu.selected_group is not None:
+                self._show_grouped_models(df_to_use)
+                self._app.scroll_window.update()
+                return
+            feature = self._selected_feature_data(df_to_use)
+            target = df_to_use[self._column_menu.selected_target[0]]
+            # The model is only fitted again if the data or preprocessing changed
+            method = self._nan_method if self._new_df is not None else (None, None)
             LinearRegressionInterface(
                 self._chart_frame,
-                df_to_use[self._column_menu.selected_features[0]],
-                df_to_use[self._column_menu.selected_target[0]]
+                feature,
+                target,
+                self._model_cache,
+                fit_key(feature, target, *method)
             )
             self._app.scroll_window.update()
 
+    def _show_grouped_models(self, df: pd.DataFrame):
+        """
+        Fit a regression for each group and show their coefficients in a table.
+
+        Parameters:
+            - df: DataFrame with the feature and target columns, whose index
+              matches the rows of the original DataFrame
+        """
+        group = self._column_menu.selected_group
+        feature_name = self._column_menu.selected_features[0]
+        target_name = self._column_menu.selected_target[0]
+        try:
+            # The preprocessed DataFrame only has the selected columns
+            groups = self._df[group].reindex(df.index)
+            models = fit_grouped(df[feature_name], df[target_name], groups)
+        except (ValueError, TypeError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        title = tk.Label(
+            self._chart_frame,
+            text=f"{len(models):,} MODELS OF {target_name} BY {group}",
+            fg='#4d598a', bg='#d0d7f2', font=('Arial Black', 12, 'bold'))
+        title.pack(side='top', pady=(10, 0))
+
+        table_frame = tk.Frame(self._chart_frame, height=400, width=700)
+        table_frame.pack(side='top', pady=(10, 70))
+        table_frame.pack_propagate(False)
+        table = ScrollTable(table_frame)
+        table.create_from_df(models.round(4).reset_index())
+        table.show()
+
+    # Regressions shown in the leaderboard window
+    LEADERBOARD_ROWS = 1000
+
+    def show_screening(self):
+        """
+        Fit a regression for every pair of numeric columns and show the best
+        ones in a new window, ranked by R².
+        """
+        window = self._app.scroll_window.window
+        try:
+            leaderboard = run_with_loading(
+                window,
+                screen_regressions,
+                "Fitting every pair of columns...",
+                self._df,
+                list(self._columns),
+                top=self.LEADERBOARD_ROWS
+            )
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        popup = tk.Toplevel(window)
+        popup.title("Best predictors")
+        popup.geometry("700x400")
+        popup.config(bg='#d0d7f2')
+
+        label = tk.Label(
+            popup,
+            text=f"Regressions of every pair of columns, fitted on the "
+                 f"{leaderboard.attrs['rows']:,} rows without missing values",
+            fg='#4d598a', bg='#d0d7f2', font=("DejaVu Sans Mono", 10, 'bold'))
+        label.pack(side='top', pady=5)
+
+        table_frame = tk.Frame(popup)
+        table_frame.pack(side='top', fill=tk.BOTH, expand=True)
+        table = ScrollTable(table_frame)
+        table.create_from_df(leaderboard.round(4))
+        table.show()
+
     @staticmethod
     def clear_frame(frame: tk.Frame):
         """
@@ -0,0 +1,204 @@
+import hashlib
+from collections import OrderedDict, namedtuple
+import numpy as np
+import pandas as pd
+
+
+# Default limits of the cache of fitted models
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+# Counters of a ModelCache, to tune its limits
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "entries", "nbytes"])
+
+
+def data_hash(data):
+    """
+    Hash the values, names and dtypes of a column or table.
+
+    Numeric columns are hashed from the bytes of their values (about 20 ms
+    per million values), other columns from the row hashes of
+    pandas.util.hash_pandas_object. Either way it takes less than fitting
+    and cross-validating a model. The index is left out: it does not change
+    the fitted model.
+
+    Parameters:
+        - data (pd.Series or pd.DataFrame): The data to hash.
+
+    Returns:
+        - str: Hexadecimal digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    columns = data.items() if isinstance(data, pd.DataFrame) else [(data.name, data)]
+    for name, column in columns:
+        digest.update(repr((name, str(column.dtype))).encode())
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+            values = column.to_numpy()
+        else:  # Nullable, categorical, text... columns
+            values = pd.util.hash_pandas_object(column, index=False).to_numpy()
+        digest.update(np.ascontiguousarray(values).view(np.uint8))
+    return digest.hexdigest()
+
+
+def fit_key(feature, target, method=None, constant_value=None):
+    """
+    Get the key of the model fitted on some data.
+
+    Parameters:
+        - feature (pd.Series or pd.DataFrame): Feature column, or columns of a
+          multiple regression.
+        - target (pd.Series): Target column.
+        - method (str, optional): NaNHandler method applied to the columns,
+          None if they had no missing values.
+        - constant_value (float, optional): Value used by the method
+          "Fill with a Constant Value".
+
+    Returns:
+        - str: Hexadecimal key, the same whenever the data and preprocessing are.
+    """
+    identity = (data_hash(feature), data_hash(target), method, constant_value)
+    return hashlib.blake2b(repr(identity).encode(), digest_size=16).hexdigest()
+
+
+def model_nbytes(model):
+    """
+    Estimate the memory used by a fitted model, from its arrays and columns.
+
+    Parameters:
+        - model: A fitted model (e.g. LinearRegression).
+
+    Returns:
+        - int: Size in bytes. Columns shared with the dataset are counted too,
+          so the estimate errs on the large side.
+    """
+    nbytes = 0
+    for value in vars(model).values():
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            nbytes += int(np.sum(value.memory_usage(index=True, deep=False)))
+        elif isinstance(value, np.ndarray):
+            nbytes += value.nbytes
+    return nbytes
+
+
+class ModelCache:
+    """
+    In-memory cache of fitted models, so that fitting again a model on the
+    same data and preprocessing is instant.
+
+    The least recently used models are removed when there are more than
+    max_entries of them or they take more than max_bytes (see model_nbytes).
+
+    Parameters:
+        _max_entries (int): Maximum number of cached models.
+        _max_bytes (int): Maximum total size of the cached models.
+        _entries (OrderedDict): Model and size of each key, from the least
+            to the most recently used.
+        _nbytes (int): Total size of the cached models.
+        _hits (int): Number of lookups that found their model.
+        _misses (int): Number of lookups that did not.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Initialize an empty cache.
+
+        Parameters:
+            - max_entries: Maximum number of cached models.
+            - max_bytes: Maximum total size of the cached models in bytes.
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    @property
+    def stats(self):
+        """Hits, misses, number of entries and total size of the cache."""
+        return CacheStats(self._hits, self._misses, len(self._entries), self._nbytes)
+
+    def get(self, key):
+        """
+        Get a cached model, counting the lookup as a hit or a miss.
+
+        Parameters:
+            - key: Key of the model (see fit_key).
+
+        Returns:
+            - The cached model, or None if it is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)  # Most recently used
+        return entry[0]
+
+    def put(self, key, model):
+        """
+        Cache a model, removing the least recently used ones if needed.
+
+        A model larger than max_bytes is not cached.
+
+        Parameters:
+            - key: Key of the model (see fit_key).
+            - model: The fitted model.
+        """
+        nbytes = model_nbytes(model)
+        self._remove(key)
+        if nbytes > self._max_bytes:
+            return
+        self._entries[key] = (model, nbytes)
+        self._nbytes += nbytes
+        while len(self._entries) > self._max_entries or self._nbytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))  # Least recently used
+
+    def get_or_fit(self, key, fit):
+        """
+        Get a cached model, or fit and cache it if it is not cached.
+
+        Parameters:
+            - key: Key of the model (see fit_key).
+            - fit: Function without parameters that returns the fitted model.
+              Its exceptions are raised, and nothing is cached.
+
+        Returns:
+            - The cached or newly fitted model.
+        """
+        model = self.get(key)
+        if model is None:
+            model = fit()
+            self.put(key, model)
+        return model
+
+    def clear(self):
+        """Remove every model, keeping the counters."""
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _remove(self, key):
+        """
+        Remove a model if it is cached.
+
+        Parameters:
+            - key: Key of the model.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
@@ -2,44 +2,74 @@ import joblib
 import pickle
 import os
 from tkinter import filedialog
-from linear_regression import LinearRegression
+from linear_regression import LinearRegression, MultipleLinearRegression
+from cross_validation import CV_KEYS
 from exceptions import FileNotSelectedError, FileFormatError
 
 
-def save_model(model, description=None):
+# Keys of a saved simple linear regression model
+REQUIRED_KEYS = {"intercept", "slope", "r_squared", "mse", "feature_name", "target_name", "description"}
+# Keys of a saved multiple linear regression model
+MULTIPLE_REQUIRED_KEYS = {"intercept", "coefficients", "r_squared", "adjusted_r_squared", "mse",
+                          "feature_names", "target_name", "description"}
+# Keys that a saved model may have: the summary of its cross-validation
+OPTIONAL_KEYS = {"cv"}
+
+
+def model_data(model, description=None):
     """
-    Save a linear regression model to a file in either pickle (.pkl) or joblib (.joblib) format.
+    Get the parameters and metadata of a model as they are saved.
 
-    This function saves the model's parameters and metadata including feature name,
-    target name, intercept, slope, R-squared value, and MSE. It prompts the user
-    to choose a save location and file format through a file dialog.
+    A simple regression is saved with its feature name and slope, and a
+    multiple regression with the list of feature names and the list of
+    their coefficients.
 
     Parameters:
-        - model: A LinearRegression model object containing the trained model parameters
+        - model: A LinearRegression or MultipleLinearRegression model
         - description (str, optional): A description of the model. Defaults to None.
 
     Returns:
-        - str: The file extension of the saved file ('.pkl' or '.joblib'),
-                or None if the save operation was cancelled.
+        - dict: The data to save, with the keys REQUIRED_KEYS or MULTIPLE_REQUIRED_KEYS,
+          and "cv" if the model was cross-validated.
     """
-    # Use getters to access values correctly
-    feature_name = model.feature_name
-    target_name = model.target_name
-    intercept = model.intercept
-    slope = model.slope
-    r_squared = model.r_squared
-    mse = model.mse
-
     # Use getters to access values correctly
     data = {
-        "intercept": intercept,
-        "slope": slope,
-        "r_squared": r_squared,
-        "mse": mse,
-        "feature_name": feature_name,
-        "target_name": target_name,
+        "intercept": model.intercept,
+        "r_squared": model.r_squared,
+        "mse": model.mse,
+        "target_name": model.target_name,
         "description": description if description is not None else "",
     }
+    if isinstance(model, MultipleLinearRegression):
+        data["coefficients"] = [float(c) for c in model.coefficients]
+        data["adjusted_r_squared"] = model.adjusted_r_squared
+        data["feature_names"] = model.feature_names
+    else:
+        data["slope"] = model.slope
+        data["feature_name"] = model.feature_name
+        if model.cv is not None:
+            data["cv"] = dict(model.cv)
+    return data
+
+
+def save_model(model, description=None):
+    """
+    Save a linear regression model to a file in either pickle (.pkl) or joblib (.joblib) format.
+
+    This function saves the model's parameters and metadata (see model_data).
+    It prompts the user to choose a save location and file format through a
+    file dialog.
+
+    Parameters:
+        - model: A LinearRegression or MultipleLinearRegression model object
+          containing the trained model parameters
+        - description (str, optional): A description of the model. Defaults to None.
+
+    Returns:
+        - str: The file extension of the saved file ('.pkl' or '.joblib'),
+                or None if the save operation was cancelled.
+    """
+    data = model_data(model, description)
 
     file_path = filedialog.asksaveasfilename(
         title="Save file",
@@ -97,7 +127,9 @@ def open_model(file_path):
         - file_path (str): Path to the model file (.pkl or .joblib)
 
     Returns:
-        - dict: The loaded model data containing model parameters and metadata.
+        - dict: The loaded model data containing model parameters and metadata,
+          with the keys REQUIRED_KEYS or, for multiple regressions,
+          MULTIPLE_REQUIRED_KEYS, and maybe some of OPTIONAL_KEYS.
 
     Raises:
         - FileNotSelectedError: If the file path is empty.
@@ -106,7 +138,6 @@ def open_model(file_path):
         - ValueError: If the file contains invalid or incomplete data.
     """
     EXTENSIONS = ('.pkl', '.joblib')  # Possible extensions
-    REQUIRED_KEYS = {"intercept", "slope", "r_squared", "mse", "feature_name", "target_name", "description"}
 
     # Map extensions to their corresponding opening functions
     EXTENSION_MAP = {'.pkl': open_pkl, '.joblib': open_joblib}
@@ -133,10 +164,13 @@ def open_model(file_path):
     if not isinstance(loaded_data, dict):
         raise ValueError("Invalid model data format. The data is not a dictionary.")
 
+    # Models with a list of coefficients are multiple regressions
+    required_keys = MULTIPLE_REQUIRED_KEYS if "coefficients" in loaded_data else REQUIRED_KEYS
+
     # Determine the keys that are missing from the loaded data
-    missing_keys = REQUIRED_KEYS - loaded_data.keys()
+    missing_keys = required_keys - loaded_data.keys()
     # Determine the keys that are present but not expected
-    extra_keys = loaded_data.keys() - REQUIRED_KEYS
+    extra_keys = loaded_data.keys() - required_keys - OPTIONAL_KEYS
 
     # If there are missing or extra keys, generate a detailed error message
     if missing_keys or extra_keys:
@@ -147,4 +181,14 @@ def open_model(file_path):
             error_message.append(f"Unexpected extra keys: {', '.join(extra_keys)}.")
         raise ValueError(" ".join(error_message))
 
+    # A multiple regression needs a coefficient for every feature
+    if "coefficients" in loaded_data and \
+            len(loaded_data["coefficients"]) != len(loaded_data["feature_names"]):
+        raise ValueError("The number of coefficients does not match the number of features.")
+
+    # The cross-validation summary needs all its statistics
+    if "cv" in loaded_data and \
+            (not isinstance(loaded_data["cv"], dict) or loaded_data["cv"].keys() != CV_KEYS):
+        raise ValueError("Invalid cross-validation data.")
+
     return loaded_data
\ No newline at end of file
@@ -1,13 +1,69 @@
+import math
 import tkinter as tk
 from tkinter import messagebox
 
 
-def show(frame, feature_name, target_name, intercept, slope, r_squared, mse, description = None):
-    _show_info(frame, feature_name, target_name, intercept,
-              slope, r_squared, mse, description)
-    _show_predictions(frame, intercept, slope, target_name, feature_name)
+def show(frame, feature_name, target_name, intercept, slope, r_squared, mse, description = None,
+         cv = None):
+    _show_info(frame, [feature_name], target_name, intercept,
+              [slope], r_squared, mse, description, cv=cv)
+    _show_predictions(frame, intercept, [slope], target_name, [feature_name])
 
-def _show_info(frame, feature_name, target_name, intercept, slope, r_squared, mse, description):
+def show_multiple(frame, feature_names, target_name, intercept, coefficients, r_squared,
+                  adjusted_r_squared, mse, description = None):
+    _show_info(frame, feature_names, target_name, intercept,
+               coefficients, r_squared, mse, description, adjusted_r_squared)
+    _show_predictions(frame, intercept, coefficients, target_name, feature_names)
+
+def show_model_data(frame, data):
+    """
+    Displays a saved model, simple or multiple (see model_handler.open_model).
+
+    Parameters:
+        - frame (tk.Frame): The parent frame where the model will be displayed
+        - data (dict): Parameters and metadata of the model
+    """
+    if "coefficients" in data:
+        show_multiple(frame, data["feature_names"], data["target_name"], data["intercept"],
+                      data["coefficients"], data["r_squared"], data["adjusted_r_squared"],
+                      data["mse"], data["description"])
+    else:
+        show(frame, data["feature_name"], data["target_name"], data["intercept"],
+             data["slope"], data["r_squared"], data["mse"], data["description"],
+             data.get("cv"))
+
+def format_equation(target_name, intercept, coefficients, feature_names):
+    """
+    Writes the predicted equation of a model.
+
+    Parameters:
+        - target_name (str): Name of the dependent variable
+        - intercept (float): Intercept of the model
+        - coefficients (list): Coefficient of each independent variable
+        - feature_names (list): Names of the independent variables
+
+    Returns:
+        - str: The equation, e.g. "Sales = 3.00 + 2.00*Temperature + -1.50*Rain"
+    """
+    terms = [f"{coefficient:.2f}*{feature_name}"
+             for coefficient, feature_name in zip(coefficients, feature_names)]
+    return " + ".join([f"{target_name} = {intercept:.2f}", *terms])
+
+def format_cv_score(mean, std):
+    """
+    Writes a cross-validated score as its mean and standard deviation over the folds.
+
+    Parameters:
+        - mean (float): Mean of the score
+        - std (float): Standard deviation of the score
+
+    Returns:
+        - str: The score, e.g. "0.8123 ± 0.0100", or "-" if no fold could be scored
+    """
+    return "-" if math.isnan(mean) else f"{mean:.4f} ± {std:.4f}"
+
+def _show_info(frame, feature_names, target_name, intercept, coefficients, r_squared, mse,
+               description, adjusted_r_squared = None, cv = None):
     """
     Displays the linear regression model results in a tkinter frame with a styled interface.
 
@@ -16,13 +72,16 @@ def _show_info(frame, feature_name, target_name, intercept, slope, r_squared, ms
 
     Attributes:
         - frame (tk.Frame): The parent frame where the results will be displayed
-        - feature_name (str): Name of the independent variable (X)
+        - feature_names (list): Names of the independent variables (X)
         - target_name (str): Name of the dependent variable (Y)
         - intercept (float): Y-intercept of the regression line
-        - slope (float): Slope coefficient of the regression line
+        - coefficients (list): Coefficient of each independent variable
         - r_squared (float): R-squared value of the model (coefficient of determination)
         - mse (float): Mean Square Error of the model
         - description (str, optional): Additional description or interpretation of the model
+        - adjusted_r_squared (float, optional): Adjusted R², shown for multiple regressions
+        - cv (dict, optional): Summary of the cross-validation of the model
+          (see cross_validation.summarize)
     """
 
     # Create a border effect
@@ -40,7 +99,7 @@ def _show_info(frame, feature_name, target_name, intercept, slope, r_squared, ms
                               fg='#4d598a', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
     equation_title.pack(side='left', padx=5)
 
-    equation_label = tk.Label(equation_frame, text=f"{target_name} = {intercept:.2f} + {slope:.2f}*{feature_name}",
+    equation_label = tk.Label(equation_frame, text=format_equation(target_name, intercept, coefficients, feature_names),
                               fg='#6677B8', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
     equation_label.pack(side='right', padx=5)
 
@@ -56,6 +115,20 @@ def _show_info(frame, feature_name, target_name, intercept, slope, r_squared, ms
                               fg='#6677B8', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
     rsquared_label.pack(side='right', padx=5)
 
+    # Adjusted R², undefined when there are not more rows than parameters
+    if adjusted_r_squared is not None:
+        adjusted_frame = tk.Frame(info_labels, bg='#d0d7f2')
+        adjusted_frame.pack(side='top', fill='x', pady=5)
+
+        adjusted_title = tk.Label(adjusted_frame, text="Adjusted R²:",
+                                  fg='#4d598a', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
+        adjusted_title.pack(side='left', padx=5)
+
+        adjusted_text = "-" if math.isnan(adjusted_r_squared) else f"{adjusted_r_squared:.4f}"
+        adjusted_label = tk.Label(adjusted_frame, text=adjusted_text,
+                                  fg='#6677B8', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
+        adjusted_label.pack(side='right', padx=5)
+
     # Pair 3: Mean Square Error (MSE)
     mse_frame = tk.Frame(info_labels, bg='#d0d7f2')
     mse_frame.pack(side='top', fill='x', pady=5)
@@ -68,6 +141,22 @@ def _show_info(frame, feature_name, target_name, intercept, slope, r_squared, ms
                          fg='#6677B8', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
     mse_label.pack(side='right', padx=5)
 
+    # Out-of-sample scores, mean ± standard deviation over the folds
+    if cv is not None:
+        splits = f"{cv['folds']}-fold" if cv["repeats"] == 1 \
+            else f"{cv['folds']}-fold, {cv['repeats']} repeats"
+        for name, key in (("R²", "r_squared"), ("MSE", "mse")):
+            cv_frame = tk.Frame(info_labels, bg='#d0d7f2')
+            cv_frame.pack(side='top', fill='x', pady=5)
+
+            cv_title = tk.Label(cv_frame, text=f"Cross-validated {name} ({splits}):",
+                                fg='#4d598a', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
+            cv_title.pack(side='left', padx=5)
+
+            cv_label = tk.Label(cv_frame, text=format_cv_score(cv[f"{key}_mean"], cv[f"{key}_std"]),
+                                fg='#6677B8', bg='#d0d7f2', font=('Arial Black', 11, 'bold'))
+            cv_label.pack(side='right', padx=5)
+
     # If description exists (not None or empty), display it in a label
     if description and description.strip():
 
@@ -83,7 +172,7 @@ def _show_info(frame, feature_name, target_name, intercept, slope, r_squared, ms
         description_label.pack(side='right', padx=(10, 20), pady=5)
 
 
-def _show_predictions(frame, intercept, slope, target_name, feature_name):
+def _show_predictions(frame, intercept, coefficients, target_name, feature_names):
     """
     Creates and displays the prediction interface for the linear regression model.
 
@@ -93,27 +182,28 @@ def _show_predictions(frame, intercept, slope, target_name, feature_name):
     Parameters:
         - frame (tk.Frame): The parent frame for the prediction interface
         - intercept (float): Y-intercept of the regression line
-        - slope (float): Slope coefficient of the regression line
+        - coefficients (list): Coefficient of each independent variable
         - target_name (str): Name of the dependent variable
-        - feature_name (str): Name of the independent variable
+        - feature_names (list): Names of the independent variables
     """
     # Entry and button for user input to make predictions
     def _make_prediction():
         """
         Calculates and displays the predicted value based on user input.
 
-        Retrieves the user-input feature value, calculates the predicted target value
+        Retrieves the user-input feature values, calculates the predicted target value
         using the regression equation, and displays the result. Shows an error message
-        if the input is not a valid number.
+        if an input is not a valid number.
 
         Raises:
             - ValueError: If the user input cannot be converted to a float
         """
         try:
-            # Get the value entered by the user for the feature (X)
-            feature_value = float(entry.get())
+            # Get the values entered by the user for the features (X)
+            feature_values = [float(entry.get()) for entry in entries]
             # Calculate the predicted target value (Y) using the linear regression formula
-            predicted_value = intercept + slope * feature_value
+            predicted_value = intercept + sum(
+                coefficient * value for coefficient, value in zip(coefficients, feature_values))
             result_label.config(
                 text=f"Predicted {target_name}: {predicted_value:.2f}")
             result_label.pack(side='top', pady=(0, 20))
@@ -133,17 +223,21 @@ def _show_predictions(frame, intercept, slope, target_name, feature_name):
                      font=('Arial Black', 12, 'bold'))
     title.pack(side='top', pady=10)
 
-    input_frame = tk.Frame(predictions_labels, bg='#d0d7f2')
-    input_frame.pack(side='top', pady=(0, 20), padx=5)
+    # One row with a label and an entry for each feature
+    entries = []
+    for feature_name in feature_names:
+        input_frame = tk.Frame(predictions_labels, bg='#d0d7f2')
+        input_frame.pack(side='top', pady=(0, 20), padx=5)
 
-    input_label = tk.Label(input_frame, text=f"Enter {feature_name} value:", fg='#4d598a', bg='#d0d7f2',
-                           font=('Arial Black', 11, 'bold'))
-    input_label.pack(side='left', padx=5)
+        input_label = tk.Label(input_frame, text=f"Enter {feature_name} value:", fg='#4d598a', bg='#d0d7f2',
+                               font=('Arial Black', 11, 'bold'))
+        input_label.pack(side='left', padx=5)
 
-    entry = tk.Entry(input_frame, font=('Arial', 12), width=5)
-    entry.pack(side='left', padx=5)
+        entry = tk.Entry(input_frame, font=('Arial', 12), width=5)
+        entry.pack(side='left', padx=5)
+        entries.append(entry)
 
-    # Button to make the prediction
+    # Button to make the prediction, next to the last entry
     predict_button = tk.Button(input_frame, text="Predict", command=_make_prediction, font=('Arial Black', 10),
                                fg="#FAF8F9", bg='#6677B8', activebackground="#808ec6", activeforeground="#FAF8F9",
                                cursor="hand2")
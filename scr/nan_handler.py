@@ -14,21 +14,47 @@ class NaNHandler:
     of a pandas DataFrame using various strategies like deletion or imputation.
 
     Parameters:
-        _df (pandas.DataFrame): The original DataFrame to process.
+        _df (pandas.DataFrame): The original DataFrame to process, None if it
+            is read in chunks.
+        _chunks (iterable): Chunks of the DataFrame to process, None if it is
+            a DataFrame.
         _selected_columns (list): List of valid columns of the DataFrame to process.
     """
 
+    # Methods that only need the values of each row, so they can be applied
+    # chunk by chunk. The means and medians need every row of the columns.
+    CHUNK_METHODS = ("Delete Rows", "Fill with a Constant Value")
+
     def __init__(self, df, selected_columns):
         """
         Initialize the NaNHandler with a DataFrame and selected columns.
 
         Parameters:
-            - df: The DataFrame to process.
+            - df: The DataFrame to process, or an iterable of DataFrame chunks
+              (e.g. from open_files.iter_csv_chunks). The chunks are read one
+              at a time by check_for_nan and preprocess, so a generator can
+              only be used by one of them.
             - selected_columns: List of valid column names of the DataFrame to process.
         """
-        self._df = df
         self._selected_columns = list(set(selected_columns))
 
+        if isinstance(df, pd.DataFrame):
+            self._df = df
+            self._chunks = None
+        else:
+            self._df = None
+            self._chunks = df
+
+    def _iter_chunks(self):
+        """
+        Read the chunks, keeping only the selected columns of each one.
+
+        Yields:
+            - pandas.DataFrame: Selected columns of a chunk.
+        """
+        for chunk in self._chunks:
+            yield chunk[self._selected_columns]
+
     def check_for_nan(self):
         """
         Verify if there are NaN values in the selected columns.
@@ -36,7 +62,12 @@ class NaNHandler:
         Returns:
             - tuple: A boolean indicating if there are missing values and an informative message.
         """
-        missing_info = self._df[self._selected_columns].isnull().sum()
+        if self._df is not None:
+            missing_info = self._df[self._selected_columns].isnull().sum()
+        else:  # Add up the missing values of every chunk
+            missing_info = pd.Series(0, index=self._selected_columns)
+            for chunk in self._iter_chunks():
+                missing_info += chunk.isnull().sum()
         missing_columns = missing_info[missing_info > 0]
 
         if not missing_columns.empty:
@@ -100,6 +131,9 @@ class NaNHandler:
         """
         Return a preprocessed copy of the selected columns using the specified method.
 
+        If the data is read in chunks, the method is applied to each chunk as
+        it is read; only the methods in CHUNK_METHODS can be.
+
         Parameters:
             - method : str
                 Preprocessing method to use.
@@ -111,10 +145,12 @@ class NaNHandler:
             - constant_value (float, optional): Value to use when filling NaN values if method is "Fill with a Constant Value".
 
         Returns:
-            - pandas.DataFrame: Preprocessed copy of the selected columns.
+            - pandas.DataFrame: Preprocessed copy of the selected columns, or a
+              generator of the preprocessed chunks if the data is read in chunks.
 
         Raises:
             - ConstantValueError: If method is "Fill with a Constant Value" and no constant value is provided.
+            - ValueError: If the data is read in chunks and the method is not in CHUNK_METHODS.
         """
         # Methods and their corresponding functions
         METHOD_FUNCTIONS = {
@@ -124,6 +160,9 @@ class NaNHandler:
             "Fill with a Constant Value": self._fill_constant,
         }
 
+        if self._chunks is not None:
+            return self._preprocess_chunks(method, constant_value)
+
         # We check the method and call the corresponding function
         if method == "Fill with a Constant Value":
             if constant_value is not None:  # Check that there is a constant value
@@ -134,6 +173,38 @@ class NaNHandler:
         else:
             return METHOD_FUNCTIONS[method](self._selected_columns)
 
+    def _preprocess_chunks(self, method, constant_value=None):
+        """
+        Apply a method to each chunk as it is read.
+
+        Parameters:
+            - method (str): One of CHUNK_METHODS.
+            - constant_value (float, optional): Value to use when filling NaN values
+              if method is "Fill with a Constant Value".
+
+        Returns:
+            - generator: Preprocessed selected columns of each chunk.
+
+        Raises:
+            - ConstantValueError: If method is "Fill with a Constant Value" and no constant value is provided.
+            - ValueError: If the method is not in CHUNK_METHODS.
+        """
+        # Checked now, not when the first chunk is read
+        if method not in self.CHUNK_METHODS:
+            raise ValueError(f"{method} needs every row of the columns, "
+                             "it cannot be applied chunk by chunk.")
+        if method == "Fill with a Constant Value" and constant_value is None:
+            raise ConstantValueError("You must introduce a valid numeric value.")
+
+        def preprocessed():
+            for chunk in self._iter_chunks():
+                if method == "Delete Rows":
+                    yield chunk.dropna()
+                else:
+                    yield chunk.fillna(constant_value)
+
+        return preprocessed()
+
 
 if __name__ == "__main__":
     # Example for using the module
@@ -0,0 +1,370 @@
+from collections import namedtuple
+import numpy as np
+
+
+# Rows processed at a time: the centered values of a block stay in the CPU cache
+BLOCK_SIZE = 64 * 1024
+
+# Sufficient statistics of a simple linear regression: number of rows, means
+# and sums of squares and cross products of the deviations from the means
+Moments = namedtuple("Moments", ["n", "mean_x", "mean_y", "s_xx", "s_xy", "s_yy"])
+
+# Parameters and statistics of a fitted simple linear regression
+OLSFit = namedtuple("OLSFit", ["intercept", "slope", "r_squared", "mse"])
+
+# Sufficient statistics of a multiple linear regression: number of rows, means
+# of the columns (the features, then the target) and their centered Gram
+# matrix, the sums of the products of the deviations of every pair of columns
+CrossMoments = namedtuple("CrossMoments", ["n", "means", "gram"])
+
+# Parameters and statistics of a fitted multiple linear regression
+MultipleOLSFit = namedtuple("MultipleOLSFit", ["intercept", "coefficients", "r_squared",
+                                               "adjusted_r_squared", "mse"])
+
+
+def compute_moments(x, y, block_size=BLOCK_SIZE):
+    """
+    Compute the sufficient statistics of two columns in one pass.
+
+    Each block is centered on its own means before the products are summed,
+    and the blocks are combined with merge_moments. Sums of raw products
+    (Σx², Σxy...) lose every significant digit when the values are large
+    compared to their spread; centered sums do not.
+
+    Parameters:
+        - x (array-like): Feature values.
+        - y (array-like): Target values, as many as x.
+        - block_size (int, optional): Rows processed at a time.
+
+    Returns:
+        - Moments: Statistics of the rows.
+
+    Raises:
+        - ValueError: If there are no rows or x and y have different lengths.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) != len(y):
+        raise ValueError("Feature and target must have the same length")
+    if len(x) == 0:
+        raise ValueError("Input data cannot be empty")
+
+    total = None
+    for start in range(0, len(x), block_size):
+        block_x = x[start:start + block_size]
+        block_y = y[start:start + block_size]
+        mean_x = block_x.mean()
+        mean_y = block_y.mean()
+        dx = block_x - mean_x
+        dy = block_y - mean_y
+        block = Moments(len(block_x), mean_x, mean_y,
+                        np.dot(dx, dx), np.dot(dx, dy), np.dot(dy, dy))
+        total = block if total is None else merge_moments(total, block)
+    return total
+
+
+def merge_moments(a, b):
+    """
+    Combine the statistics of two disjoint sets of rows.
+
+    Uses the pairwise update of Chan, Golub and LeVeque, which corrects the
+    centered sums with the difference between the two means, so the result
+    is as accurate as if the rows had been centered together.
+
+    Parameters:
+        - a, b (Moments): Statistics of each set of rows.
+
+    Returns:
+        - Moments: Statistics of the union of the rows.
+    """
+    if a.n == 0:
+        return b
+    if b.n == 0:
+        return a
+    n = a.n + b.n
+    delta_x = b.mean_x - a.mean_x
+    delta_y = b.mean_y - a.mean_y
+    weight = a.n * b.n / n
+    return Moments(
+        n,
+        a.mean_x + delta_x * b.n / n,
+        a.mean_y + delta_y * b.n / n,
+        a.s_xx + b.s_xx + delta_x * delta_x * weight,
+        a.s_xy + b.s_xy + delta_x * delta_y * weight,
+        a.s_yy + b.s_yy + delta_y * delta_y * weight,
+    )
+
+
+def merge_moment_arrays(a, b):
+    """
+    Combine element by element arrays of statistics of disjoint sets of rows
+    (e.g. the rows of each group), with the update of merge_moments applied
+    to every element at once. Elements without rows must have zero (not
+    NaN) means and sums.
+
+    Parameters:
+        - a, b (Moments): Arrays with the statistics of each set.
+
+    Returns:
+        - Moments: Arrays with the statistics of the union of each pair of sets.
+    """
+    n = a.n + b.n
+    safe_n = np.maximum(n, 1)
+    delta_x = b.mean_x - a.mean_x
+    delta_y = b.mean_y - a.mean_y
+    weight = a.n * b.n / safe_n  # 0 when one of the sets has no rows
+    return Moments(
+        n,
+        a.mean_x + delta_x * b.n / safe_n,
+        a.mean_y + delta_y * b.n / safe_n,
+        a.s_xx + b.s_xx + delta_x * delta_x * weight,
+        a.s_xy + b.s_xy + delta_x * delta_y * weight,
+        a.s_yy + b.s_yy + delta_y * delta_y * weight,
+    )
+
+
+def solve(moments):
+    """
+    Get the least squares line from the statistics of the rows.
+
+    Parameters:
+        - moments (Moments): Statistics of the rows.
+
+    Returns:
+        - OLSFit: Intercept, slope, R² and mean squared error. R² is 0 when
+          the target is constant.
+
+    Raises:
+        - ValueError: If there are no rows or the feature is constant.
+    """
+    if moments.n == 0:
+        raise ValueError("Input data cannot be empty")
+    if moments.s_xx <= 0:
+        raise ValueError("The feature must not be constant")
+
+    slope = moments.s_xy / moments.s_xx
+    intercept = moments.mean_y - slope * moments.mean_x
+    # Residual sum of squares, clipped because of rounding errors
+    rss = max(moments.s_yy - slope * moments.s_xy, 0.0)
+    r_squared = 1 - rss / moments.s_yy if moments.s_yy > 0 else 0.0
+    return OLSFit(float(intercept), float(slope), float(r_squared), float(rss / moments.n))
+
+
+def fit(x, y, block_size=BLOCK_SIZE):
+    """
+    Fit a simple linear regression with the closed-form least squares solution.
+
+    Parameters:
+        - x (array-like): Feature values.
+        - y (array-like): Target values, as many as x.
+        - block_size (int, optional): Rows processed at a time.
+
+    Returns:
+        - OLSFit: Intercept, slope, R² and mean squared error.
+
+    Raises:
+        - ValueError: If there are no rows, the lengths do not match or the
+          feature is constant.
+    """
+    return solve(compute_moments(x, y, block_size))
+
+
+def fit_statsmodels(x, y):
+    """
+    Fit a simple linear regression with statsmodels, the reference
+    implementation of fit. statsmodels is an optional dependency.
+
+    Parameters:
+        - x (array-like): Feature values.
+        - y (array-like): Target values, as many as x.
+
+    Returns:
+        - OLSFit: Intercept, slope, R² and mean squared error.
+
+    Raises:
+        - ImportError: If statsmodels is not installed.
+    """
+    try:
+        import statsmodels.api as sm
+    except ImportError:
+        raise ImportError("The statsmodels engine needs the optional "
+                          "statsmodels package (pip install statsmodels).")
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Add a column of ones for the intercept term
+    design = sm.add_constant(x, has_constant="add")
+    result = sm.OLS(y, design).fit()
+    intercept, slope = result.params
+
+    # Handle constant target case
+    r_squared = 0.0 if np.var(y) == 0 else result.rsquared
+    mse = np.mean((y - result.predict(design)) ** 2)
+    return OLSFit(float(intercept), float(slope), float(r_squared), float(mse))
+
+
+def empty_cross_moments(features):
+    """
+    Get the statistics of no rows, to accumulate chunks on.
+
+    Parameters:
+        - features (int): Number of features.
+
+    Returns:
+        - CrossMoments: Statistics without rows.
+    """
+    return CrossMoments(0, np.zeros(features + 1), np.zeros((features + 1, features + 1)))
+
+
+def compute_cross_moments(X, y, block_size=BLOCK_SIZE):
+    """
+    Compute the sufficient statistics of a multiple regression in one pass.
+
+    Like compute_moments, each block is centered on its own means and the
+    blocks are combined with merge_cross_moments. Memory grows with the
+    square of the number of features, not with the number of rows.
+
+    Parameters:
+        - X (array-like): Feature values, one column per feature.
+        - y (array-like): Target values, as many as rows of X.
+        - block_size (int, optional): Rows processed at a time.
+
+    Returns:
+        - CrossMoments: Statistics of the rows.
+
+    Raises:
+        - ValueError: If X and y have different lengths.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if X.ndim == 1:
+        X = X[:, np.newaxis]
+    if len(X) != len(y):
+        raise ValueError("Features and target must have the same length")
+
+    blocks = (np.column_stack([X[start:start + block_size], y[start:start + block_size]])
+              for start in range(0, len(X), block_size))
+    return accumulate_cross_moments(blocks, X.shape[1] + 1)
+
+
+def accumulate_cross_moments(blocks, columns):
+    """
+    Compute the means and centered Gram matrix of every column of a
+    sequence of row blocks.
+
+    Parameters:
+        - blocks (iterable): 2D float arrays with the same columns.
+        - columns (int): Number of columns.
+
+    Returns:
+        - CrossMoments: Statistics of the rows of every block.
+    """
+    total = empty_cross_moments(columns - 1)
+    for block in blocks:
+        if len(block) == 0:
+            continue
+        means = block.mean(axis=0)
+        deviations = block - means
+        total = merge_cross_moments(
+            total, CrossMoments(len(block), means, deviations.T @ deviations))
+    return total
+
+
+def merge_cross_moments(a, b):
+    """
+    Combine the statistics of two disjoint sets of rows (the matrix form of
+    merge_moments).
+
+    Parameters:
+        - a, b (CrossMoments): Statistics of each set of rows.
+
+    Returns:
+        - CrossMoments: Statistics of the union of the rows.
+    """
+    if a.n == 0:
+        return b
+    if b.n == 0:
+        return a
+    n = a.n + b.n
+    delta = b.means - a.means
+    return CrossMoments(n, a.means + delta * b.n / n,
+                        a.gram + b.gram + np.outer(delta, delta) * (a.n * b.n / n))
+
+
+def solve_multiple(moments):
+    """
+    Get the least squares coefficients from the statistics of the rows.
+
+    The normal equations are solved with a Cholesky factorization of the
+    centered Gram matrix of the features, scaled to unit diagonal so that
+    features of very different magnitudes do not hurt its conditioning.
+
+    Parameters:
+        - moments (CrossMoments): Statistics of the rows.
+
+    Returns:
+        - MultipleOLSFit: Intercept, coefficients, R², adjusted R² and mean
+          squared error. R² is 0 when the target is constant, and the
+          adjusted R² is NaN when there are not more rows than parameters.
+
+    Raises:
+        - ValueError: If there are not more rows than features, or a feature
+          is constant or a linear combination of the others.
+    """
+    if moments.n == 0:
+        raise ValueError("Input data cannot be empty")
+    if moments.n <= len(moments.means) - 1:  # Fewer rows than features and intercept
+        raise ValueError("There must be more rows than features")
+
+    s_xx = moments.gram[:-1, :-1]
+    s_xy = moments.gram[:-1, -1]
+    s_yy = moments.gram[-1, -1]
+    scale = np.sqrt(np.diag(s_xx))
+    if not np.all(scale > 0):
+        raise ValueError("The features must not be constant")
+
+    try:
+        lower = np.linalg.cholesky(s_xx / np.outer(scale, scale))
+    except np.linalg.LinAlgError:
+        raise ValueError("The features must not be linear combinations of each other")
+    # Forward and back substitution: L·Lᵀ·b = Xᵀy
+    scaled = np.linalg.solve(lower.T, np.linalg.solve(lower, s_xy / scale))
+    coefficients = scaled / scale
+    intercept = moments.means[-1] - coefficients @ moments.means[:-1]
+
+    # Residual sum of squares, clipped because of rounding errors
+    rss = max(s_yy - coefficients @ s_xy, 0.0)
+    r_squared = 1 - rss / s_yy if s_yy > 0 else 0.0
+    # Degrees of freedom of the residuals
+    dof = moments.n - len(coefficients) - 1
+    adjusted = 1 - (1 - r_squared) * (moments.n - 1) / dof if dof > 0 else float("nan")
+    return MultipleOLSFit(float(intercept), coefficients, float(r_squared),
+                          float(adjusted), float(rss / moments.n))
+
+
+def fit_multiple(X, y, block_size=BLOCK_SIZE):
+    """
+    Fit a multiple linear regression with the normal equations.
+
+    Parameters:
+        - X (array-like): Feature values, one column per feature.
+        - y (array-like): Target values, as many as rows of X.
+        - block_size (int, optional): Rows processed at a time.
+
+    Returns:
+        - MultipleOLSFit: Intercept, coefficients, R², adjusted R² and mean
+          squared error.
+
+    Raises:
+        - ValueError: If there are no rows, the lengths do not match or the
+          features are constant or collinear.
+    """
+    return solve_multiple(compute_cross_moments(X, y, block_size))
+
+
+# Functions that fit a simple linear regression, by name
+ENGINES = {
+    "numpy": fit,
+    "statsmodels": fit_statsmodels,
+}
+DEFAULT_ENGINE = "numpy"
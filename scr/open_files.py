@@ -1,9 +1,30 @@
 import pandas as pd
-import sqlite3
-from sqlalchemy import create_engine
 import os
-from exceptions import FileNotSelectedError, FileFormatError, EmptyDataError
+import zipfile
+import itertools
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from exceptions import (FileNotSelectedError, FileFormatError, EmptyDataError,
+                        ColumnNotFoundError)
+from dataset_cache import file_fingerprint
+from dtype_optimizer import optimize_dtypes
+from sqlite_reader import (get_connection, read_table, recent_tables, quote_identifier,
+                           sample_table)
+from sampling import reservoir_sample, SampleInfo
+from arrow_reader import read_arrow, arrow_schema, head_arrow
+from shard_loader import is_shard_pattern, expand_shards, check_same_columns, combine_frames
+from excel_reader import (read_excel, iter_excel, excel_columns, EXCEL_CELL_BYTES,
+                          STREAMING_EXTENSIONS as EXCEL_STREAMING_EXTENSIONS)
 
+# Default memory ceiling (in bytes) for each chunk produced in streaming mode
+DEFAULT_MEMORY_LIMIT = 64 * 1024 ** 2
+# Number of rows parsed to estimate the in-memory size of a row
+SAMPLE_ROWS = 1000
+# Number of rows read to show a file before it is fully loaded
+PREVIEW_ROWS = 2000
+# Compression of each CSV extension, as named by pandas
+CSV_COMPRESSIONS = {'.csv': None, '.csv.gz': 'gzip', '.csv.bz2': 'bz2', '.csv.xz': 'xz',
+                    '.zip': 'zip'}
 
 # Common function to check if different types of files are empty
 def check_dataframe_empty(df, source):
@@ -25,12 +46,14 @@ def check_dataframe_empty(df, source):
     return df
 
 
-def open_csv(file_path):
+def open_csv(file_path, columns=None):
     """
     Open and read a CSV file into a DataFrame.
 
     Parameters
         - file_path (str): Path to the CSV file.
+        - columns (list, optional): Columns to read. The others are skipped
+          while parsing. By default every column is read.
 
     Returns:
         - pandas.DataFrame: DataFrame containing the CSV data.
@@ -39,99 +62,1118 @@ def open_csv(file_path):
         - EmptyDataError: If the CSV file is empty.
     """
     try:
-        return pd.read_csv(file_path)
+        df = pd.read_csv(file_path, usecols=columns)
     except pd.errors.EmptyDataError:  # Check if it is empty for CSV
         raise EmptyDataError("The CSV file does not contain data.")
+    # usecols keeps the file order, return the requested one
+    return df if columns is None else df[columns]
 
 
-def open_excel(file_path):
+def estimate_chunksize(file_path, memory_limit=DEFAULT_MEMORY_LIMIT, columns=None):
     """
-    Open and read an Excel file into a DataFrame.
+    Estimate how many CSV rows fit in a chunk without exceeding a memory limit.
+
+    The size of a row is measured on the first rows of the file, so the
+    estimate is only as good as that sample is representative.
+
+    Parameters:
+        - file_path (str): Path to the CSV file.
+        - memory_limit (int): Maximum size in bytes of each chunk.
+        - columns (list, optional): Columns that will be read.
+
+    Returns:
+        - int: Number of rows per chunk (at least 1).
+
+    Raises:
+        - EmptyDataError: If the CSV file is empty.
+        - ValueError: If the memory limit is not positive.
+    """
+    if memory_limit <= 0:
+        raise ValueError("The memory limit must be a positive number of bytes.")
+
+    try:
+        sample = pd.read_csv(file_path, nrows=SAMPLE_ROWS, usecols=columns)
+    except pd.errors.EmptyDataError:
+        raise EmptyDataError("The CSV file does not contain data.")
+
+    if sample.empty:  # Only a header, every chunk would be empty
+        return SAMPLE_ROWS
+
+    # Deep memory usage also counts the Python strings of object columns
+    row_size = sample.memory_usage(index=False, deep=True).sum() / len(sample)
+    return max(1, int(memory_limit // max(row_size, 1)))
+
+
+def iter_csv_chunks(file_path, chunksize=None, memory_limit=DEFAULT_MEMORY_LIMIT,
+                    columns=None):
+    """
+    Read a CSV file lazily as a sequence of bounded-size DataFrames.
+
+    Only one chunk is kept in memory at a time, so files larger than the
+    available RAM can be processed as long as the consumer does not keep
+    every chunk alive.
+
+    Parameters:
+        - file_path (str): Path to the CSV file.
+        - chunksize (int, optional): Number of rows per chunk. If not given,
+          it is estimated from memory_limit.
+        - memory_limit (int): Maximum size in bytes of each chunk, used when
+          chunksize is not given.
+        - columns (list, optional): Columns to read. By default every column
+          is read.
+
+    Returns:
+        - generator: Generator of pandas.DataFrame chunks sharing the same columns.
+
+    Raises:
+        - EmptyDataError: If the CSV file is empty.
+    """
+    # Validate eagerly so errors are not delayed until the first iteration
+    if chunksize is None:
+        chunksize = estimate_chunksize(file_path, memory_limit, columns)
+    else:
+        try:
+            pd.read_csv(file_path, nrows=0)  # Only parses the header
+        except pd.errors.EmptyDataError:
+            raise EmptyDataError("The CSV file does not contain data.")
+
+    def generate_chunks():
+        with pd.read_csv(file_path, chunksize=chunksize, usecols=columns) as reader:
+            for chunk in reader:
+                yield chunk if columns is None else chunk[columns]
+
+    return generate_chunks()
+
+
+def read_csv_with_progress(file_path, progress, columns=None, compression=None,
+                           memory_limit=DEFAULT_MEMORY_LIMIT):
+    """
+    Read a CSV file into a DataFrame, reporting how much of it has been read.
+
+    The file is parsed in chunks of bounded size, and after each chunk the
+    fraction of the bytes of the file read so far is reported. For compressed
+    files it is the fraction of the compressed bytes.
+
+    Parameters:
+        - file_path (str): Path to the CSV file.
+        - progress (callable): Function called with a fraction between 0 and 1.
+        - columns (list, optional): Columns to read. By default every column.
+        - compression (str, optional): Compression of the file ('gzip', 'bz2',
+          'xz' or 'zip'), None for plain CSV files.
+        - memory_limit (int, optional): Maximum size in bytes of each chunk.
+
+    Returns:
+        - pandas.DataFrame: DataFrame containing the CSV data.
+
+    Raises:
+        - EmptyDataError: If the CSV file is empty.
+    """
+    chunksize = estimate_chunksize(file_path, memory_limit, columns)
+    size = max(os.path.getsize(file_path), 1)
+    chunks = []
+    with open(file_path, "rb") as f:
+        with pd.read_csv(f, chunksize=chunksize, usecols=columns,
+                         compression=compression) as reader:
+            for chunk in reader:
+                chunks.append(chunk)
+                progress(min(f.tell() / size, 1.0))
+    df = pd.concat(chunks, ignore_index=True)
+    return df if columns is None else df[columns]
+
+
+def open_excel(file_path, columns=None, sheet=None):
+    """
+    Open and read a sheet of an Excel file into a DataFrame.
+
+    .xlsx files are opened in read-only mode and their rows are streamed and
+    converted into typed columns in batches, so the workbook object model is
+    never built and the other sheets are not parsed.
 
     Parameters:
         - file_path (str):Path to the Excel file.
+        - columns (list, optional): Columns to read. By default every column
+          is read.
+        - sheet (str or int, optional): Name or position of the sheet. By
+          default, the first sheet.
 
     Returns
         - pandas.DataFrame: DataFrame containing the Excel data.
 
     Raises:
-        - EmptyDataError: If the Excel file is empty.
+        - EmptyDataError: If the Excel file or sheet is empty, or the sheet
+          does not exist.
     """
-    df = pd.read_excel(file_path)
+    df = read_excel(file_path, sheet=sheet, columns=columns)
     return check_dataframe_empty(df, "Excel file")
 
 
-def open_sql(file_path):
+def iter_excel_chunks(file_path, memory_limit=DEFAULT_MEMORY_LIMIT, columns=None,
+                      sheet=None):
+    """
+    Read a sheet of an .xlsx file lazily as a sequence of bounded-size DataFrames.
+
+    Parameters:
+        - file_path (str): Path to the .xlsx file.
+        - memory_limit (int): Approximate maximum size in bytes of the rows
+          buffered for each chunk.
+        - columns (list, optional): Columns to read. By default every column
+          is read.
+        - sheet (str or int, optional): Name or position of the sheet. By
+          default, the first sheet.
+
+    Returns:
+        - generator: Generator of pandas.DataFrame chunks sharing the same columns.
+
+    Raises:
+        - ValueError: If the memory limit is not positive.
+        - EmptyDataError: If the sheet is empty or does not exist.
+    """
+    if memory_limit <= 0:
+        raise ValueError("The memory limit must be a positive number of bytes.")
+    width = len(columns) if columns is not None else len(excel_columns(file_path, sheet))
+    batch_size = max(1, memory_limit // (EXCEL_CELL_BYTES * max(width, 1)))
+    return iter_excel(file_path, sheet=sheet, batch_size=batch_size, columns=columns)
+
+
+def get_first_table(conn):
+    """
+    Get the name of the table read by default from a SQLite database.
+
+    Indexes, triggers and internal tables are skipped. Views are only used
+    when the database has no tables.
+
+    Parameters:
+        - conn (sqlite3.Connection): Connection to the database.
+
+    Returns:
+        - str: Name of the table.
+
+    Raises:
+        - EmptyDataError: If the database has no tables.
+    """
+    res = conn.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%' "
+        "ORDER BY type = 'view', rowid")
+    # Checks that a table exists before accessing it
+    result = res.fetchone()
+    if result is None:  # If it does not exist, it throws an exception
+        raise EmptyDataError("The database does not contain any tables.")
+    return result[0]
+
+
+def check_table_exists(conn, table):
+    """
+    Verify that a SQLite database contains a table or view.
+
+    Parameters:
+        - conn (sqlite3.Connection): Connection to the database.
+        - table (str): Name of the table or view.
+
+    Raises:
+        - EmptyDataError: If the table does not exist.
+    """
+    result = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?",
+        (table,)).fetchone()
+    if result is None:
+        raise EmptyDataError(f"The database does not contain the table '{table}'.")
+
+
+def open_sql(file_path, columns=None, table=None):
     """Open and read a SQLite database table into a DataFrame.
 
+    The database is read through a pooled read-only connection, so opening
+    it again reuses the same connection. The last tables read are kept in
+    memory, so switching back to one of them does not read it again.
+
     Parameters:
         - file_path (str): Path to the SQLite database file.
+        - columns (list, optional): Columns to read, only these are selected
+          in the query. By default every column is read.
+        - table (str, optional): Table or view to read. By default, the first
+          table of the database.
 
     Returns:
         - pandas.DataFrame: DataFrame containing the database table data.
 
     Raises:
-        - EmptyDataError: If the database has no tables or if the table is empty.
+        - EmptyDataError: If the database has no tables, if the table does
+          not exist or if the table is empty.
     """
-    conn = sqlite3.connect(file_path)  # Creates a conexion with the database
-    cur = conn.cursor()  # Create a cursor to execute SQL statements
-    res = cur.execute("SELECT name FROM sqlite_master")
+    conn = get_connection(file_path)  # Pooled connection, it is not closed
+    if table is None:
+        table = get_first_table(conn)
+    else:
+        check_table_exists(conn, table)
 
-    try:
-        # Checks that a table exists before accessing it
-        result = res.fetchone()
-        if result is None:  # If it does not exist, it throws an exception
-            raise EmptyDataError("The database does not contain any tables.")
-
-        table_name = result[0]  # Access the table (assume there is only 1)
-        # Loads the table in a DataFrame
-        # Create an engine object
-        engine = create_engine('sqlite:///' + str(file_path))
+    df = recent_tables.get(file_path, table)
+    if df is None:
         # Load the table into a DataFrame
-        df = pd.read_sql_table(table_name, engine)
-        engine.dispose()
-        return check_dataframe_empty(df, "database table")
-    finally:
-        conn.close()  # Ends the connection
+        df = check_dataframe_empty(read_table(file_path, table), "database table")
+        # Read-only columns, shared with the cached table
+        df = recent_tables.put(file_path, table, df)
+    # Selecting columns of a cached table does not read the others
+    return df if columns is None else df[columns]
 
 
-def open_file(file_path):
+def open_arrow(file_path, columns=None, filters=None):
     """
-    Open and read data from various file formats into a DataFrame.
+    Open and read a Parquet, Feather or Arrow IPC file into a DataFrame.
 
-    Supports CSV, Excel (.xlsx, .xls), and SQLite (.db, .sqlite) files.
+    These formats need the optional dependency pyarrow. The file is
+    memory-mapped and only the requested columns and matching row groups
+    are read, so opening a large file costs the size of the data used.
 
     Parameters:
-        - file_path (str):Path to the file to open.
+        - file_path (str): Path to the file.
+        - columns (list, optional): Columns to read. By default every column is read.
+        - filters (list, optional): Row filters such as [("year", ">=", 2020)].
 
-    Returns
+    Returns:
         - pandas.DataFrame: DataFrame containing the file data.
 
+    Raises:
+        - FileFormatError: If pyarrow is not installed or the file cannot be read.
+        - EmptyDataError: If no rows are read.
+    """
+    return check_dataframe_empty(read_arrow(file_path, columns, filters), "file")
+
+
+# Result of probing a file without reading all of its data: the columns
+# mapped to their pandas dtype names, and whether it has no data rows
+SourceProbe = namedtuple("SourceProbe", ["columns", "empty"])
+
+# Pandas dtype of each SQLite type affinity
+SQLITE_AFFINITY_DTYPES = (
+    ("INT", "int64"),
+    ("CHAR", "object"),
+    ("CLOB", "object"),
+    ("TEXT", "object"),
+    ("BLOB", "object"),
+    ("REAL", "float64"),
+    ("FLOA", "float64"),
+    ("DOUB", "float64"),
+)
+
+
+def _sqlite_dtype(declared_type, first_value=None):
+    """
+    Infer the pandas dtype of a SQLite column from its declared type.
+
+    It follows the SQLite type affinity rules: the first matching substring
+    wins and unknown types have NUMERIC affinity. Columns without a declared
+    type (e.g. computed columns of a view) store values as they are, so
+    their dtype is inferred from their first value, as read_table does.
+
+    Parameters:
+        - declared_type (str): Type in the CREATE TABLE statement.
+        - first_value (optional): Value of the column in the first row, None
+          if it is NULL or the table has no rows.
+
+    Returns:
+        - str: Name of the pandas dtype.
+    """
+    declared_type = declared_type.upper()
+    if not declared_type:
+        if isinstance(first_value, (str, bytes)):
+            return "object"
+        return "float64" if isinstance(first_value, float) else "int64"
+    for substring, dtype in SQLITE_AFFINITY_DTYPES:
+        if substring in declared_type:
+            return dtype
+    return "float64"
+
+
+def probe_csv(file_path):
+    """
+    Probe a CSV file: its columns and dtypes, inferred from its first rows.
+
+    Parameters:
+        - file_path (str): Path to the CSV file.
+
+    Returns:
+        - SourceProbe: Columns of the file and whether it has no data rows.
+
+    Raises:
+        - EmptyDataError: If the CSV file is empty.
+    """
+    try:
+        sample = pd.read_csv(file_path, nrows=SAMPLE_ROWS)
+    except pd.errors.EmptyDataError:
+        raise EmptyDataError("The CSV file does not contain data.")
+    return SourceProbe({column: str(dtype) for column, dtype in sample.dtypes.items()},
+                       sample.empty)
+
+
+def probe_excel(file_path, sheet=None):
+    """
+    Probe an Excel sheet: its columns and dtypes, inferred from its first rows.
+
+    Parameters:
+        - file_path (str): Path to the Excel file.
+        - sheet (str or int, optional): Name or position of the sheet. By
+          default, the first sheet.
+
+    Returns:
+        - SourceProbe: Columns of the sheet and whether it has no data rows.
+
+    Raises:
+        - EmptyDataError: If the sheet does not exist, or a sheet that was
+          asked for is empty.
+    """
+    if os.path.splitext(file_path)[1] in EXCEL_STREAMING_EXTENSIONS:
+        try:
+            batches = iter_excel(file_path, sheet=sheet, batch_size=SAMPLE_ROWS)
+        except EmptyDataError:
+            if sheet is not None:  # Missing sheet
+                raise
+            return SourceProbe({}, True)  # No header, same result as pandas
+        sample = next(batches, None)
+        batches.close()  # Closes the workbook without reading more rows
+        if sample is None:  # Only the header
+            return SourceProbe({column: "object" for column in excel_columns(file_path, sheet)},
+                               True)
+    else:
+        sample = pd.read_excel(file_path, nrows=SAMPLE_ROWS,
+                               sheet_name=0 if sheet is None else sheet)
+    return SourceProbe({column: str(dtype) for column, dtype in sample.dtypes.items()},
+                       sample.empty)
+
+
+def probe_sql(file_path, table=None):
+    """
+    Probe a SQLite table: its columns and dtypes, from the table definition.
+
+    Only the schema and the first row are queried, whatever the size of the
+    table. The dtypes of the columns without a declared type are inferred
+    from the first row.
+
+    Parameters:
+        - file_path (str): Path to the SQLite database file.
+        - table (str, optional): Table or view. By default, the first table.
+
+    Returns:
+        - SourceProbe: Columns of the table and whether it has no rows.
+
+    Raises:
+        - EmptyDataError: If the database has no tables or the table does not exist.
+    """
+    conn = get_connection(file_path)
+    if table is None:
+        table = get_first_table(conn)
+    else:
+        check_table_exists(conn, table)
+    rows = conn.execute(
+        "SELECT name, type FROM pragma_table_info(?)", (table,)).fetchall()
+    first_row = conn.execute(
+        f"SELECT {', '.join(quote_identifier(name) for name, _ in rows)} "
+        f"FROM {quote_identifier(table)} LIMIT 1").fetchone()
+    first_values = first_row if first_row is not None else [None] * len(rows)
+    return SourceProbe({name: _sqlite_dtype(declared_type, value)
+                        for (name, declared_type), value in zip(rows, first_values)},
+                       first_row is None)
+
+
+def probe_arrow(file_path):
+    """
+    Probe a Parquet, Feather or Arrow file: its columns and dtypes, from its schema.
+
+    Only the footer is read, and the first row group or record batch to know
+    if the file has rows.
+
+    Parameters:
+        - file_path (str): Path to the file.
+
+    Returns:
+        - SourceProbe: Columns of the file and whether it has no rows.
+
+    Raises:
+        - FileFormatError: If pyarrow is not installed or the file cannot be read.
+    """
+    return SourceProbe(arrow_schema(file_path), head_arrow(file_path, 1).empty)
+
+
+def preview_csv(file_path, rows=PREVIEW_ROWS):
+    """
+    Read the first rows of a CSV file.
+
+    Parameters:
+        - file_path (str): Path to the CSV file.
+        - rows (int, optional): Maximum number of rows.
+
+    Returns:
+        - pandas.DataFrame: The first rows.
+
+    Raises:
+        - EmptyDataError: If the CSV file is empty.
+    """
+    try:
+        return pd.read_csv(file_path, nrows=rows)
+    except pd.errors.EmptyDataError:
+        raise EmptyDataError("The CSV file does not contain data.")
+
+
+def preview_excel(file_path, rows=PREVIEW_ROWS, sheet=None):
+    """
+    Read the first rows of an Excel sheet.
+
+    Parameters:
+        - file_path (str): Path to the Excel file.
+        - rows (int, optional): Maximum number of rows.
+        - sheet (str or int, optional): Name or position of the sheet. By
+          default, the first sheet.
+
+    Returns:
+        - pandas.DataFrame: The first rows.
+
+    Raises:
+        - EmptyDataError: If the sheet is empty or does not exist.
+    """
+    if os.path.splitext(file_path)[1] in EXCEL_STREAMING_EXTENSIONS:
+        batches = iter_excel(file_path, sheet=sheet, batch_size=rows)
+        sample = next(batches, None)
+        batches.close()  # Closes the workbook without reading more rows
+        if sample is None:  # Only the header
+            return pd.DataFrame(columns=excel_columns(file_path, sheet))
+        return sample
+    return pd.read_excel(file_path, nrows=rows, sheet_name=0 if sheet is None else sheet)
+
+
+def preview_sql(file_path, rows=PREVIEW_ROWS, table=None):
+    """
+    Read the first rows of a SQLite table.
+
+    Parameters:
+        - file_path (str): Path to the SQLite database file.
+        - rows (int, optional): Maximum number of rows.
+        - table (str, optional): Table or view. By default, the first table.
+
+    Returns:
+        - pandas.DataFrame: The first rows.
+
+    Raises:
+        - EmptyDataError: If the database has no tables or the table does not exist.
+    """
+    conn = get_connection(file_path)
+    if table is None:
+        table = get_first_table(conn)
+    else:
+        check_table_exists(conn, table)
+    return read_table(file_path, table, limit=rows)
+
+
+def numeric_columns(schema):
+    """
+    Get the numeric columns of a schema returned by probe_schema.
+
+    Parameters:
+        - schema (dict): Column names mapped to pandas dtype names.
+
+    Returns:
+        - list: Names of the columns with a numeric dtype.
+    """
+    return [column for column, dtype in schema.items()
+            if pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype))
+            and dtype != "bool"]
+
+
+# Compressed CSV files, decompressed by pandas while they are parsed
+COMPRESSED_CSV_EXTENSIONS = ('.csv.gz', '.csv.bz2', '.csv.xz', '.zip')
+EXTENSIONS = ('.csv', '.xlsx', '.xls', '.db', '.sqlite', '.parquet',
+              '.feather', '.arrow') + COMPRESSED_CSV_EXTENSIONS  # Possible extensions
+EXTENSION_MAP = {'.csv': open_csv, '.xlsx': open_excel, '.xls': open_excel,
+                 '.db': open_sql, '.sqlite': open_sql, '.parquet': open_arrow,
+                 '.feather': open_arrow, '.arrow': open_arrow,
+                 **dict.fromkeys(COMPRESSED_CSV_EXTENSIONS, open_csv)}
+PROBE_MAP = {'.csv': probe_csv, '.xlsx': probe_excel, '.xls': probe_excel,
+             '.db': probe_sql, '.sqlite': probe_sql, '.parquet': probe_arrow,
+             '.feather': probe_arrow, '.arrow': probe_arrow,
+             **dict.fromkeys(COMPRESSED_CSV_EXTENSIONS, probe_csv)}
+# Description of the data source of each format, for error messages
+EMPTY_SOURCES = {'.csv': 'CSV file', '.xlsx': 'Excel file', '.xls': 'Excel file',
+                 '.db': 'database table', '.sqlite': 'database table', '.parquet': 'file',
+                 '.feather': 'file', '.arrow': 'file',
+                 **dict.fromkeys(COMPRESSED_CSV_EXTENSIONS, 'CSV file')}
+# Formats that can be read in chunks
+STREAM_MAP = {'.csv': iter_csv_chunks, '.xlsx': iter_excel_chunks,
+              **dict.fromkeys(COMPRESSED_CSV_EXTENSIONS, iter_csv_chunks)}
+PREVIEW_MAP = {'.csv': preview_csv, '.xlsx': preview_excel, '.xls': preview_excel,
+               '.db': preview_sql, '.sqlite': preview_sql, '.parquet': head_arrow,
+               '.feather': head_arrow, '.arrow': head_arrow,
+               **dict.fromkeys(COMPRESSED_CSV_EXTENSIONS, preview_csv)}
+SQL_EXTENSIONS = ('.db', '.sqlite')  # Formats with several tables
+SAMPLE_EXTENSIONS = tuple(STREAM_MAP) + SQL_EXTENSIONS  # Formats that can be sampled
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')  # Formats with several sheets
+ARROW_EXTENSIONS = ('.parquet', '.feather', '.arrow')  # Formats with row filters
+
+
+def get_extension(file_path):
+    """
+    Check that a file can be opened and get its extension.
+
+    Parameters:
+        - file_path (str): Path to the file.
+
+    Compressed CSV files have a compound extension such as '.csv.gz'.
+
+    Returns:
+        - str: Extension of the file (including the dot).
+
     Raises:
         - FileNotSelectedError: If the file path is empty.
         - FileNotFoundError: If the file does not exist.
-        - FileFormatError: If the file format is not supported.
-        - EmptyDataError: If the file or database table is empty.
+        - FileFormatError: If the file format is not supported, or a ZIP
+          archive does not contain exactly one CSV file.
     """
     # Check if there is a filepath
     if file_path == "":
         raise FileNotSelectedError("You haven't selected any files.")
-    
+
     # Check if the file exists
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file '{file_path}' does not exist.")
 
-    EXTENSIONS = ('.csv', '.xlsx', '.xls', '.db',
-                  '.sqlite')  # Possible extensions
-    EXTENSION_MAP = {'.csv': open_csv, '.xlsx': open_excel, '.xls': open_excel,
-                     '.db': open_sql, '.sqlite': open_sql}
-
-    _, extension = os.path.splitext(file_path)  # Extract the extension
+    root, extension = os.path.splitext(file_path)  # Extract the extension
+    if extension in ('.gz', '.bz2', '.xz'):  # Compression of another format
+        extension = os.path.splitext(root)[1] + extension
 
     # Check that valid file is being passed
     if extension not in EXTENSIONS:
         raise FileFormatError(
-            "Invalid file format. (Valid: .csv, .xlsx, .xls, .db, .sqlite).")
+            "Invalid file format. (Valid: .csv, .xlsx, .xls, .db, .sqlite, "
+            ".parquet, .feather, .arrow, .csv.gz, .csv.bz2, .csv.xz, .zip).")
+    if extension == '.zip':
+        check_zip_csv(file_path)
+    return extension
+
+
+def check_zip_csv(file_path):
+    """
+    Check that a ZIP archive contains a single file, the CSV file pandas reads.
+
+    Only the directory at the end of the archive is read. The name of the file
+    is not checked, archives written by pandas name it after the archive.
+
+    Parameters:
+        - file_path (str): Path to the ZIP archive.
+
+    Raises:
+        - FileFormatError: If the file is not a ZIP archive or it does not
+          contain exactly one file.
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            names = [name for name in archive.namelist() if not name.endswith('/')]
+    except zipfile.BadZipFile:
+        raise FileFormatError("The file is not a valid ZIP archive.")
+    if len(names) != 1:
+        raise FileFormatError("The ZIP archive must contain a single CSV file.")
+
+
+def probe_file(file_path, table=None):
+    """
+    Check if a file has data and get its columns without reading all of it.
+
+    Only the first rows (CSV and Excel), the schema and first row (SQLite) or
+    the footer and first row group (Parquet, Feather and Arrow) are read, so
+    it takes about the same time whatever the size of the file.
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - table (str, optional): Table or view of a SQLite database, or sheet
+          of an Excel file. By default, the first one.
+
+    Returns:
+        - SourceProbe: Columns of the file mapped to their pandas dtype names
+          (see probe_schema) and whether it has no data rows.
+
+    Raises:
+        - FileNotSelectedError: If the file path is empty.
+        - FileNotFoundError: If the file does not exist.
+        - FileFormatError: If the file format is not supported, or a table is
+          given for a file that is not a SQLite database or an Excel file.
+        - EmptyDataError: If the file is empty, the database has no tables or
+          the table or sheet does not exist.
+    """
+    extension = get_extension(file_path)
+    return PROBE_MAP[extension](file_path, **_reader_options(extension, table))
+
+
+def probe_schema(file_path, table=None):
+    """
+    Get the columns of a file and their dtypes without reading all of its data.
+
+    CSV and Excel dtypes are inferred from the first rows, SQLite dtypes from
+    the declared column types, so they may differ from the ones of the full
+    DataFrame (e.g. an integer column with missing values further down).
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - table (str, optional): Table or view of a SQLite database, or sheet
+          of an Excel file. By default, the first one.
+
+    Returns:
+        - dict: Column names mapped to their pandas dtype names, in file order.
+
+    Raises:
+        - FileNotSelectedError: If the file path is empty.
+        - FileNotFoundError: If the file does not exist.
+        - FileFormatError: If the file format is not supported, or a table is
+          given for a file that is not a SQLite database or an Excel file.
+        - EmptyDataError: If the file is empty, the database has no tables or
+          the table or sheet does not exist.
+    """
+    return probe_file(file_path, table).columns
+
+
+def open_preview(file_path, rows=PREVIEW_ROWS, table=None):
+    """
+    Read the first rows of a file, to show it while it is fully loaded.
+
+    Only the beginning of the file is read, so it takes about the same time
+    whatever the size of the file. For a directory or glob pattern, the
+    first rows of its first file are read.
+
+    Parameters:
+        - file_path (str): Path to the file, or a directory or glob pattern.
+        - rows (int, optional): Maximum number of rows.
+        - table (str, optional): Table or view of a SQLite database, or sheet
+          of an Excel file. By default, the first one.
+
+    Returns:
+        - pandas.DataFrame: The first rows of the file.
+
+    Raises:
+        - FileNotSelectedError: If the file path is empty.
+        - FileNotFoundError: If the file does not exist.
+        - FileFormatError: If the file format is not supported, or a table is
+          given for a file that is not a SQLite database or an Excel file.
+        - EmptyDataError: If the file has no data rows, the database has no
+          tables or the table or sheet does not exist.
+    """
+    if is_shard_pattern(file_path):
+        if table is not None:
+            raise FileFormatError("Tables are not available when opening several files.")
+        file_path = expand_shards(file_path, EXTENSIONS)[0]
+    extension = get_extension(file_path)
+    preview = PREVIEW_MAP[extension](file_path, rows, **_reader_options(extension, table))
+    return check_dataframe_empty(preview, EMPTY_SOURCES[extension])
+
+
+def _reader_options(extension, table=None, filters=None):
+    """
+    Get the format-specific keyword arguments of the reader of a file.
+
+    Parameters:
+        - extension (str): Extension of the file.
+        - table (str, optional): Table of a database or sheet of a workbook,
+          or None for the first one.
+        - filters (list, optional): Row filters, or None to read every row.
+
+    Returns:
+        - dict: {'table': table} for SQLite files, {'sheet': table} for Excel
+          files and {'filters': filters} for Parquet, Feather and Arrow files,
+          only with the options given.
+
+    Raises:
+        - FileFormatError: If a table is given for a file that is not a SQLite
+          database or an Excel file, or filters for a file that is not in a
+          columnar format.
+    """
+    options = {}
+    if table is not None:
+        if extension in SQL_EXTENSIONS:
+            options['table'] = table
+        elif extension in EXCEL_EXTENSIONS:
+            options['sheet'] = table
+        else:
+            raise FileFormatError(
+                "Only SQLite databases and Excel files contain tables or sheets.")
+    if filters:
+        if extension not in ARROW_EXTENSIONS:
+            raise FileFormatError(
+                "Row filters are only available for Parquet, Feather and Arrow files.")
+        options['filters'] = filters
+    return options
+
+
+def open_file(file_path, stream=False, memory_limit=DEFAULT_MEMORY_LIMIT, cache=None,
+              columns=None, table=None, filters=None, optimize=False, workers=None,
+              progress=None, sample=None, seed=None):
+    """
+    Open and read data from various file formats into a DataFrame.
+
+    Supports CSV, Excel (.xlsx, .xls), and SQLite (.db, .sqlite) files.
+    A directory or a glob pattern opens several files with the same columns
+    as a single dataset (see open_shards).
+
+    Parameters:
+        - file_path (str):Path to the file to open, or a directory or glob
+          pattern (e.g. "data/2024-*.csv").
+        - stream (bool, optional): If True, return a generator of DataFrame
+          chunks instead of a single DataFrame. Only available for CSV files.
+        - memory_limit (int, optional): Maximum size in bytes of each chunk
+          in streaming mode.
+        - cache (DatasetCache, optional): Cache of parsed datasets. If the file
+          has not changed since it was cached, it is loaded from the cache
+          instead of being parsed again. A dataset first read with optimize is
+          cached with its optimized dtypes. Not used in streaming mode.
+        - columns (list, optional): Columns to read (e.g. the feature and the
+          target). The other columns are not parsed. By default every column
+          is read.
+        - table (str, optional): Table or view to read from a SQLite database,
+          or sheet to read from an Excel file. By default, the first one.
+        - filters (list, optional): Row filters for Parquet, Feather and Arrow
+          files, e.g. [("year", ">=", 2020)]. Parquet row groups whose
+          statistics cannot match are not read.
+        - optimize (bool, optional): If True, store each column in the
+          narrowest dtype that keeps its values (see optimize_dtypes) and save
+          the memory footprint before and after in df.attrs["memory_report"].
+          Not used in streaming mode.
+        - workers (int, optional): Number of processes that parse the files
+          of a directory or glob pattern. By default, one per CPU core.
+        - progress (callable, optional): Function called with the fraction of
+          the data read so far, between 0 and 1. CSV files report it after
+          each chunk and directories after each file; other formats only
+          report 1 once they are read. Not used in streaming mode.
+        - sample (int, optional): Number of rows of a uniform random sample to
+          read instead of every row, for CSV, .xlsx and SQLite files (see
+          open_sample). If the file has more rows, the sample is described in
+          df.attrs["sample"] as a SampleInfo.
+        - seed (int, optional): Seed of the random sample.
+
+    Returns
+        - pandas.DataFrame: DataFrame containing the file data, or a generator
+          of DataFrame chunks if stream is True.
+
+    Raises:
+        - FileNotSelectedError: If the file path is empty.
+        - FileNotFoundError: If the file does not exist.
+        - FileFormatError: If the file format is not supported, cannot be
+          read in streaming mode or sampled, or a table or filters are given
+          for a file that does not support them.
+        - ColumnNotFoundError: If any of the requested columns does not exist.
+        - SchemaMismatchError: If the files of a directory or glob pattern do
+          not have the same columns.
+        - EmptyDataError: If the file, database table or sheet is empty, or
+          the table or sheet does not exist.
+    """
+    if sample is not None and stream:
+        raise FileFormatError("A sample cannot be read in streaming mode.")
+
+    if is_shard_pattern(file_path):
+        if table is not None or filters:
+            raise FileFormatError(
+                "Tables and filters are not available when opening several files.")
+        if sample is not None:
+            # The files are streamed one after another through the reservoir
+            chunks = open_shards(file_path, stream=True, memory_limit=memory_limit,
+                                 columns=columns)
+            return _finish_sample(*reservoir_sample(chunks, sample, seed), seed,
+                                  optimize, progress)
+        return open_shards(file_path, stream=stream, memory_limit=memory_limit,
+                           columns=columns, optimize=optimize, workers=workers,
+                           progress=progress)
+
+    extension = get_extension(file_path)
+    options = _reader_options(extension, table, filters)
+
+    # Fail before parsing if the file has no rows or a column is missing
+    probe = PROBE_MAP[extension](file_path, **_reader_options(extension, table))
+    if probe.empty:
+        raise EmptyDataError(f"The {EMPTY_SOURCES[extension]} does not contain data.")
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))  # No duplicates
+        _check_columns(probe.columns, columns)
+
+    if stream:
+        if extension not in STREAM_MAP:
+            raise FileFormatError(
+                "Streaming mode is only available for CSV and .xlsx files.")
+        return STREAM_MAP[extension](file_path, memory_limit=memory_limit,
+                                     columns=columns, **options)
+
+    if sample is not None:
+        return _finish_sample(*open_sample(file_path, sample, seed, table, columns,
+                                           memory_limit), seed, optimize, progress)
+
+    df = _read_file(file_path, extension, cache, columns, table, options, progress, optimize)
+    # Datasets cached after optimizing them are not optimized again
+    if optimize and not df.attrs.get("optimized"):
+        df = _optimize(df)
+    if progress is not None:
+        progress(1.0)
+    return df
+
+
+def open_sample(file_path, size, seed=None, table=None, columns=None,
+                memory_limit=DEFAULT_MEMORY_LIMIT):
+    """
+    Read a uniform random sample of the rows of a file in one pass.
+
+    CSV and .xlsx files are streamed in chunks through a reservoir, so only
+    the sample and one chunk are in memory. SQLite tables are sampled by
+    their rowids and only the sampled rows are read.
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - size (int): Number of rows of the sample.
+        - seed (int, optional): Seed of the random generator.
+        - table (str, optional): Table of a SQLite database or sheet of an
+          Excel file. By default, the first one.
+        - columns (list, optional): Columns to read. By default every column.
+        - memory_limit (int, optional): Maximum size in bytes of each chunk.
+
+    Returns:
+        - tuple: The sample, with the rows in file order, and the number of
+          rows of the file.
+
+    Raises:
+        - FileFormatError: If the format cannot be sampled.
+        - ValueError: If size is not positive.
+    """
+    extension = get_extension(file_path)
+    options = _reader_options(extension, table)
+    if extension in SQL_EXTENSIONS:
+        if table is None:
+            table = get_first_table(get_connection(file_path))
+        return sample_table(file_path, table, size, seed, columns)
+    if extension not in SAMPLE_EXTENSIONS:
+        raise FileFormatError("Samples are only available for CSV, .xlsx and SQLite files.")
+    chunks = STREAM_MAP[extension](file_path, memory_limit=memory_limit, columns=columns,
+                                   **options)
+    return reservoir_sample(chunks, size, seed)
+
+
+def _finish_sample(df, total_rows, seed, optimize, progress):
+    """
+    Describe a sample in its attributes and optimize its dtypes.
+
+    Parameters:
+        - df (pandas.DataFrame): The sample.
+        - total_rows (int): Number of rows of the source.
+        - seed (int): Seed of the sample, or None.
+        - optimize (bool): If True, downcast the dtypes (see open_file).
+        - progress (callable): Function called with 1 at the end, or None.
+
+    Returns:
+        - pandas.DataFrame: The sample.
+
+    Raises:
+        - EmptyDataError: If the sample has no rows.
+    """
+    check_dataframe_empty(df, "file")
+    if optimize:
+        df = _optimize(df)
+    # A sample as large as the source is the whole dataset
+    if len(df) < total_rows:
+        df.attrs["sample"] = SampleInfo(len(df), total_rows, seed)
+    if progress is not None:
+        progress(1.0)
+    return df
+
+
+def _check_columns(schema, columns):
+    """
+    Check that the requested columns exist in a file.
+
+    Parameters:
+        - schema (dict): Columns of the file mapped to their dtypes.
+        - columns (list): Requested columns.
 
-    # Extract the dataframe with the corresponding function
-    return EXTENSION_MAP[extension](file_path)
+    Raises:
+        - ColumnNotFoundError: If any of the requested columns does not exist.
+    """
+    missing = [column for column in columns if column not in schema]
+    if missing:
+        raise ColumnNotFoundError(
+            f"The file does not contain the columns: {', '.join(map(str, missing))}.")
+
+
+def _read_shard(file_path, extension, columns):
+    """
+    Read one file of a sharded dataset (run in a worker process).
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - extension (str): Extension of the file.
+        - columns (list): Columns to read, or None for every column.
+
+    Returns:
+        - pandas.DataFrame: Data of the file, or None if it has no rows.
+    """
+    try:
+        df = EXTENSION_MAP[extension](file_path, columns=columns)
+    except EmptyDataError:  # A shard without rows (e.g. a day without data)
+        return None
+    return None if df.empty else df
+
+
+def open_shards(file_path, stream=False, memory_limit=DEFAULT_MEMORY_LIMIT,
+                columns=None, optimize=False, workers=None, progress=None):
+    """
+    Open the files of a directory or glob pattern as a single dataset.
+
+    Every file must have the same columns in the same order. The files are
+    parsed concurrently in a pool of processes and then combined with one
+    allocation per column, in the order of their names. Files without rows
+    are skipped.
+
+    Parameters:
+        - file_path (str): Directory or glob pattern (e.g. "data/2024-*.csv.gz").
+        - stream (bool, optional): If True, return a generator of the chunks
+          of every file, one file after another.
+        - memory_limit (int, optional): Maximum size in bytes of each chunk
+          in streaming mode.
+        - columns (list, optional): Columns to read. By default every column.
+        - optimize (bool, optional): If True, downcast the dtypes of the result
+          (see open_file).
+        - workers (int, optional): Number of processes. By default, one per
+          CPU core, and never more than the number of files.
+        - progress (callable, optional): Function called with the fraction of
+          the files read so far, between 0 and 1.
+
+    Returns:
+        - pandas.DataFrame: Rows of every file, or a generator of chunks if
+          stream is True.
+
+    Raises:
+        - FileNotFoundError: If no file matches.
+        - FileFormatError: If a file format is not supported, or cannot be
+          read in streaming mode.
+        - SchemaMismatchError: If the files do not have the same columns, or a
+          column holds numbers in one file and text in another.
+        - ColumnNotFoundError: If any of the requested columns does not exist.
+        - EmptyDataError: If no file has rows.
+    """
+    paths = expand_shards(file_path, EXTENSIONS)
+    extensions = [get_extension(path) for path in paths]
+
+    # Probing only reads the first rows, so mismatches are found before parsing
+    probes = [PROBE_MAP[extension](path) for path, extension in zip(paths, extensions)]
+    schemas = [probe.columns for probe in probes]
+    check_same_columns(paths, schemas)
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))  # No duplicates
+        _check_columns(schemas[0], columns)
+
+    # Files without rows are skipped without parsing them
+    shards = [(path, extension) for path, extension, probe in zip(paths, extensions, probes)
+              if not probe.empty]
+    if not shards:
+        raise EmptyDataError("The files do not contain data.")
+    paths, extensions = (list(values) for values in zip(*shards))
+
+    if stream:
+        if any(extension not in STREAM_MAP for extension in extensions):
+            raise FileFormatError(
+                "Streaming mode is only available for CSV and .xlsx files.")
+        return itertools.chain.from_iterable(
+            STREAM_MAP[extension](path, memory_limit=memory_limit, columns=columns)
+            for path, extension in zip(paths, extensions))
+
+    workers = min(len(paths), workers or os.cpu_count() or 1)
+    frames = []
+    if workers == 1:
+        for path, extension in zip(paths, extensions):
+            frames.append(_read_shard(path, extension, columns))
+            if progress is not None:
+                progress(len(frames) / len(paths))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Results arrive in order, as soon as each file is parsed
+            for frame in pool.map(_read_shard, paths, extensions, itertools.repeat(columns)):
+                frames.append(frame)
+                if progress is not None:
+                    progress(len(frames) / len(paths))
+
+    shards = [(frame, path) for frame, path in zip(frames, paths) if frame is not None]
+    if not shards:
+        raise EmptyDataError("The files do not contain data.")
+    frames, paths = zip(*shards)
+    df = combine_frames(list(frames), list(paths))
+    if optimize:
+        df = _optimize(df)
+    return df
+
+
+def _optimize(df):
+    """
+    Narrow the dtypes of a dataset and describe the memory saved in its attributes.
+
+    Parameters:
+        - df (pandas.DataFrame): Dataset to optimize.
+
+    Returns:
+        - pandas.DataFrame: The optimized dataset, with attrs["memory_report"]
+          and attrs["optimized"] set.
+    """
+    df, report = optimize_dtypes(df)
+    df.attrs["memory_report"] = report
+    df.attrs["optimized"] = True
+    return df
+
+
+def _read_file(file_path, extension, cache, columns, table, options, progress=None,
+               optimize=False):
+    """
+    Read a file into a DataFrame, through the dataset cache if one is given.
+
+    With optimize, a dataset that is not cached yet is stored with its
+    dtypes already narrowed, so reopening it maps the cached columns as they
+    are instead of converting (and copying) them again.
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - extension (str): Extension of the file.
+        - cache (DatasetCache): Cache of parsed datasets, or None.
+        - columns (list): Columns to read, or None for every column.
+        - table (str): Table or sheet, or None for the first one.
+        - options (dict): Format-specific arguments of the reader.
+        - progress (callable, optional): Function called with the fraction of
+          the file parsed so far.
+        - optimize (bool, optional): If True, optimize the dtypes of a dataset
+          before storing it in the cache (see optimize_dtypes).
+
+    Returns:
+        - pandas.DataFrame: DataFrame containing the file data, with
+          attrs["optimized"] set if its dtypes are already optimized.
+    """
+    if cache is None or 'filters' in options:
+        # Extract the dataframe with the corresponding function
+        return _parse_file(file_path, extension, columns, options, progress)
+
+    # Fingerprint before parsing, so a file modified meanwhile is not cached as new
+    fingerprint = file_fingerprint(file_path)
+    df = cache.load(fingerprint, table)
+    if df is None:
+        if columns is not None:  # Only complete datasets are cached
+            return _parse_file(file_path, extension, columns, options, progress)
+        df = _parse_file(file_path, extension, None, options, progress)
+        if optimize:
+            df = _optimize(df)
+        cache.store(fingerprint, df, table, optimized=optimize)
+    # Selecting columns of a cached dataset does not read the others
+    return df if columns is None else df[columns]
+
+
+def _parse_file(file_path, extension, columns, options, progress):
+    """
+    Parse a file with the reader of its format.
+
+    Parameters:
+        - file_path (str): Path to the file.
+        - extension (str): Extension of the file.
+        - columns (list): Columns to read, or None for every column.
+        - options (dict): Format-specific arguments of the reader.
+        - progress (callable): Function called with the fraction of the file
+          parsed so far, or None. Only CSV files report it while parsing.
+
+    Returns:
+        - pandas.DataFrame: DataFrame containing the file data.
+    """
+    if progress is not None and extension in CSV_COMPRESSIONS:
+        return read_csv_with_progress(file_path, progress, columns,
+                                      compression=CSV_COMPRESSIONS[extension])
+    return EXTENSION_MAP[extension](file_path, columns=columns, **options)
@@ -165,3 +165,86 @@ def run_with_loading(
         raise error
 
     return result
+
+
+class BackgroundTask:
+    """
+    A function run in a separate thread while the interface stays usable.
+
+    Unlike run_with_loading, no popup blocks the window: the thread is polled
+    from the Tkinter event loop, which calls back with the progress reported
+    by the function and with its result. Every callback runs in the main
+    thread, so they can update widgets.
+
+    Parameters:
+        - parent: Window whose event loop polls the thread
+        - func: Function to execute, it receives a function to report its
+          progress as a fraction between 0 and 1
+        - on_done: Called with the result of func
+        - on_error: Called with the exception raised by func
+        - on_progress: Called with the last progress reported, if it changed
+    """
+
+    POLL_MS = 100  # Time between two checks of the thread
+
+    def __init__(
+        self,
+        parent: tk.Tk,
+        func: Callable,
+        on_done: Callable,
+        on_error: Callable,
+        on_progress: Optional[Callable] = None
+    ):
+        """Start running func in a separate thread."""
+        self._parent = parent
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_progress = on_progress
+        self._progress: Optional[float] = None  # Written by the thread
+        self._shown_progress: Optional[float] = None
+        self._result = None
+        self._error: Optional[Exception] = None
+        self._cancelled = False
+
+        self._thread = threading.Thread(target=self._run, args=(func,), daemon=True)
+        self._thread.start()
+        self._parent.after(self.POLL_MS, self._poll)
+
+    def _run(self, func: Callable) -> None:
+        """Execute function in separate thread."""
+        try:
+            self._result = func(self._report)
+        except Exception as e:
+            self._error = e
+
+    def _report(self, fraction: float) -> None:
+        """Store the progress of the function (called from its thread)."""
+        self._progress = fraction
+
+    def _poll(self) -> None:
+        """Forward the progress and the result of the thread to the callbacks."""
+        if self._cancelled:
+            return
+        progress = self._progress
+        if self._on_progress and progress is not None and progress != self._shown_progress:
+            self._shown_progress = progress
+            self._on_progress(progress)
+
+        if self._thread.is_alive():
+            self._parent.after(self.POLL_MS, self._poll)
+        elif self._error is not None:
+            self._on_error(self._error)
+        else:
+            self._on_done(self._result)
+
+    def cancel(self) -> None:
+        """
+        Stop calling back. The thread cannot be interrupted: it runs until
+        the function returns, and its result is discarded.
+        """
+        self._cancelled = True
+
+    @property
+    def running(self) -> bool:
+        """Check if the callbacks are still pending."""
+        return not self._cancelled and self._thread.is_alive()
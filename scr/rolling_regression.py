@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+from ols import Moments, merge_moment_arrays
+
+
+# Columns of the table returned by rolling_regression
+ROLLING_COLUMNS = ["rows", "slope", "intercept", "r_squared", "mse"]
+
+
+def rolling_regression(feature, target, window, min_periods=None, times=None):
+    """
+    Fit a simple linear regression over a window that slides over the rows.
+
+    The rows are split into blocks as long as the longest window, and
+    cumulative sums of the values centered on the means of their block are
+    taken inside each block, starting again from zero at every block. A
+    window is then the end of one block and the start of the next, and the
+    statistics of both parts are differences of those cumulative sums,
+    merged with ols.merge_moment_arrays. All the windows take O(n) whatever
+    their size, and the sums stay as small as the spread of a block, so
+    series with a trend or far from 0 keep their precision.
+
+    Windows end at each row. A window of a number of rows holds that row and
+    the previous ones; a time window holds the rows in (t - window, t], as
+    pandas.DataFrame.rolling does. Rows with a missing feature or target are
+    not counted.
+
+    Parameters:
+        - feature (pd.Series): The independent variable, in time order.
+        - target (pd.Series): The dependent variable, aligned with feature.
+        - window (int, str or pd.Timedelta): Number of rows of each window, or
+          its duration (e.g. "7D") for a time window.
+        - min_periods (int, optional): Rows a window needs to be fitted. By
+          default the window size for row windows and 2 for time windows.
+        - times (pd.Series, optional): Time of each row for time windows. By
+          default the index of feature, which must be a DatetimeIndex.
+
+    Returns:
+        - pandas.DataFrame: Rows, slope, intercept, R² and MSE of the window
+          ending at each row, with the index of feature. Windows with fewer
+          than min_periods rows or a constant feature get NaN.
+
+    Raises:
+        - TypeError: If the feature or target are not numeric.
+        - ValueError: If the lengths don't match, the window is not valid or
+          the times are not sorted.
+    """
+    if len(feature) != len(target):
+        raise ValueError("Feature and target must have the same length")
+    if not np.issubdtype(feature.dtype, np.number) or not np.issubdtype(target.dtype, np.number):
+        raise TypeError("Feature and target must contain only numeric values")
+
+    starts = _window_starts(feature, window, times)
+    if min_periods is None:
+        min_periods = window if isinstance(window, (int, np.integer)) else 2
+    min_periods = max(min_periods, 2)  # A line needs two points
+
+    x = feature.to_numpy(dtype=np.float64, na_value=np.nan)
+    y = target.to_numpy(dtype=np.float64, na_value=np.nan)
+    ends = np.arange(1, len(x) + 1)
+
+    # Blocks as long as the longest window, so a window spans two blocks at most
+    size = int((ends - starts).max()) if len(x) else 1
+    means_x, means_y, prefix = _block_prefix_sums(x, y, size)
+    # Part of each window in the block of its first row, and in the next block
+    middle = np.minimum(ends, (starts // size + 1) * size)
+    moments = merge_moment_arrays(
+        _part_moments(means_x, means_y, prefix, size, starts, middle),
+        _part_moments(means_x, means_y, prefix, size, middle, ends))
+
+    n = moments.n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # A constant column can leave rounding errors of the order of
+        # eps·|mean| in each row instead of 0
+        fitted = (n >= min_periods) & (moments.s_xx > 0) & \
+            (moments.s_xx > n * (1e-10 * moments.mean_x) ** 2)
+        slope = np.where(fitted, moments.s_xy / moments.s_xx, np.nan)
+        intercept = moments.mean_y - slope * moments.mean_x
+        s_yy = np.maximum(moments.s_yy, 0.0)
+        # Residual sum of squares, clipped because of rounding errors
+        rss = np.maximum(s_yy - slope * moments.s_xy, 0.0)
+        varying = (s_yy > 0) & (s_yy > n * (1e-10 * moments.mean_y) ** 2)
+        r_squared = np.where(varying, 1 - rss / s_yy, 0.0)
+
+    return pd.DataFrame({
+        "rows": n.astype(np.int64),
+        "slope": slope,
+        "intercept": intercept,
+        "r_squared": np.where(fitted, r_squared, np.nan),
+        "mse": np.where(fitted, rss / n, np.nan),
+    }, index=feature.index, columns=ROLLING_COLUMNS)
+
+
+def _block_prefix_sums(x, y, size):
+    """
+    Compute the cumulative sums inside each block of rows of the values
+    centered on the means of the block.
+
+    Parameters:
+        - x, y (numpy.ndarray): Feature and target of each row, NaN if missing.
+        - size (int): Rows of each block.
+
+    Returns:
+        - tuple: Means of x and y of each block (0 without valid rows), and
+          an array of shape (6, blocks, size + 1) with the cumulative number
+          of valid rows and sums of dx, dy, dx², dx·dy and dy² of each block,
+          starting with 0 at position 0.
+    """
+    blocks = max(-(-len(x) // size), 1)
+    padding = blocks * size - len(x)
+    valid = np.pad(~np.isnan(x) & ~np.isnan(y), (0, padding)).reshape(blocks, size)
+    x = np.pad(x, (0, padding)).reshape(blocks, size)
+    y = np.pad(y, (0, padding)).reshape(blocks, size)
+
+    rows = valid.sum(axis=1)
+    with np.errstate(invalid="ignore"):
+        means_x = np.where(valid, x, 0.0).sum(axis=1) / np.maximum(rows, 1)
+        means_y = np.where(valid, y, 0.0).sum(axis=1) / np.maximum(rows, 1)
+    dx = np.where(valid, x - means_x[:, None], 0.0)
+    dy = np.where(valid, y - means_y[:, None], 0.0)
+
+    values = np.stack([valid.astype(np.float64), dx, dy, dx * dx, dx * dy, dy * dy])
+    prefix = np.zeros((6, blocks, size + 1))
+    np.cumsum(values, axis=2, out=prefix[:, :, 1:])
+    return means_x, means_y, prefix
+
+
+def _part_moments(means_x, means_y, prefix, size, starts, ends):
+    """
+    Get the statistics of runs of rows that are each inside a single block.
+
+    Parameters:
+        - means_x, means_y (numpy.ndarray): Means of each block.
+        - prefix (numpy.ndarray): Cumulative sums of each block (see
+          _block_prefix_sums).
+        - size (int): Rows of each block.
+        - starts, ends (numpy.ndarray): First row and end (exclusive) of each
+          run, in the same block. Runs may be empty.
+
+    Returns:
+        - Moments: Arrays with the statistics of each run, with zero means
+          and sums for runs without valid rows.
+    """
+    block = np.minimum(starts // size, prefix.shape[1] - 1)
+    n, sum_dx, sum_dy, sum_xx, sum_xy, sum_yy = (
+        prefix[:, block, ends - block * size] - prefix[:, block, starts - block * size])
+    safe_n = np.maximum(n, 1)
+    mean_dx, mean_dy = sum_dx / safe_n, sum_dy / safe_n
+    return Moments(
+        n,
+        np.where(n > 0, means_x[block] + mean_dx, 0.0),
+        np.where(n > 0, means_y[block] + mean_dy, 0.0),
+        sum_xx - sum_dx * mean_dx,
+        sum_xy - sum_dx * mean_dy,
+        sum_yy - sum_dy * mean_dy,
+    )
+
+
+def _window_starts(feature, window, times):
+    """
+    Get the position of the first row of the window ending at each row.
+
+    Parameters:
+        - feature (pd.Series): The independent variable.
+        - window (int, str or pd.Timedelta): Number of rows or duration.
+        - times (pd.Series): Time of each row, or None to use the index.
+
+    Returns:
+        - numpy.ndarray: Start of each window.
+
+    Raises:
+        - ValueError: If the window is not valid or the times are not sorted.
+    """
+    positions = np.arange(len(feature))
+    if isinstance(window, (int, np.integer)):
+        if window < 1:
+            raise ValueError("The window must have at least one row")
+        return np.maximum(positions - window + 1, 0)
+
+    try:
+        duration = pd.Timedelta(window)
+    except ValueError:
+        raise ValueError(f"Invalid window: {window}")
+    if duration <= pd.Timedelta(0):
+        raise ValueError("The window must be longer than zero")
+
+    if times is None:
+        if not isinstance(feature.index, pd.DatetimeIndex):
+            raise ValueError("Time windows need the times of the rows or a DatetimeIndex")
+        times = feature.index
+    times = pd.DatetimeIndex(times)
+    if len(times) != len(feature):
+        raise ValueError("There must be a time for each row")
+    if not times.is_monotonic_increasing:
+        raise ValueError("The rows must be sorted by time")
+    # First row that is after the time of each row minus the window
+    return times.searchsorted(times - duration, side="right")
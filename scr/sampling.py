@@ -0,0 +1,63 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+
+# Size of a sample, rows of the source it was drawn from and seed used
+SampleInfo = namedtuple("SampleInfo", ["rows", "total_rows", "seed"])
+
+
+def reservoir_sample(chunks, size, seed=None):
+    """
+    Draw a uniform random sample of rows from a sequence of DataFrames in one pass.
+
+    Each row gets a random key and the rows with the smallest keys are kept,
+    which gives every subset of size rows the same probability. Only the
+    sample and one chunk are in memory at a time, and once the reservoir is
+    full only the rows of a chunk that beat the largest key are copied.
+
+    Parameters:
+        - chunks (iterable): DataFrames with the same columns (e.g. from
+          open_files.iter_csv_chunks).
+        - size (int): Number of rows of the sample.
+        - seed (int, optional): Seed of the random generator, the same seed
+          and chunks give the same sample.
+
+    Returns:
+        - tuple: The sample, with the rows in their original order and a
+          default index, and the number of rows of every chunk.
+
+    Raises:
+        - ValueError: If size is not positive or there are no chunks.
+    """
+    if size <= 0:
+        raise ValueError("The sample size must be a positive integer.")
+
+    rng = np.random.default_rng(seed)
+    reservoir = None
+    keys = np.empty(0)  # Random key of each row of the reservoir
+    total = 0
+    for chunk in chunks:
+        chunk_keys = rng.random(len(chunk))
+        # The position of each row in the source, to restore the order at the end
+        chunk = chunk.set_axis(pd.RangeIndex(total, total + len(chunk)))
+        total += len(chunk)
+
+        if reservoir is None or reservoir.empty:
+            reservoir, keys = chunk, chunk_keys
+        else:
+            if len(keys) == size:  # Rows with larger keys can never enter
+                entering = chunk_keys < keys.max()
+                if not entering.any():
+                    continue
+                chunk, chunk_keys = chunk[entering], chunk_keys[entering]
+            reservoir = pd.concat([reservoir, chunk])
+            keys = np.concatenate([keys, chunk_keys])
+
+        if len(keys) > size:
+            kept = np.argpartition(keys, size - 1)[:size]
+            reservoir, keys = reservoir.iloc[kept], keys[kept]
+
+    if reservoir is None:
+        raise ValueError("Input data cannot be empty")
+    return reservoir.sort_index().reset_index(drop=True), total
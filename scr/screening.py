@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+from ols import BLOCK_SIZE, accumulate_cross_moments
+
+
+# Columns of the leaderboard returned by screen_regressions
+LEADERBOARD_COLUMNS = ["feature", "target", "r_squared", "slope", "intercept", "mse"]
+
+
+def screen_regressions(df, columns=None, target=None, top=None, block_size=BLOCK_SIZE):
+    """
+    Fit a simple linear regression for every ordered pair of numeric columns.
+
+    The rows are read once to compute the means and the centered Gram
+    (covariance) matrix of every column. The slope, intercept, R² and MSE
+    of every pair are then matrix operations on that p×p matrix, so 500
+    columns (249,500 regressions) take little more than the pass over the
+    data.
+
+    Only the rows without missing values in any of the columns are used, so
+    every regression is fitted on the same rows. Constant columns are not
+    used as features.
+
+    Parameters:
+        - df (pandas.DataFrame): Dataset.
+        - columns (list, optional): Numeric columns to screen (e.g. from
+          ScrollTable.numeric_columns). By default every numeric column.
+        - target (str, optional): Only rank the regressions of this target.
+        - top (int, optional): Number of best regressions to return. By default all.
+        - block_size (int, optional): Rows processed at a time.
+
+    Returns:
+        - pandas.DataFrame: Leaderboard with the columns LEADERBOARD_COLUMNS,
+          one row per regression, sorted by decreasing R². Its "rows" attr is
+          the number of rows used.
+
+    Raises:
+        - ValueError: If there are fewer than two columns, the target is not
+          one of them, or no row is complete.
+    """
+    if columns is None:
+        columns = df.select_dtypes(include=['number']).columns
+    columns = list(columns)
+    if len(columns) < 2:
+        raise ValueError("At least two numeric columns are needed")
+    if target is not None and target not in columns:
+        raise ValueError(f"The target {target} is not one of the screened columns")
+
+    data = df[columns]
+    blocks = (_complete_rows(data.iloc[start:start + block_size])
+              for start in range(0, len(data), block_size))
+    moments = accumulate_cross_moments(blocks, len(columns))
+    if moments.n == 0:
+        raise ValueError("There are no rows without missing values")
+
+    gram = moments.gram
+    variances = np.diag(gram)  # Centered sum of squares of each column
+
+    # Pair (j, k) is feature j and target k
+    features, targets = np.nonzero(~np.eye(len(columns), dtype=bool) & (variances > 0)[:, None])
+    if target is not None:
+        keep = targets == columns.index(target)
+        features, targets = features[keep], targets[keep]
+
+    s_xy = gram[features, targets]
+    s_xx = variances[features]
+    s_yy = variances[targets]
+    slope = s_xy / s_xx
+    intercept = moments.means[targets] - slope * moments.means[features]
+    # Residual sum of squares, clipped because of rounding errors
+    rss = np.maximum(s_yy - slope * s_xy, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(s_yy > 0, 1 - rss / s_yy, 0.0)
+
+    # Best regressions first
+    order = np.argsort(-r_squared, kind="stable")
+    if top is not None:
+        order = order[:top]
+
+    names = np.array(columns, dtype=object)
+    leaderboard = pd.DataFrame({
+        "feature": names[features[order]],
+        "target": names[targets[order]],
+        "r_squared": r_squared[order],
+        "slope": slope[order],
+        "intercept": intercept[order],
+        "mse": rss[order] / moments.n,
+    }, columns=LEADERBOARD_COLUMNS)
+    leaderboard.attrs["rows"] = moments.n
+    return leaderboard
+
+
+def _complete_rows(block):
+    """
+    Get the rows of a block without missing values as a float array.
+
+    Parameters:
+        - block (pandas.DataFrame): Rows of the dataset.
+
+    Returns:
+        - numpy.ndarray: The complete rows.
+    """
+    values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+    return values[~np.isnan(values).any(axis=1)]
@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, simpledialog
 import pandas as pd
 import numpy as np
 from tkinter import font
@@ -14,13 +14,27 @@ class ScrollTable(ttk.Treeview):
     and vertical scrollbars. It provides methods to load and display
     DataFrame data with proper column sizing.
 
+    Rows are inserted one page at a time: the next page is fetched when the
+    vertical scrollbar gets close to the end, so large datasets are shown
+    without inserting every row. Ctrl+G jumps to any row, and the previous
+    pages are fetched when the scrollbar gets close to the beginning.
+
     Attributes
         _frame (ttk.Frame): The parent frame containing the table and scrollbars.
         _data (pandas.DataFrame): The DataFrame being displayed in the table.
         _scroll_x (tk.Scrollbar): Horizontal scrollbar for the table.
         _scroll_y (tk.Scrollbar): Vertical scrollbar for the table.
+        _fetch_rows (callable): Function that returns the rows start..stop-1.
+        _total_rows (int): Number of rows that can be shown.
+        _first_row (int): First row inserted.
+        _loaded_rows (int): Row after the last one inserted.
+        _prepending (bool): True while a previous page is inserted, so the
+            scroll events it causes do not load more pages.
     """
 
+    PAGE_ROWS = 500  # Rows inserted each time the end of the table is reached
+    LOAD_THRESHOLD = 0.9  # Scroll position that loads the next page
+
     def __init__(self, frame):
         """
         Initialize the ScrollTable widget.
@@ -31,6 +45,11 @@ class ScrollTable(ttk.Treeview):
         super().__init__(frame, columns=[], show="headings")
         self._frame = frame
         self._data = None  # At the time of creation, the table is empty
+        self._fetch_rows = None
+        self._total_rows = 0
+        self._first_row = 0
+        self._loaded_rows = 0
+        self._prepending = False
 
         # Creates table and scrollbars but they remain hidden until the table has data
 
@@ -42,12 +61,14 @@ class ScrollTable(ttk.Treeview):
 
         # Connect scrollbars to existing table (self)
         self.config(xscrollcommand=self._scroll_x.set,
-                    yscrollcommand=self._scroll_y.set)
+                    yscrollcommand=self._on_vertical_scroll)
 
         # Configure the scrollbars
         self._scroll_x.config(command=self.xview)
         self._scroll_y.config(command=self.yview)
 
+        self.bind("<Control-g>", lambda event: self._ask_row())
+
     @property  # DataFrame that the table shows
     def data(self):
         return self._data
@@ -60,13 +81,148 @@ class ScrollTable(ttk.Treeview):
             - df: The DataFrame to display in the table.
         """
         self._data = df
-        self['columns'] = list(df.columns)
-        for col in df.columns:
+        self._create_columns(df.columns)
+        self._start_paging(lambda start, stop: df.iloc[start:stop], len(df))
+
+    def create_from_line_index(self, index):
+        """
+        Configure the table to show a CSV file straight from disk.
+
+        Only the rows of the pages that are shown are read, using the byte
+        offsets of the line index, so the file does not have to be loaded
+        and any row can be reached with jump_to_row.
+
+        Parameters:
+            - index (LineIndex): Line index of the CSV file.
+        """
+        first_page = index.read_rows(0, self.PAGE_ROWS)
+        self._data = first_page  # Sample used for the column types
+        self._create_columns(first_page.columns)
+        self._start_paging(index.read_rows, index.rows)
+
+    def _create_columns(self, columns):
+        """
+        Create the headings of the table.
+
+        Parameters:
+            - columns: Column names.
+        """
+        self['columns'] = list(columns)
+        for col in columns:
             self.heading(col, text=col)
             self.column(col, anchor='center')
 
-        for _, row in df.iterrows():
-            self.insert("", "end", values=list(row))
+    def _start_paging(self, fetch_rows, total_rows):
+        """
+        Remove the current rows and insert the first page.
+
+        Parameters:
+            - fetch_rows: Function that returns the rows start..stop-1 as a DataFrame.
+            - total_rows: Number of rows that can be shown.
+        """
+        self._fetch_rows = fetch_rows
+        self._total_rows = total_rows
+        self._show_page(0)
+
+    def _show_page(self, start):
+        """
+        Remove the current rows and insert the page that starts at a row.
+
+        Parameters:
+            - start: First row of the page.
+        """
+        self.delete(*self.get_children())
+        self._first_row = start
+        self._loaded_rows = start
+        self._load_next_page()
+
+    def jump_to_row(self, row):
+        """
+        Show a row, selected, fetching its page if it is not inserted.
+
+        Parameters:
+            - row: Position of the row (0 is the first one), clipped to the rows.
+        """
+        if self._total_rows == 0:
+            return
+        row = min(max(row, 0), self._total_rows - 1)
+        if not self._first_row <= row < self._loaded_rows:
+            self._show_page(row - row % self.PAGE_ROWS)
+        self.selection_set(str(row))
+        self.see(str(row))
+
+    def _ask_row(self):
+        """Ask the user for a row number and jump to it."""
+        if self._total_rows == 0:
+            return
+        row = simpledialog.askinteger(
+            "Go to row",
+            f"Row number (1 - {self._total_rows:,}):",
+            parent=self,
+            minvalue=1,
+            maxvalue=self._total_rows
+        )
+        if row is not None:
+            self.jump_to_row(row - 1)
+
+    def _insert_rows(self, page, start, position="end"):
+        """
+        Insert the rows of a page, identified by their row number.
+
+        Parameters:
+            - page: DataFrame with the rows.
+            - start: Row number of the first row of the page.
+            - position: Position of the first row in the table, "end" to append.
+        """
+        for i, row in enumerate(page.itertuples(index=False, name=None)):
+            self.insert("", position if position == "end" else position + i,
+                        iid=str(start + i), values=list(row))
+
+    def _load_next_page(self):
+        """Insert the next page of rows, if there are rows left."""
+        if self._fetch_rows is None or self._loaded_rows >= self._total_rows:
+            return
+        stop = min(self._loaded_rows + self.PAGE_ROWS, self._total_rows)
+        self._insert_rows(self._fetch_rows(self._loaded_rows, stop), self._loaded_rows)
+        self._loaded_rows = stop
+
+    def _load_previous_page(self, first):
+        """
+        Insert the page of rows before the first one, if there is one,
+        keeping the same rows in view.
+
+        Parameters:
+            - first: Fraction of the rows above the visible area before the insert.
+        """
+        if self._fetch_rows is None or self._first_row == 0:
+            return
+        start = max(self._first_row - self.PAGE_ROWS, 0)
+        page = self._fetch_rows(start, self._first_row)
+        shown = self._loaded_rows - self._first_row
+        self._prepending = True
+        try:
+            self._insert_rows(page, start, position=0)
+            self._first_row = start
+            # Rows above the view: those that were, plus the inserted ones
+            self.yview_moveto((float(first) * shown + len(page)) / (shown + len(page)))
+        finally:
+            self._prepending = False
+
+    def _on_vertical_scroll(self, first, last):
+        """
+        Update the vertical scrollbar and load more rows near the ends.
+
+        Parameters:
+            - first: Fraction of the rows above the visible area.
+            - last: Fraction of the rows up to the end of the visible area.
+        """
+        self._scroll_y.set(first, last)
+        if self._prepending:  # Caused by the insert of the previous page
+            return
+        if float(last) >= self.LOAD_THRESHOLD:
+            self._load_next_page()
+        elif float(first) <= 1 - self.LOAD_THRESHOLD:
+            self._load_previous_page(first)
 
     def show(self):
         """Display the table and scrollbars in the frame."""
@@ -0,0 +1,161 @@
+import glob
+import os
+import numpy as np
+import pandas as pd
+from exceptions import SchemaMismatchError
+
+
+# Characters that make a path a glob pattern
+GLOB_CHARACTERS = ('*', '?', '[')
+
+
+def is_shard_pattern(file_path):
+    """
+    Check if a path refers to several files (a directory or a glob pattern).
+
+    Parameters:
+        - file_path (str): Path given to open_file.
+
+    Returns:
+        - bool: True for directories and glob patterns.
+    """
+    file_path = str(file_path)
+    if os.path.isfile(file_path):  # A file whose name has glob characters
+        return False
+    return os.path.isdir(file_path) or any(char in file_path for char in GLOB_CHARACTERS)
+
+
+def expand_shards(file_path, extensions):
+    """
+    List the files of a directory or glob pattern.
+
+    Parameters:
+        - file_path (str): Directory or glob pattern (e.g. "data/2024-*.csv.gz").
+        - extensions (tuple): Supported extensions, only used for directories.
+
+    Returns:
+        - list: Paths of the files, sorted by name so the row order is stable.
+
+    Raises:
+        - FileNotFoundError: If no file matches.
+    """
+    file_path = str(file_path)
+    if os.path.isdir(file_path):
+        paths = [os.path.join(file_path, name) for name in os.listdir(file_path)
+                 if name.endswith(extensions)]
+    else:
+        paths = [path for path in glob.glob(file_path) if os.path.isfile(path)]
+
+    if not paths:
+        raise FileNotFoundError(f"No data files match '{file_path}'.")
+    return sorted(paths)
+
+
+def check_same_columns(paths, schemas):
+    """
+    Check that every shard has the same columns, in the same order.
+
+    Parameters:
+        - paths (list): Paths of the shards.
+        - schemas (list): Schema of each shard (column names mapped to dtypes).
+
+    Raises:
+        - SchemaMismatchError: If a shard has different columns than the first one.
+    """
+    expected = list(schemas[0])
+    for path, schema in zip(paths[1:], schemas[1:]):
+        if list(schema) != expected:
+            raise SchemaMismatchError(
+                f"The columns of '{os.path.basename(path)}' ({', '.join(map(str, schema))}) "
+                f"do not match the columns of '{os.path.basename(paths[0])}' "
+                f"({', '.join(map(str, expected))}).")
+
+
+def _dtype_group(dtype):
+    """
+    Classify a dtype into the groups of dtypes that can share a column.
+
+    Parameters:
+        - dtype: NumPy or pandas dtype.
+
+    Returns:
+        - str: "number", "bool", "datetime" or "object".
+    """
+    if not isinstance(dtype, np.dtype):  # Categories, strings...
+        return "object"
+    if dtype.kind in "iuf":
+        return "number"
+    if dtype.kind == "b":
+        return "bool"
+    if dtype.kind == "M":
+        return "datetime"
+    return "object"
+
+
+def _column_dtype(name, parts, paths):
+    """
+    Get the dtype of a column that holds the values of every shard.
+
+    Parameters:
+        - name: Name of the column.
+        - parts (list): The column in each shard (pandas.Series).
+        - paths (list): Paths of the shards, for error messages.
+
+    Returns:
+        - numpy.dtype: Common dtype.
+
+    Raises:
+        - SchemaMismatchError: If the column holds numbers in one shard and
+          text or dates in another.
+    """
+    # A column without values in a shard does not tell anything about its type
+    typed = [(part, path) for part, path in zip(parts, paths) if part.notna().any()]
+    if not typed:
+        typed = list(zip(parts, paths))
+
+    groups = {_dtype_group(part.dtype) for part, _ in typed}
+    if len(groups) > 1:
+        raise SchemaMismatchError(
+            f"The column '{name}' has incompatible types in "
+            f"'{os.path.basename(typed[0][1])}' and '{os.path.basename(typed[-1][1])}'.")
+
+    group = groups.pop()
+    if group == "number":
+        return np.result_type(*(part.dtype for part, _ in typed))
+    if group == "datetime" and len({part.dtype for part, _ in typed}) == 1:
+        return typed[0][0].dtype
+    if group == "bool" and all(part.dtype == bool for part in parts):
+        return np.dtype(bool)
+    return np.dtype(object)
+
+
+def combine_frames(frames, paths):
+    """
+    Combine the DataFrames of the shards with a single allocation per column.
+
+    Each column of the result is allocated once with its final size and
+    dtype, and the values of every shard are copied into their slice.
+
+    Parameters:
+        - frames (list): DataFrame of each shard, all with the same columns.
+        - paths (list): Paths of the shards, for error messages.
+
+    Returns:
+        - pandas.DataFrame: Rows of every shard, in order, with a default index.
+
+    Raises:
+        - SchemaMismatchError: If a column has incompatible types in two shards.
+    """
+    total = sum(len(frame) for frame in frames)
+    offsets = np.cumsum([0] + [len(frame) for frame in frames])
+    columns = {}
+    for position, name in enumerate(frames[0].columns):
+        parts = [frame.iloc[:, position] for frame in frames]
+        dtype = _column_dtype(name, parts, paths)
+        if dtype.kind in "iub" and any(part.isna().any() for part in parts):
+            dtype = np.dtype(np.float64)  # Missing values need NaN
+        values = np.empty(total, dtype=dtype)
+        for part, start, end in zip(parts, offsets[:-1], offsets[1:]):
+            values[start:end] = part.to_numpy(dtype=dtype)
+        columns[name] = values
+    return pd.DataFrame(columns, columns=frames[0].columns, copy=False)
@@ -0,0 +1,143 @@
+from linear_regression import LinearRegression
+from ols import Moments
+from nan_handler import ConstantValueError
+from open_files import get_first_table
+from exceptions import ColumnNotFoundError
+from sqlite_reader import get_connection, quote_identifier
+
+
+def _median_expression(column, table):
+    """
+    Build a scalar subquery with the median of the non-null values of a column.
+
+    Parameters:
+        - column (str): Quoted column name.
+        - table (str): Quoted table name.
+
+    Returns:
+        - str: SQL subquery.
+    """
+    count = f"(SELECT COUNT({column}) FROM {table})"
+    # Average of the middle value, or of the two middle values if the count is even
+    return (f"(SELECT AVG(v) FROM (SELECT {column} AS v FROM {table} "
+            f"WHERE {column} IS NOT NULL ORDER BY v "
+            f"LIMIT 2 - {count} % 2 OFFSET ({count} - 1) / 2))")
+
+
+def _nan_expression(column, table, method):
+    """
+    Build the SQL expression that applies a NaN handling method to a column.
+
+    Parameters:
+        - column (str): Quoted column name.
+        - table (str): Quoted table name.
+        - method (str): NaN handling method, as in NaNHandler.preprocess.
+
+    Returns:
+        - str: SQL expression (it uses a ? parameter for constant values).
+    """
+    FILL_EXPRESSIONS = {
+        "Fill with Mean": f"(SELECT AVG({column}) FROM {table})",
+        "Fill with Median": _median_expression(column, table),
+        "Fill with a Constant Value": "?",
+    }
+
+    if method in FILL_EXPRESSIONS:
+        return f"COALESCE({column}, {FILL_EXPRESSIONS[method]})"
+    return column  # No filling, rows are kept or deleted as they are
+
+
+def fit_sqlite_regression(file_path, feature_name, target_name, method=None,
+                          constant_value=None, table=None):
+    """
+    Fit a simple linear regression inside a SQLite database.
+
+    The sufficient statistics of the regression (count, means and centered
+    sums of squares and cross products) are computed with one query, so the
+    rows are never loaded into Python. The products are summed around the
+    means, not as raw Σx², Σxy..., which lose every significant digit when
+    the values are large compared to their spread (e.g. timestamps). Missing values (NULL) are handled in SQL with the same methods
+    as NaNHandler, computing means and medians over the whole column.
+
+    Parameters:
+        - file_path (str): Path to the SQLite database file.
+        - feature_name (str): Name of the feature column.
+        - target_name (str): Name of the target column.
+        - method (str, optional): NaN handling method ("Delete Rows",
+          "Fill with Mean", "Fill with Median" or "Fill with a Constant Value").
+          If not given, the columns must not contain missing values.
+        - constant_value (float, optional): Value used by "Fill with a Constant Value".
+        - table (str, optional): Table to read. By default, the same table as open_sql.
+
+    Returns:
+        - LinearRegression: Model with the same intercept, slope, R² and MSE as
+          one fitted on the loaded data, without predictions.
+
+    Raises:
+        - EmptyDataError: If the database has no tables.
+        - ColumnNotFoundError: If the feature or target column does not exist.
+        - ConstantValueError: If the constant method is used without a value.
+        - TypeError: If the columns contain non-numeric values.
+        - ValueError: If missing values remain or there is no data to fit.
+    """
+    if method == "Fill with a Constant Value" and constant_value is None:
+        raise ConstantValueError("You must introduce a valid numeric value.")
+
+    conn = get_connection(file_path)  # Pooled connection, it is not closed
+    if table is None:
+        table = get_first_table(conn)
+
+    # SQLite reads unknown quoted names as strings, so check them first
+    columns = {row[0] for row in conn.execute(
+        "SELECT name FROM pragma_table_info(?)", (table,))}
+    missing_columns = [name for name in (feature_name, target_name)
+                       if name not in columns]
+    if missing_columns:
+        raise ColumnNotFoundError(
+            f"The table does not contain the columns: {', '.join(missing_columns)}.")
+
+    table = quote_identifier(table)
+    feature = quote_identifier(feature_name)
+    target = quote_identifier(target_name)
+
+    x = _nan_expression(feature, table, method)
+    y = _nan_expression(target, table, method)
+    parameters = [constant_value] * (x.count("?") + y.count("?"))
+    where = (f"WHERE {feature} IS NOT NULL AND {target} IS NOT NULL"
+             if method == "Delete Rows" else "")
+
+    # TOTAL always returns a float, so the products cannot overflow like SUM
+    # on integers. The deviations are summed too, to correct the rounding
+    # error of the means.
+    query = f"""
+        WITH data AS (
+            SELECT CAST({x} AS REAL) AS x, CAST({y} AS REAL) AS y,
+                   {feature} AS raw_x, {target} AS raw_y
+            FROM {table} {where}
+        ), means AS (
+            SELECT AVG(x) AS mean_x, AVG(y) AS mean_y FROM data
+        )
+        SELECT COUNT(*), mean_x, mean_y, TOTAL(x - mean_x), TOTAL(y - mean_y),
+               TOTAL((x - mean_x) * (x - mean_x)), TOTAL((x - mean_x) * (y - mean_y)),
+               TOTAL((y - mean_y) * (y - mean_y)),
+               TOTAL(x IS NULL OR y IS NULL),
+               TOTAL(typeof(raw_x) NOT IN ('integer', 'real', 'null')
+                     OR typeof(raw_y) NOT IN ('integer', 'real', 'null'))
+        FROM data, means
+    """
+    (n, mean_x, mean_y, sum_dx, sum_dy, sum_xx, sum_xy, sum_yy,
+     missing, non_numeric) = conn.execute(query, parameters).fetchone()
+
+    if non_numeric:
+        raise TypeError("Feature and target must contain only numeric values")
+    if missing:
+        raise ValueError("The selected columns contain non-existent values")
+    if n == 0:
+        raise ValueError("Input data cannot be empty")
+
+    # Centered sums around the exact means
+    moments = Moments(n, mean_x + sum_dx / n, mean_y + sum_dy / n,
+                      sum_xx - sum_dx * sum_dx / n,
+                      sum_xy - sum_dx * sum_dy / n,
+                      sum_yy - sum_dy * sum_dy / n)
+    return LinearRegression.from_moments(feature_name, target_name, moments)
@@ -0,0 +1,612 @@
+import os
+import json
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from sampling import reservoir_sample
+
+
+# Bytes of the database file that SQLite may read through memory mapping
+MMAP_SIZE = 1024 ** 3
+# Page cache of each connection, negative values are KiB (64 MiB)
+CACHE_SIZE = -64 * 1024
+# Rows fetched from the cursor in each batch
+BATCH_SIZE = 50_000
+# Limits of the in-memory cache of recently read tables
+RECENT_TABLES = 4
+RECENT_TABLES_BYTES = 1024 ** 3
+
+
+def quote_identifier(name):
+    """
+    Quote a table or column name to use it in a SQLite statement.
+
+    Parameters:
+        - name (str): Name to quote.
+
+    Returns:
+        - str: Name between double quotes, with inner double quotes escaped.
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SQLiteConnectionPool:
+    """
+    Pool of read-only connections to SQLite database files.
+
+    Each thread gets its own connection to each file, reused by every read of
+    that thread, so a connection is never used by two threads at once (e.g.
+    the interface and a file loaded in the background). Connections are
+    opened in immutable mode (no locking, the file is assumed not to change
+    while it is open) and tuned with the mmap_size and cache_size pragmas.
+    They are keyed by the size and modification time of the file, so a
+    database modified on disk gets a fresh connection instead of stale data.
+
+    A stale connection is only removed from the pool, not closed, because
+    its thread may still be reading from it: it is closed when it is no
+    longer used. The connections of a thread are released when it ends.
+
+    Parameters:
+        _connections (weakref.WeakKeyDictionary): Thread mapped to a dict of
+            absolute path to (file state, connection).
+        _lock (threading.Lock): Protects the dictionary of connections.
+    """
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._connections = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, file_path):
+        """
+        Get the connection of the current thread to a database file, opening it if needed.
+
+        Parameters:
+            - file_path (str): Path to the SQLite database file.
+
+        Returns:
+            - sqlite3.Connection: Read-only connection to the database.
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        state = (stat.st_size, stat.st_mtime_ns)
+
+        thread = threading.current_thread()
+        with self._lock:
+            entry = self._connections.get(thread, {}).get(path)
+        if entry is not None and entry[0] == state:
+            return entry[1]
+
+        conn = self._connect(path)
+        with self._lock:
+            # A stale connection is replaced, not closed
+            self._connections.setdefault(thread, {})[path] = (state, conn)
+        return conn
+
+    def close(self, file_path):
+        """
+        Remove the connections to a database file from the pool.
+
+        The connection of the current thread is closed, those of other
+        threads are closed when they are no longer used.
+
+        Parameters:
+            - file_path (str): Path to the SQLite database file.
+        """
+        path = os.path.abspath(file_path)
+        with self._lock:
+            current = self._connections.get(threading.current_thread(), {}).get(path)
+            for connections in self._connections.values():
+                connections.pop(path, None)
+        if current is not None:
+            current[1].close()
+
+    def close_all(self):
+        """
+        Close every connection of the pool, of every thread.
+
+        It must only be called when no file is being read (e.g. when the
+        application exits).
+        """
+        with self._lock:
+            entries = [entry for connections in self._connections.values()
+                       for entry in connections.values()]
+            self._connections.clear()
+        for _, conn in entries:
+            conn.close()
+
+    @staticmethod
+    def _connect(path):
+        """
+        Open a tuned read-only connection.
+
+        Parameters:
+            - path (str): Absolute path to the database file.
+
+        Returns:
+            - sqlite3.Connection: The new connection.
+        """
+        uri = Path(path).as_uri() + "?mode=ro&immutable=1"
+        # Used by a single thread, but close_all may close it from another one
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = {CACHE_SIZE}")
+        return conn
+
+
+# Pool shared by every module that reads SQLite files
+_pool = SQLiteConnectionPool()
+
+
+def get_connection(file_path):
+    """
+    Get the pooled read-only connection of the current thread to a database file.
+
+    Parameters:
+        - file_path (str): Path to the SQLite database file.
+
+    Returns:
+        - sqlite3.Connection: Read-only connection to the database.
+    """
+    return _pool.get(file_path)
+
+
+def close_connections():
+    """Close every pooled connection (e.g. when the application exits)."""
+    _pool.close_all()
+
+
+def _column_dtype(declared_type):
+    """
+    Choose the initial array dtype of a column from its declared SQLite type.
+
+    Only columns with text affinity start as object. Columns without a
+    declared type (e.g. CREATE TABLE t(a, b), or computed columns of a view)
+    or with any other type start as int64, and _fill_block widens them if
+    they hold real values, NULLs or text.
+
+    Parameters:
+        - declared_type (str): Type in the CREATE TABLE statement, empty if none.
+
+    Returns:
+        - numpy.dtype: object for text affinity, float64 for real types, int64 otherwise.
+    """
+    declared_type = declared_type.upper()
+    if "INT" in declared_type:  # SQLite checks it before the other affinities
+        return np.dtype(np.int64)
+    if any(name in declared_type for name in ("CHAR", "CLOB", "TEXT")):
+        return np.dtype(object)
+    if any(name in declared_type for name in ("REAL", "FLOA", "DOUB", "NUMERIC", "DECIMAL")):
+        return np.dtype(np.float64)
+    return np.dtype(np.int64)
+
+
+def _fill_block(array, start, values):
+    """
+    Copy a block of values into a column array, widening its dtype if needed.
+
+    The dtype only widens, from int64 to float64 (for NULLs or real values)
+    and to object (for text), like pandas does when it infers the dtype of the
+    whole column.
+
+    Parameters:
+        - array (numpy.ndarray): Preallocated column.
+        - start (int): Position of the first value of the block.
+        - values (tuple): Values of the block.
+
+    Returns:
+        - numpy.ndarray: The same array, or a wider copy of it.
+    """
+    end = start + len(values)
+    if array.dtype == object:
+        array[start:end] = values
+        return array
+
+    block = np.array(values)
+    if block.dtype.kind == "i" or (block.dtype.kind == "f" and array.dtype.kind == "f"):
+        array[start:end] = block
+        return array
+
+    if block.dtype.kind == "f" or (block.dtype == object and all(
+            value is None or isinstance(value, (int, float)) for value in values)):
+        # Real values or NULLs (converted to NaN) in an integer column
+        block = np.array(values, dtype=np.float64)
+        array = array.astype(np.float64)
+    else:  # Text or binary values
+        block = np.array(values, dtype=object)
+        array = array.astype(object)
+    array[start:end] = block
+    return array
+
+
+def read_table(file_path, table, columns=None, batch_size=BATCH_SIZE, limit=None,
+               rowids=None):
+    """
+    Read a SQLite table into a DataFrame through the pooled connection.
+
+    Rows are fetched in batches and copied straight into one preallocated
+    NumPy array per column, so no intermediate list of all the rows is built.
+
+    Parameters:
+        - file_path (str): Path to the SQLite database file.
+        - table (str): Name of the table or view.
+        - columns (list, optional): Columns to read. By default every column is read.
+        - batch_size (int, optional): Rows fetched per batch.
+        - limit (int, optional): Maximum number of rows, the first ones of the
+          table. By default every row is read.
+        - rowids (list, optional): Rowids of the rows to read, they are read in
+          rowid order. By default every row is read.
+
+    Returns:
+        - pandas.DataFrame: DataFrame with the table data.
+    """
+    conn = get_connection(file_path)
+    declared_types = dict(conn.execute(
+        "SELECT name, type FROM pragma_table_info(?)", (table,)).fetchall())
+    if columns is None:
+        columns = list(declared_types)
+
+    quoted_table = quote_identifier(table)
+    query = f"SELECT {', '.join(map(quote_identifier, columns))} FROM {quoted_table}"
+    parameters = ()
+    if rowids is not None:
+        # A single JSON parameter instead of one per rowid, they may be millions
+        query += " WHERE rowid IN (SELECT value FROM json_each(?)) ORDER BY rowid"
+        parameters = (json.dumps([int(rowid) for rowid in rowids]),)
+        n_rows = conn.execute(f"SELECT COUNT(*) FROM {quoted_table} WHERE rowid IN "
+                              "(SELECT value FROM json_each(?))", parameters).fetchone()[0]
+    elif limit is None:
+        n_rows = conn.execute(f"SELECT COUNT(*) FROM {quoted_table}").fetchone()[0]
+    else:  # Only counts up to the limit instead of scanning the whole table
+        query += " LIMIT ?"
+        parameters = (limit,)
+        n_rows = conn.execute(f"SELECT COUNT(*) FROM (SELECT 1 FROM {quoted_table} LIMIT ?)",
+                              (limit,)).fetchone()[0]
+    arrays = [np.empty(n_rows, dtype=_column_dtype(declared_types.get(column, "")))
+              for column in columns]
+
+    cursor = conn.execute(query, parameters)
+    position = 0
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for index, values in enumerate(zip(*rows)):  # Transpose the batch
+                arrays[index] = _fill_block(arrays[index], position, values)
+            position += len(rows)
+    finally:
+        cursor.close()
+
+    df = pd.DataFrame(dict(zip(columns, arrays)), columns=columns, copy=False)
+
+    # Dates are stored as text, parse them like pandas does for date columns
+    for column in columns:
+        declared_type = declared_types.get(column, "").upper()
+        if "DATE" in declared_type or "TIME" in declared_type:
+            try:
+                df[column] = pd.to_datetime(df[column])
+            except (TypeError, ValueError):
+                pass
+    return df
+
+
+def sample_table(file_path, table, size, seed=None, columns=None, batch_size=BATCH_SIZE):
+    """
+    Read a uniform random sample of the rows of a SQLite table.
+
+    Only the rowids are scanned to draw the sample, which SQLite reads from
+    the smallest index of the table, and then only the sampled rows are
+    read. Views and tables without rowid are sampled by scanning their rows.
+
+    Parameters:
+        - file_path (str): Path to the SQLite database file.
+        - table (str): Name of the table or view.
+        - size (int): Number of rows of the sample.
+        - seed (int, optional): Seed of the random generator.
+        - columns (list, optional): Columns to read. By default every column is read.
+        - batch_size (int, optional): Rows fetched per batch.
+
+    Returns:
+        - tuple: The sample, in rowid order, and the number of rows of the table.
+    """
+    conn = get_connection(file_path)
+    quoted_table = quote_identifier(table)
+    kind = conn.execute("SELECT type FROM sqlite_master WHERE name = ?", (table,)).fetchone()
+    try:
+        # The rowids of a view are NULL
+        cursor = None if kind == ("view",) else conn.execute(f"SELECT rowid FROM {quoted_table}")
+    except sqlite3.OperationalError:  # Table created WITHOUT ROWID
+        cursor = None
+    if cursor is None:
+        selected = "*" if columns is None else ", ".join(map(quote_identifier, columns))
+        chunks = pd.read_sql_query(f"SELECT {selected} FROM {quoted_table}", conn,
+                                   chunksize=batch_size)
+        return reservoir_sample(chunks, size, seed)
+
+    def rowid_chunks():
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                # An empty table still gives one empty chunk
+                yield pd.DataFrame({"rowid": np.fromiter((row[0] for row in rows),
+                                                         dtype=np.int64, count=len(rows))})
+                if len(rows) < batch_size:
+                    break
+        finally:
+            cursor.close()
+
+    sampled, total = reservoir_sample(rowid_chunks(), size, seed)
+    return read_table(file_path, table, columns, batch_size,
+                      rowids=sampled["rowid"].tolist()), total
+
+
+class SQLiteCatalog:
+    """
+    Lazy description of the tables and views of a SQLite database.
+
+    Listing the names only reads sqlite_master. The columns and the row count
+    estimate of each table are queried the first time they are requested and
+    then remembered, so the catalog can be shown without loading any data.
+
+    Parameters:
+        _file_path (str): Path to the SQLite database file.
+        _objects (dict): Table and view names mapped to their type.
+        _columns (dict): Columns of the tables already described.
+        _rows (dict): Row count estimates of the tables already described.
+    """
+
+    def __init__(self, file_path):
+        """
+        Initialize the catalog with the names of the tables and views.
+
+        Parameters:
+            - file_path: Path to the SQLite database file.
+        """
+        self._file_path = file_path
+        rows = get_connection(file_path).execute(
+            "SELECT name, type FROM sqlite_master "
+            "WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%' "
+            "ORDER BY rowid").fetchall()
+        self._objects = dict(rows)
+        self._columns = {}
+        self._rows = {}
+
+    @property
+    def names(self):
+        """Names of the tables and views, in creation order."""
+        return list(self._objects)
+
+    @property
+    def tables(self):
+        """Names of the tables, in creation order."""
+        return [name for name, kind in self._objects.items() if kind == "table"]
+
+    def kind(self, name):
+        """
+        Get whether an object is a table or a view.
+
+        Parameters:
+            - name: Name of the table or view.
+
+        Returns:
+            - str: "table" or "view".
+        """
+        return self._objects[name]
+
+    def default_table(self):
+        """
+        Get the table opened when the user does not choose one.
+
+        Returns:
+            - str: First table, or first view if there are no tables, or None
+              if the database is empty.
+        """
+        tables = self.tables
+        if tables:
+            return tables[0]
+        return self.names[0] if self._objects else None
+
+    def columns(self, name):
+        """
+        Get the declared columns of a table or view.
+
+        Parameters:
+            - name: Name of the table or view.
+
+        Returns:
+            - dict: Column names mapped to their declared SQLite types.
+        """
+        if name not in self._columns:
+            self._columns[name] = dict(get_connection(self._file_path).execute(
+                "SELECT name, type FROM pragma_table_info(?)", (name,)).fetchall())
+        return self._columns[name]
+
+    def estimated_rows(self, name):
+        """
+        Estimate the number of rows of a table without counting them.
+
+        The estimate comes from the statistics of ANALYZE if they exist, and
+        otherwise from the largest rowid, which SQLite finds without a scan.
+        Deleted rows make the rowid estimate larger than the real count.
+
+        Parameters:
+            - name: Name of the table or view.
+
+        Returns:
+            - int: Estimated number of rows, or None if it cannot be estimated
+              cheaply (views and tables without rowid).
+        """
+        if name not in self._rows:
+            self._rows[name] = self._estimate_rows(name)
+        return self._rows[name]
+
+    def _estimate_rows(self, name):
+        """
+        Query the row count estimate of a table.
+
+        Parameters:
+            - name: Name of the table or view.
+
+        Returns:
+            - int: Estimated number of rows, or None.
+        """
+        if self._objects[name] != "table":
+            return None
+
+        conn = get_connection(self._file_path)
+        try:
+            # The first number of stat is the number of rows of the table,
+            # in the rows of its indexes too
+            row = conn.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = ? LIMIT 1",
+                (name,)).fetchone()
+            if row is not None:
+                return int(row[0].split()[0])
+        except sqlite3.OperationalError:  # ANALYZE has never been run
+            pass
+
+        try:
+            row = conn.execute(f"SELECT MAX(rowid) FROM {quote_identifier(name)}").fetchone()
+        except sqlite3.OperationalError:  # WITHOUT ROWID table
+            return None
+        return row[0] or 0
+
+
+def _read_only(df):
+    """
+    Get a DataFrame with read-only views of the columns of another one.
+
+    Parameters:
+        - df (pandas.DataFrame): Table with NumPy columns (as read_table
+          returns). Columns of other dtypes are shared as they are.
+
+    Returns:
+        - pandas.DataFrame: Table with the same data, without copying it.
+    """
+    columns = {}
+    for position, (_, column) in enumerate(df.items()):
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy().view()
+            values.flags.writeable = False
+        else:
+            values = column.array
+        columns[position] = values
+    read_only = pd.DataFrame(columns, index=df.index, copy=False)
+    read_only.columns = df.columns
+    read_only.attrs = dict(df.attrs)
+    return read_only
+
+
+class TableLRU:
+    """
+    Small in-memory cache of the tables read most recently.
+
+    Entries are keyed by the database path, its size and modification time
+    and the table name, so a modified database is never served from the
+    cache. The least recently used tables are dropped when there are too many
+    or when they take too much memory.
+
+    The cached columns are read-only, and every reader gets its own shallow
+    copy of the table, so adding columns to it or writing its values (which
+    raises ValueError) never changes the cached table.
+
+    Parameters:
+        _max_tables (int): Maximum number of cached tables.
+        _max_bytes (int): Maximum memory of the cached tables.
+        _tables (OrderedDict): Keys mapped to (DataFrame, size), oldest first.
+        _lock (threading.Lock): Protects the cache from concurrent readers.
+    """
+
+    def __init__(self, max_tables=RECENT_TABLES, max_bytes=RECENT_TABLES_BYTES):
+        """
+        Initialize an empty cache.
+
+        Parameters:
+            - max_tables: Maximum number of cached tables.
+            - max_bytes: Maximum memory of the cached tables in bytes.
+        """
+        self._max_tables = max_tables
+        self._max_bytes = max_bytes
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(file_path, table):
+        """
+        Build the key of a table.
+
+        Parameters:
+            - file_path: Path to the SQLite database file.
+            - table: Name of the table.
+
+        Returns:
+            - tuple: Absolute path, size, modification time and table name.
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        return (path, stat.st_size, stat.st_mtime_ns, table)
+
+    def get(self, file_path, table):
+        """
+        Get a cached table.
+
+        Parameters:
+            - file_path: Path to the SQLite database file.
+            - table: Name of the table.
+
+        Returns:
+            - pandas.DataFrame: Shallow copy of the cached table, or None if it
+              is not cached.
+        """
+        key = self._key(file_path, table)
+        with self._lock:
+            if key not in self._tables:
+                return None
+            self._tables.move_to_end(key)  # Most recently used
+            df = self._tables[key][0]
+        return df.copy(deep=False)
+
+    def put(self, file_path, table, df):
+        """
+        Cache a table, dropping the least recently used ones if needed.
+
+        Parameters:
+            - file_path: Path to the SQLite database file.
+            - table: Name of the table.
+            - df (pandas.DataFrame): Data of the table. It must not be used
+              afterwards, its columns are shared with the cache.
+
+        Returns:
+            - pandas.DataFrame: The table to use instead of df, a shallow copy
+              of the cached table (or df itself if it is too large to cache).
+        """
+        size = int(df.memory_usage(index=True, deep=False).sum())
+        if size > self._max_bytes:
+            return df
+
+        df = _read_only(df)
+        key = self._key(file_path, table)
+        with self._lock:
+            self._tables[key] = (df, size)
+            self._tables.move_to_end(key)
+            while (len(self._tables) > self._max_tables
+                   or sum(size for _, size in self._tables.values()) > self._max_bytes):
+                self._tables.popitem(last=False)
+        return df.copy(deep=False)
+
+    def clear(self):
+        """Remove every cached table."""
+        with self._lock:
+            self._tables.clear()
+
+    def __len__(self):
+        return len(self._tables)
+
+
+# Tables read most recently, shared by every open_sql call
+recent_tables = TableLRU()
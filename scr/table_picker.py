@@ -0,0 +1,202 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Optional
+from os import path
+from sqlite_reader import SQLiteCatalog
+from excel_reader import ExcelCatalog
+from exceptions import TableNotSelectedError
+
+
+class TablePicker:
+    """A modal dialog to choose the table of a SQLite database, or the sheet
+    of an Excel workbook, to open.
+
+    The tables, views or sheets are listed with their estimated number of
+    rows and their columns, which are read from the catalog of the file
+    without loading any data.
+    """
+
+    WINDOW_SIZE = "560x320"
+
+    STYLES = {
+        'BACKGROUND': '#d0d7f2',
+        'TEXT_COLOR': '#6677B8',
+        'BUTTON_COLOR': '#6677B8',
+        'BUTTON_ACTIVE': '#808ec6',
+        'BUTTON_TEXT': '#FAF8F9',
+        'FONT': ("DejaVu Sans Mono", 11),
+        'PADDING': 10
+    }
+
+    COLUMNS = ('kind', 'rows', 'columns')
+    HEADINGS = {'#0': "Name", 'kind': "Type", 'rows': "Rows (approx.)",
+                'columns': "Columns"}
+    WIDTHS = {'#0': 140, 'kind': 60, 'rows': 110, 'columns': 220}
+
+    def __init__(self, parent: tk.Tk, catalog):
+        """Initialize the table picker.
+
+        Parameters:
+            - parent: Parent window for the dialog
+            - catalog: SQLiteCatalog or ExcelCatalog of the file
+        """
+        self._parent = parent
+        self._catalog = catalog
+        self._selection: Optional[str] = None
+        self._popup: Optional[tk.Toplevel] = None
+        self._tree: Optional[ttk.Treeview] = None
+
+    def show(self) -> Optional[str]:
+        """Display the dialog and wait until the user closes it.
+
+        Returns:
+            - str: Name of the selected table, or None if cancelled
+        """
+        self._create_popup_window()
+        self._create_table_list()
+        self._create_buttons()
+        self._center_popup()
+        self._popup.wait_window()
+        return self._selection
+
+    def _create_popup_window(self) -> None:
+        """Create and configure the popup window."""
+        self._popup = tk.Toplevel(self._parent)
+        self._popup.title("Select table")
+        self._popup.geometry(self.WINDOW_SIZE)
+        self._popup.transient(self._parent)
+        self._popup.grab_set()
+        self._popup.config(bg=self.STYLES['BACKGROUND'])
+        self._popup.protocol("WM_DELETE_WINDOW", self._cancel)
+
+        tk.Label(
+            self._popup,
+            text="The file contains several tables. Select one:",
+            bg=self.STYLES['BACKGROUND'],
+            fg=self.STYLES['TEXT_COLOR'],
+            font=self.STYLES['FONT']
+        ).pack(pady=self.STYLES['PADDING'])
+
+    def _center_popup(self) -> None:
+        """Center popup window relative to parent."""
+        self._popup.update_idletasks()
+
+        x = (
+            self._parent.winfo_x() +
+            (self._parent.winfo_width() - self._popup.winfo_width()) // 2
+        )
+        y = (
+            self._parent.winfo_y() +
+            (self._parent.winfo_height() - self._popup.winfo_height()) // 2
+        )
+
+        self._popup.geometry(f"+{x}+{y}")
+
+    def _create_table_list(self) -> None:
+        """Create the list of tables, views or sheets."""
+        frame = tk.Frame(self._popup, bg=self.STYLES['BACKGROUND'])
+        frame.pack(fill='both', expand=True, padx=self.STYLES['PADDING'])
+
+        self._tree = ttk.Treeview(frame, columns=self.COLUMNS, selectmode='browse')
+        for column, heading in self.HEADINGS.items():
+            self._tree.heading(column, text=heading, anchor='w')
+            self._tree.column(column, width=self.WIDTHS[column], anchor='w')
+
+        scrollbar = ttk.Scrollbar(frame, orient='vertical', command=self._tree.yview)
+        self._tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y')
+        self._tree.pack(side='left', fill='both', expand=True)
+
+        for name in self._catalog.names:
+            self._tree.insert('', 'end', iid=name, text=name,
+                              values=self._describe(name))
+
+        default = self._catalog.default_table()
+        if default is not None:
+            self._tree.selection_set(default)
+            self._tree.focus(default)
+        self._tree.bind('<Double-1>', lambda event: self._accept())
+        self._tree.bind('<Return>', lambda event: self._accept())
+
+    def _describe(self, name: str) -> tuple:
+        """Build the row shown for a table, view or sheet.
+
+        Parameters:
+            - name: Name of the table, view or sheet
+
+        Returns:
+            - tuple: Type, estimated rows and column names
+        """
+        rows = self._catalog.estimated_rows(name)
+        columns = ", ".join(self._catalog.columns(name))
+        return (self._catalog.kind(name), "?" if rows is None else f"{rows:,}", columns)
+
+    def _create_buttons(self) -> None:
+        """Create the open and cancel buttons."""
+        frame = tk.Frame(self._popup, bg=self.STYLES['BACKGROUND'])
+        frame.pack(pady=self.STYLES['PADDING'])
+
+        for text, command in (("Open", self._accept), ("Cancel", self._cancel)):
+            tk.Button(
+                frame,
+                text=text,
+                font=("Arial", 11, 'bold'),
+                fg=self.STYLES['BUTTON_TEXT'],
+                bg=self.STYLES['BUTTON_COLOR'],
+                activebackground=self.STYLES['BUTTON_ACTIVE'],
+                activeforeground=self.STYLES['BUTTON_TEXT'],
+                cursor="hand2",
+                command=command,
+                width=8
+            ).pack(side='left', padx=5)
+
+    def _accept(self) -> None:
+        """Close the dialog keeping the selected table."""
+        selection = self._tree.selection()
+        if selection:
+            self._selection = selection[0]
+            self._close()
+
+    def _cancel(self) -> None:
+        """Close the dialog without selecting a table."""
+        self._selection = None
+        self._close()
+
+    def _close(self) -> None:
+        """Destroy the dialog."""
+        self._popup.grab_release()
+        self._popup.destroy()
+
+
+# Catalog of each file format that can contain several tables
+CATALOGS = {'.db': SQLiteCatalog, '.sqlite': SQLiteCatalog, '.xlsx': ExcelCatalog}
+
+
+def ask_table(parent: tk.Tk, file_path: str) -> Optional[str]:
+    """Ask which table of a SQLite database, or sheet of a workbook, should be opened.
+
+    The dialog is only shown when the file has more than one table, view or sheet.
+
+    Parameters:
+        - parent: Parent window
+        - file_path: Path to the file
+
+    Returns:
+        - str: Name of the table to open, or None to open the default table
+          (also when the file has a single table or does not have tables)
+
+    Raises:
+        - TableNotSelectedError: If the user closes the dialog without choosing
+    """
+    extension = path.splitext(file_path)[1]
+    if extension not in CATALOGS or not path.exists(file_path):
+        return None
+
+    catalog = CATALOGS[extension](file_path)
+    if len(catalog.names) <= 1:
+        return None
+
+    table = TablePicker(parent, catalog).show()
+    if table is None:
+        raise TableNotSelectedError("You haven't selected any tables.")
+    return table
@@ -0,0 +1,94 @@
+import pytest
+import pandas as pd
+import numpy as np
+from open_files import open_file, probe_schema, probe_file
+from exceptions import FileFormatError, EmptyDataError
+
+pq = pytest.importorskip("pyarrow.parquet")
+from arrow_reader import read_arrow, head_arrow
+
+@pytest.fixture
+def sample_df():
+    """
+    Fixture to provide a DataFrame with numeric, text and categorical columns.
+    """
+    return pd.DataFrame({
+        "year": np.repeat([2018, 2019, 2020, 2021], 250),
+        "x": np.arange(1000, dtype="float64"),
+        "y": np.arange(1000) * 2.0,
+        "city": ["Madrid", "Paris"] * 500,
+    })
+
+@pytest.fixture
+def columnar_files(tmp_path, sample_df):
+    """
+    Fixture to write the sample DataFrame as Parquet (one row group per year), Feather and Arrow.
+    """
+    parquet_path = tmp_path / "data.parquet"
+    sample_df.to_parquet(parquet_path, row_group_size=250)
+    feather_path = tmp_path / "data.feather"
+    sample_df.to_feather(feather_path)
+    arrow_path = tmp_path / "data.arrow"
+    sample_df.to_feather(arrow_path)
+    return {"parquet": parquet_path, "feather": feather_path, "arrow": arrow_path}
+
+# -------------------------------------------------
+# Tests for open_file with columnar formats
+# -------------------------------------------------
+
+@pytest.mark.parametrize("file_key", ["parquet", "feather", "arrow"])
+def test_open_file_columnar(columnar_files, sample_df, file_key):
+    pd.testing.assert_frame_equal(open_file(columnar_files[file_key]), sample_df)
+
+@pytest.mark.parametrize("file_key", ["parquet", "feather", "arrow"])
+def test_open_file_columnar_projection(columnar_files, sample_df, file_key):
+    df = open_file(columnar_files[file_key], columns=["y", "x"])
+    pd.testing.assert_frame_equal(df, sample_df[["y", "x"]])
+
+@pytest.mark.parametrize("file_key", ["parquet", "feather", "arrow"])
+def test_open_file_columnar_filters(columnar_files, sample_df, file_key):
+    df = open_file(columnar_files[file_key], columns=["x"], filters=[("year", ">=", 2020)])
+    expected = sample_df.loc[sample_df["year"] >= 2020, ["x"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, expected)
+
+def test_custom_index_is_dropped(tmp_path, sample_df):
+    path = tmp_path / "indexed.parquet"
+    sample_df.set_index("city").to_parquet(path)
+    assert "__index_level_0__" not in probe_schema(path)
+    assert open_file(path).index.equals(pd.RangeIndex(1000))
+
+@pytest.mark.parametrize("file_key", ["parquet", "feather", "arrow"])
+def test_head_arrow(columnar_files, sample_df, file_key):
+    pd.testing.assert_frame_equal(head_arrow(columnar_files[file_key], 300),
+                                  sample_df.head(300))
+
+def test_probe_schema_columnar(columnar_files):
+    assert probe_schema(columnar_files["parquet"]) == {
+        "year": "int64", "x": "float64", "y": "float64", "city": "object"}
+
+def test_probe_file_empty_columnar(tmp_path, sample_df):
+    path = tmp_path / "empty.parquet"
+    sample_df.head(0).to_parquet(path)
+    assert probe_file(path).empty
+    with pytest.raises(EmptyDataError):
+        open_file(path)
+
+def test_filters_match_no_rows(columnar_files):
+    with pytest.raises(EmptyDataError):
+        open_file(columnar_files["parquet"], filters=[("year", "==", 1990)])
+
+def test_invalid_filters(columnar_files):
+    with pytest.raises(FileFormatError):
+        read_arrow(columnar_files["parquet"], filters=[("year", "~", 2020)])
+
+def test_filters_not_columnar(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("year,x\n2020,1\n")
+    with pytest.raises(FileFormatError):
+        open_file(csv_path, filters=[("year", ">=", 2020)])
+
+def test_damaged_file(tmp_path):
+    path = tmp_path / "damaged.parquet"
+    path.write_bytes(b"not a parquet file")
+    with pytest.raises(FileFormatError):
+        open_file(path)
@@ -0,0 +1,110 @@
+import pytest
+import pandas as pd
+import numpy as np
+from linear_regression import LinearRegression
+from bootstrap import bootstrap, _bootstrap_batch
+
+@pytest.fixture
+def line_df():
+    """
+    Fixture to provide noisy data around the line y = 3 + 2x.
+    """
+    rng = np.random.default_rng(23)
+    x = rng.uniform(1000, 1010, 2000)  # Far from 0, to check the accuracy
+    y = 3 + 2 * x + rng.normal(0, 1, 2000)
+    return pd.DataFrame({"x": x, "y": y})
+
+# -------------------------------------------------
+# Tests for the replicates
+# -------------------------------------------------
+
+def test_replicates_match_refits(line_df):
+    result = bootstrap(line_df["x"], line_df["y"], replicates=10, seed=1, workers=1, batch_size=4)
+    assert len(result.slopes) == len(result.intercepts) == 10
+
+    # Draw the same indices again and fit each resample
+    seeds = np.random.SeedSequence(1).spawn(3)
+    n = len(line_df)
+    replicate = 0
+    for seed, size in zip(seeds, [4, 4, 2]):
+        rng = np.random.default_rng(seed)
+        for _ in range(size):
+            rows = line_df.iloc[rng.integers(0, n, n)]
+            model = LinearRegression(rows["x"], rows["y"])
+            assert result.slopes[replicate] == pytest.approx(model.slope, rel=1e-8)
+            assert result.intercepts[replicate] == pytest.approx(model.intercept, rel=1e-8)
+            replicate += 1
+
+def test_batch_sums_are_weighted_sums():
+    data = np.column_stack([np.ones(5), np.arange(5.0)])
+    sums = _bootstrap_batch(np.random.SeedSequence(5), 6, data)
+    assert sums.shape == (6, 2)
+    # Each draw adds one to the weights, so they add up to the rows
+    assert sums[:, 0] == pytest.approx(np.full(6, 5.0))
+    assert ((sums[:, 1] >= 0) & (sums[:, 1] <= 20)).all()
+
+def test_constant_resample_gives_nan():
+    x = pd.Series([1.0, 2.0])
+    result = bootstrap(x, 2 * x, replicates=200, seed=3, workers=1)
+    # Some resamples draw the same row twice
+    assert np.isnan(result.slopes).any()
+    assert result.slope_interval == pytest.approx((2.0, 2.0))
+
+# -------------------------------------------------
+# Tests for the intervals and the seeds
+# -------------------------------------------------
+
+def test_interval_contains_the_slope(line_df):
+    result = bootstrap(line_df["x"], line_df["y"], replicates=500, seed=7, workers=1)
+    model = LinearRegression(line_df["x"], line_df["y"])
+    low, high = result.slope_interval
+    assert low < model.slope < high
+    assert low < 2 < high
+    low, high = result.intercept_interval
+    assert low < model.intercept < high
+    assert result.confidence == 0.95
+
+def test_wider_interval_for_higher_confidence(line_df):
+    narrow = bootstrap(line_df["x"], line_df["y"], replicates=300, confidence=0.5, seed=2, workers=1)
+    wide = bootstrap(line_df["x"], line_df["y"], replicates=300, confidence=0.99, seed=2, workers=1)
+    assert wide.slope_interval[0] < narrow.slope_interval[0]
+    assert wide.slope_interval[1] > narrow.slope_interval[1]
+
+def test_same_seed_same_result_with_any_workers(line_df):
+    single = bootstrap(line_df["x"], line_df["y"], replicates=40, seed=11, workers=1)
+    pooled = bootstrap(line_df["x"], line_df["y"], replicates=40, seed=11, workers=2)
+    np.testing.assert_array_equal(single.slopes, pooled.slopes)
+    np.testing.assert_array_equal(single.intercepts, pooled.intercepts)
+    assert single.slope_interval == pooled.slope_interval
+
+def test_different_seeds_differ(line_df):
+    first = bootstrap(line_df["x"], line_df["y"], replicates=20, seed=1, workers=1)
+    second = bootstrap(line_df["x"], line_df["y"], replicates=20, seed=2, workers=1)
+    assert not np.array_equal(first.slopes, second.slopes)
+
+def test_random_seed_is_returned(line_df):
+    result = bootstrap(line_df["x"], line_df["y"], replicates=20, workers=1)
+    again = bootstrap(line_df["x"], line_df["y"], replicates=20, seed=result.seed, workers=1)
+    np.testing.assert_array_equal(result.slopes, again.slopes)
+
+# -------------------------------------------------
+# Tests for invalid input
+# -------------------------------------------------
+
+def test_different_lengths():
+    with pytest.raises(ValueError, match="same length"):
+        bootstrap(pd.Series([1.0, 2.0, 3.0]), pd.Series([1.0, 2.0]))
+
+def test_not_enough_rows():
+    with pytest.raises(ValueError, match="enough data"):
+        bootstrap(pd.Series([1.0]), pd.Series([2.0]))
+
+def test_missing_values():
+    with pytest.raises(ValueError, match="missing values"):
+        bootstrap(pd.Series([1.0, np.nan, 3.0]), pd.Series([1.0, 2.0, 3.0]))
+
+@pytest.mark.parametrize("replicates, confidence", [(0, 0.95), (10, 0), (10, 1)])
+def test_invalid_parameters(replicates, confidence):
+    x = pd.Series([1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        bootstrap(x, x, replicates=replicates, confidence=confidence)
@@ -0,0 +1,102 @@
+import pytest
+import pandas as pd
+import numpy as np
+from linear_regression import LinearRegression
+from cross_validation import cross_validate, summarize, CV_KEYS
+
+@pytest.fixture
+def line_df():
+    """
+    Fixture to provide noisy data around the line y = 3 + 2x.
+    """
+    rng = np.random.default_rng(24)
+    x = rng.uniform(1000, 1010, 503)  # Far from 0, to check the accuracy
+    y = 3 + 2 * x + rng.normal(0, 1, 503)
+    return pd.DataFrame({"x": x, "y": y})
+
+def refit_scores(df, folds, repeats, seed):
+    """Score each fold by fitting a LinearRegression on the other folds."""
+    rng = np.random.default_rng(seed)
+    r_squared, mse = [], []
+    for _ in range(repeats):
+        codes = rng.permutation(len(df)) % folds
+        for fold in range(folds):
+            train, test = df[codes != fold], df[codes == fold]
+            model = LinearRegression(train["x"], train["y"])
+            residuals = test["y"] - model.intercept - model.slope * test["x"]
+            sse = (residuals ** 2).sum()
+            r_squared.append(1 - sse / ((test["y"] - test["y"].mean()) ** 2).sum())
+            mse.append(sse / len(test))
+    return np.array(r_squared), np.array(mse)
+
+# -------------------------------------------------
+# Tests for the fold scores
+# -------------------------------------------------
+
+@pytest.mark.parametrize("folds, repeats", [(5, 1), (3, 4), (10, 2)])
+def test_scores_match_refits(line_df, folds, repeats):
+    scores = cross_validate(line_df["x"], line_df["y"], folds, repeats, seed=1)
+    assert scores.folds == folds and scores.repeats == repeats
+    r_squared, mse = refit_scores(line_df, folds, repeats, seed=1)
+    np.testing.assert_allclose(scores.r_squared, r_squared, rtol=1e-7)
+    np.testing.assert_allclose(scores.mse, mse, rtol=1e-7)
+
+def test_out_of_sample_error_is_larger(line_df):
+    scores = cross_validate(line_df["x"], line_df["y"], 5, 3, seed=2)
+    model = LinearRegression(line_df["x"], line_df["y"])
+    assert scores.mse.mean() > model.mse
+    assert scores.mse.mean() == pytest.approx(1, rel=0.2)  # The noise variance
+
+def test_same_seed_same_scores(line_df):
+    first = cross_validate(line_df["x"], line_df["y"], seed=3)
+    second = cross_validate(line_df["x"], line_df["y"], seed=3)
+    np.testing.assert_array_equal(first.mse, second.mse)
+
+def test_constant_training_feature():
+    x = pd.Series([1.0, 1.0, 1.0, 2.0])
+    scores = cross_validate(x, 2 * x, folds=4, seed=0)
+    # Without the row where x is 2, the training feature is constant
+    assert np.isnan(scores.mse).sum() == 1
+    assert np.nanmax(scores.mse) == pytest.approx(0, abs=1e-12)
+
+# -------------------------------------------------
+# Tests for summarize
+# -------------------------------------------------
+
+def test_summarize(line_df):
+    scores = cross_validate(line_df["x"], line_df["y"], 5, 2, seed=4)
+    summary = summarize(scores)
+    assert summary.keys() == CV_KEYS
+    assert summary["folds"] == 5 and summary["repeats"] == 2
+    assert summary["r_squared_mean"] == pytest.approx(scores.r_squared.mean())
+    assert summary["mse_std"] == pytest.approx(scores.mse.std(ddof=1))
+
+def test_summarize_skips_nan():
+    x = pd.Series([1.0, 1.0, 1.0, 2.0])
+    summary = summarize(cross_validate(x, 2 * x, folds=4, seed=0))
+    assert summary["mse_mean"] == pytest.approx(0, abs=1e-12)
+    # Every test fold has a single row, so R² is not defined
+    assert np.isnan(summary["r_squared_mean"])
+
+# -------------------------------------------------
+# Tests for invalid input
+# -------------------------------------------------
+
+def test_different_lengths():
+    with pytest.raises(ValueError, match="same length"):
+        cross_validate(pd.Series([1.0, 2.0, 3.0]), pd.Series([1.0, 2.0]))
+
+def test_fewer_rows_than_folds():
+    with pytest.raises(ValueError, match="as many rows as folds"):
+        cross_validate(pd.Series([1.0, 2.0, 3.0]), pd.Series([1.0, 2.0, 3.0]), folds=5)
+
+def test_missing_values():
+    x = pd.Series([1.0, np.nan, 3.0, 4.0, 5.0])
+    with pytest.raises(ValueError, match="missing values"):
+        cross_validate(x, x, folds=2)
+
+@pytest.mark.parametrize("folds, repeats", [(1, 1), (5, 0)])
+def test_invalid_parameters(folds, repeats):
+    x = pd.Series(np.arange(10.0))
+    with pytest.raises(ValueError):
+        cross_validate(x, x, folds, repeats)
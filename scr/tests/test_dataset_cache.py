@@ -0,0 +1,170 @@
+import pytest
+import pandas as pd
+import numpy as np
+import os
+from dataset_cache import DatasetCache, file_fingerprint
+from open_files import open_file
+
+def _is_memory_mapped(array):
+    """
+    Check if an array is a view of a memory-mapped file.
+    """
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+@pytest.fixture
+def cache(tmp_path):
+    """
+    Fixture to provide an empty cache in a temporary directory.
+    """
+    return DatasetCache(cache_dir=tmp_path / "cache")
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    """
+    Fixture to create a CSV file with numeric, text and missing values.
+    """
+    csv_path = tmp_path / "data.csv"
+    pd.DataFrame({
+        "x": [1, 2, 3, 4],
+        "y": [1.5, None, 3.5, 4.5],
+        "city": ["Madrid", "Paris", None, "Madrid"],
+    }).to_csv(csv_path, index=False)
+    return csv_path
+
+# -------------------------------------------------
+# Tests for file_fingerprint
+# -------------------------------------------------
+
+def test_fingerprint_changes_with_content(sample_csv):
+    """
+    Test that rewriting a file with the same size and modification time changes its fingerprint.
+    """
+    before = file_fingerprint(sample_csv)
+    content = sample_csv.read_bytes()
+    sample_csv.write_bytes(content.replace(b"Madrid", b"Lisboa"))
+    os.utime(sample_csv, ns=(before.mtime_ns, before.mtime_ns))
+
+    after = file_fingerprint(sample_csv)
+    assert after.size == before.size
+    assert after.content_hash != before.content_hash
+
+# -------------------------------------------------
+# Tests for DatasetCache
+# -------------------------------------------------
+
+def test_store_and_load(cache, sample_csv):
+    """
+    Test that a cached dataset is identical to the parsed one.
+    """
+    df = pd.read_csv(sample_csv)
+    fingerprint = file_fingerprint(sample_csv)
+
+    assert cache.load(fingerprint) is None
+    assert cache.store(fingerprint, df)
+    pd.testing.assert_frame_equal(cache.load(fingerprint), df)
+
+def test_load_is_memory_mapped(cache, sample_csv):
+    """
+    Test that numeric columns are memory-mapped instead of copied.
+    """
+    fingerprint = file_fingerprint(sample_csv)
+    cache.store(fingerprint, pd.read_csv(sample_csv))
+
+    cached = cache.load(fingerprint)
+    assert _is_memory_mapped(cached["x"].values)
+
+def test_category_column(cache, sample_csv):
+    df = pd.read_csv(sample_csv).astype({"city": "category"})
+    fingerprint = file_fingerprint(sample_csv)
+    cache.store(fingerprint, df)
+    pd.testing.assert_frame_equal(cache.load(fingerprint), df)
+
+def test_changed_file_is_not_hit(cache, sample_csv):
+    """
+    Test that an entry is not used once the source file changes, and that it is replaced.
+    """
+    cache.store(file_fingerprint(sample_csv), pd.read_csv(sample_csv))
+    sample_csv.write_text("x,y\n1,2\n")
+
+    fingerprint = file_fingerprint(sample_csv)
+    assert cache.load(fingerprint) is None
+    cache.store(fingerprint, pd.read_csv(sample_csv))
+    assert len(cache.info()) == 1
+
+def test_tables_have_separate_entries(cache, sample_csv):
+    """
+    Test that entries of different tables of the same file coexist.
+    """
+    fingerprint = file_fingerprint(sample_csv)
+    first = pd.DataFrame({"a": [1, 2]})
+    second = pd.DataFrame({"b": [3.0]})
+    cache.store(fingerprint, first, "first")
+    cache.store(fingerprint, second, "second")
+
+    assert {entry["table"] for entry in cache.info()} == {"first", "second"}
+    pd.testing.assert_frame_equal(cache.load(fingerprint, "first"), first)
+    pd.testing.assert_frame_equal(cache.load(fingerprint, "second"), second)
+    assert cache.load(fingerprint) is None
+
+def test_lru_eviction(tmp_path):
+    """
+    Test that the least recently used entry is evicted when the size limit is exceeded.
+    """
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.csv"
+        pd.DataFrame({"x": np.arange(1000)}).to_csv(path, index=False)
+        paths.append(path)
+
+    # Each entry takes a bit more than 8000 bytes, so only two fit
+    cache = DatasetCache(cache_dir=tmp_path / "cache", max_bytes=20000)
+    fingerprints = [file_fingerprint(path) for path in paths]
+    cache.store(fingerprints[0], pd.read_csv(paths[0]))
+    cache.store(fingerprints[1], pd.read_csv(paths[1]))
+    cache.load(fingerprints[0])  # "a" becomes the most recently used
+    cache.store(fingerprints[2], pd.read_csv(paths[2]))
+
+    sources = {entry["source"] for entry in cache.info()}
+    assert sources == {str(paths[0]), str(paths[2])}
+    assert cache.size <= cache.max_bytes
+
+def test_custom_index_is_not_stored(cache, sample_csv):
+    df = pd.read_csv(sample_csv).set_index("city")
+    assert not cache.store(file_fingerprint(sample_csv), df)
+    assert cache.info() == []
+
+def test_clear(cache, sample_csv):
+    cache.store(file_fingerprint(sample_csv), pd.read_csv(sample_csv))
+    cache.clear()
+    assert cache.info() == []
+    assert cache.size == 0
+
+def test_open_file_with_cache(cache, sample_csv):
+    """
+    Test that open_file fills the cache on the first opening and uses it on the second one.
+    """
+    first = open_file(sample_csv, cache=cache)
+    assert len(cache.info()) == 1
+
+    second = open_file(sample_csv, cache=cache)
+    pd.testing.assert_frame_equal(first, second)
+    assert _is_memory_mapped(second["x"].values)
+
+def test_open_file_optimized_reopen(cache, sample_csv):
+    """
+    Test that a dataset opened with optimize is cached optimized, so reopening
+    it keeps the memory-mapped columns instead of converting them again.
+    """
+    first = open_file(sample_csv, cache=cache, optimize=True)
+    assert first["x"].dtype == np.uint8
+    assert "memory_report" in first.attrs
+
+    second = open_file(sample_csv, cache=cache, optimize=True)
+    pd.testing.assert_frame_equal(first, second, check_categorical=False)
+    assert second.attrs["optimized"]
+    assert _is_memory_mapped(second["x"].values)
+    assert not second["x"].values.flags.writeable
@@ -0,0 +1,81 @@
+import pytest
+import pandas as pd
+import numpy as np
+from dtype_optimizer import optimize_dtypes
+from linear_regression import LinearRegression
+from open_files import open_file
+
+@pytest.fixture
+def sample_df():
+    """
+    Fixture to provide a DataFrame of small integers, floats and repeated labels.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "small": rng.integers(0, 100, 1000),
+        "negative": rng.integers(-1000, 1000, 1000),
+        "whole": rng.integers(0, 50, 1000).astype("float64"),
+        "halves": rng.integers(0, 50, 1000) / 2,
+        "precise": rng.random(1000),
+        "missing": np.where(np.arange(1000) % 10 == 0, np.nan, 1.5),
+        "label": rng.choice(["north", "south", "east", "west"], 1000),
+        "unique": [f"id-{i}" for i in range(1000)],
+    })
+
+# -------------------------------------------------
+# Tests for optimize_dtypes
+# -------------------------------------------------
+
+def test_optimized_dtypes(sample_df):
+    df, _ = optimize_dtypes(sample_df)
+    assert df["small"].dtype == np.uint8
+    assert df["negative"].dtype == np.int16
+    assert df["whole"].dtype == np.uint8
+    assert df["halves"].dtype == np.float32
+    assert df["precise"].dtype == np.float64  # float32 would round it
+    assert df["missing"].dtype == np.float32
+    assert isinstance(df["label"].dtype, pd.CategoricalDtype)
+    assert df["unique"].dtype == object
+
+def test_values_are_kept(sample_df):
+    df, _ = optimize_dtypes(sample_df)
+    pd.testing.assert_frame_equal(df, sample_df, check_dtype=False, check_categorical=False)
+
+def test_memory_report(sample_df):
+    df, report = optimize_dtypes(sample_df)
+    assert report.after < report.before
+    assert report.after == df.memory_usage(deep=True).sum()
+
+def test_unchanged_columns_are_not_copied(sample_df):
+    df, _ = optimize_dtypes(sample_df)
+    assert np.shares_memory(df["precise"].to_numpy(), sample_df["precise"].to_numpy())
+
+def test_nothing_to_narrow(sample_df):
+    wide = sample_df[["precise", "unique"]]
+    df, report = optimize_dtypes(wide)
+    assert df is not wide
+    assert report.after == report.before
+    assert np.shares_memory(df["precise"].to_numpy(), wide["precise"].to_numpy())
+
+def test_input_not_modified(sample_df):
+    original = sample_df.copy()
+    optimize_dtypes(sample_df)
+    pd.testing.assert_frame_equal(sample_df, original)
+
+def test_regression_is_unchanged(sample_df):
+    """
+    Test that a model fitted on downcast columns is the same as on the original ones.
+    """
+    df, _ = optimize_dtypes(sample_df)
+    original = LinearRegression(sample_df["small"], sample_df["halves"])
+    optimized = LinearRegression(df["small"], df["halves"])
+    assert optimized.slope == original.slope
+    assert optimized.intercept == original.intercept
+    assert optimized.mse == original.mse
+
+def test_open_file_optimize(tmp_path, sample_df):
+    csv_path = tmp_path / "data.csv"
+    sample_df.to_csv(csv_path, index=False)
+    df = open_file(csv_path, optimize=True)
+    assert df["small"].dtype == np.uint8
+    assert df.attrs["memory_report"].after < df.attrs["memory_report"].before
@@ -0,0 +1,110 @@
+import pytest
+import pandas as pd
+import numpy as np
+import excel_reader
+from excel_reader import iter_excel, read_excel, ExcelCatalog
+from open_files import open_file, probe_schema
+from exceptions import EmptyDataError
+
+@pytest.fixture
+def workbook(tmp_path):
+    """
+    Fixture to create a workbook with a mixed-type sheet and a second, smaller sheet.
+    """
+    path = tmp_path / "book.xlsx"
+    data = pd.DataFrame({
+        "id": np.arange(25),
+        "value": np.linspace(0, 1, 25),
+        "name": [f"item {i}" for i in range(25)],
+        "date": pd.date_range("2024-01-01", periods=25),
+        "flag": [i % 2 == 0 for i in range(25)],
+    })
+    data.loc[3, "value"] = np.nan
+    with pd.ExcelWriter(path) as writer:
+        data.to_excel(writer, sheet_name="Data", index=False)
+        pd.DataFrame({"colA": [10, 20]}).to_excel(writer, sheet_name="Small", index=False)
+    return path
+
+# -------------------------------------------------
+# Tests for iter_excel and read_excel
+# -------------------------------------------------
+
+def test_read_excel_matches_pandas(workbook):
+    pd.testing.assert_frame_equal(read_excel(workbook), pd.read_excel(workbook))
+
+def test_iter_excel_batches(workbook):
+    batches = list(iter_excel(workbook, batch_size=10))
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), pd.read_excel(workbook))
+
+def test_iter_excel_columns(workbook):
+    batch = next(iter_excel(workbook, columns=["value", "id"]))
+    assert list(batch.columns) == ["value", "id"]
+
+def test_iter_excel_invalid_batch_size(workbook):
+    with pytest.raises(ValueError):
+        iter_excel(workbook, batch_size=0)
+
+def test_empty_batch_keeps_dtype(tmp_path):
+    """
+    Test that a batch where a column has no values gets the dtype of previous batches.
+    """
+    path = tmp_path / "gaps.xlsx"
+    pd.DataFrame({
+        "x": [1.5, 2.5, None, None],
+        "when": [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02"), None, None],
+        "key": [1, 2, 3, 4],
+    }).to_excel(path, index=False)
+
+    batches = list(iter_excel(path, batch_size=2))
+    assert batches[1]["x"].dtype == np.float64
+    assert batches[1]["when"].dtype == batches[0]["when"].dtype
+    assert read_excel(path)["when"].dtype.kind == "M"
+
+def test_blank_rows_and_short_rows(tmp_path):
+    path = tmp_path / "blank.xlsx"
+    pd.DataFrame({"a": [1, None, 3], "b": [None, None, 6]}).to_excel(path, index=False)
+    pd.testing.assert_frame_equal(read_excel(path), pd.read_excel(path))
+
+# -------------------------------------------------
+# Tests for sheet selection
+# -------------------------------------------------
+
+@pytest.mark.parametrize("sheet", ["Small", 1])
+def test_read_excel_sheet(workbook, sheet):
+    assert read_excel(workbook, sheet=sheet)["colA"].tolist() == [10, 20]
+
+def test_missing_sheet(workbook):
+    with pytest.raises(EmptyDataError, match="Other"):
+        read_excel(workbook, sheet="Other")
+
+def test_open_file_sheet(workbook):
+    df = open_file(workbook, table="Small")
+    assert list(df.columns) == ["colA"]
+    assert list(probe_schema(workbook, table="Small")) == ["colA"]
+
+def test_open_file_stream_excel(workbook):
+    chunks = list(open_file(workbook, stream=True, memory_limit=64 * 5 * 10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+def test_catalog(workbook):
+    catalog = ExcelCatalog(workbook)
+    assert catalog.names == ["Data", "Small"]
+    assert catalog.default_table() == "Data"
+    assert catalog.columns("Small") == ["colA"]
+    assert catalog.estimated_rows("Data") == 25
+
+def test_catalog_opens_workbook_once(workbook, monkeypatch):
+    """
+    Test that describing every sheet, as the table picker does, parses the workbook once.
+    """
+    opened = []
+    load_workbook = excel_reader.load_workbook
+    monkeypatch.setattr(excel_reader, "load_workbook",
+                        lambda *args, **kwargs: opened.append(args) or load_workbook(*args, **kwargs))
+
+    catalog = ExcelCatalog(workbook)
+    for name in catalog.names:
+        catalog.columns(name)
+        catalog.estimated_rows(name)
+    assert len(opened) == 1
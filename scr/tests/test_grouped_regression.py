@@ -0,0 +1,65 @@
+import pytest
+import pandas as pd
+import numpy as np
+from linear_regression import LinearRegression
+from grouped_regression import fit_grouped, GROUPED_COLUMNS
+
+@pytest.fixture
+def stores_df():
+    """
+    Fixture to provide sales of several stores, each with its own slope.
+    """
+    rng = np.random.default_rng(21)
+    store = rng.choice(["north", "south", "east", "west"], 2000)
+    slopes = pd.Series({"north": 1.0, "south": 2.0, "east": -1.0, "west": 0.5})
+    x = rng.uniform(0, 50, 2000)
+    y = 10 + slopes[store].to_numpy() * x + rng.normal(0, 1, 2000)
+    return pd.DataFrame({"store": store, "x": x, "y": y})
+
+# -------------------------------------------------
+# Tests for fit_grouped
+# -------------------------------------------------
+
+def test_matches_one_model_per_group(stores_df):
+    models = fit_grouped(stores_df["x"], stores_df["y"], stores_df["store"], block_size=300)
+    assert list(models.columns) == GROUPED_COLUMNS
+    assert list(models.index) == ["east", "north", "south", "west"]  # Sorted keys
+    assert models.index.name == "store"
+
+    for store, rows in stores_df.groupby("store"):
+        model = LinearRegression(rows["x"], rows["y"])
+        result = models.loc[store]
+        assert result["rows"] == len(rows)
+        assert result["slope"] == pytest.approx(model.slope, rel=1e-10)
+        assert result["intercept"] == pytest.approx(model.intercept, rel=1e-10)
+        assert result["r_squared"] == pytest.approx(model.r_squared, rel=1e-10)
+        assert result["mse"] == pytest.approx(model.mse, rel=1e-10)
+
+def test_block_size_does_not_change_results(stores_df):
+    small = fit_grouped(stores_df["x"], stores_df["y"], stores_df["store"], block_size=7)
+    large = fit_grouped(stores_df["x"], stores_df["y"], stores_df["store"])
+    pd.testing.assert_frame_equal(small, large, rtol=1e-10)
+
+def test_missing_values_are_skipped(stores_df):
+    stores_df.loc[0, "store"] = None
+    stores_df.loc[1, "x"] = np.nan
+    models = fit_grouped(stores_df["x"], stores_df["y"], stores_df["store"])
+    assert models["rows"].sum() == len(stores_df) - 2
+
+def test_groups_that_cannot_be_fitted():
+    x = pd.Series([1.0, 2.0, 3.0, 5.0, 5.0, 7.0])
+    y = pd.Series([2.0, 4.0, 6.0, 1.0, 2.0, 3.0])
+    groups = pd.Series(["a", "a", "a", "constant", "constant", "single"])
+    models = fit_grouped(x, y, groups)
+    assert models.loc["a", "slope"] == pytest.approx(2)
+    assert models.loc["constant"].drop("rows").isna().all()
+    assert models.loc["single"].drop("rows").isna().all()
+    assert models.loc["single", "rows"] == 1
+
+def test_invalid_data():
+    with pytest.raises(ValueError):
+        fit_grouped(pd.Series([1.0, 2.0]), pd.Series([1.0]), pd.Series(["a", "b"]))
+    with pytest.raises(TypeError):
+        fit_grouped(pd.Series(["a"]), pd.Series([1.0]), pd.Series(["a"]))
+    with pytest.raises(ValueError):
+        fit_grouped(pd.Series([1.0]), pd.Series([1.0]), pd.Series([None]))
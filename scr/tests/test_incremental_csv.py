@@ -0,0 +1,139 @@
+import io
+import pytest
+import pandas as pd
+import incremental_csv
+from incremental_csv import IncrementalCSVReader
+from exceptions import FileFormatError, EmptyDataError
+
+@pytest.fixture
+def log_csv(tmp_path):
+    """
+    Fixture to create a CSV log with three rows.
+    """
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text("t,value\n1,10\n2,20\n3,30\n")
+    return csv_path
+
+def append(path, text):
+    """Append text to a file."""
+    with open(path, "a") as f:
+        f.write(text)
+
+# -------------------------------------------------
+# Tests for IncrementalCSVReader
+# -------------------------------------------------
+
+def test_read(log_csv):
+    df = IncrementalCSVReader(log_csv).read()
+    pd.testing.assert_frame_equal(df, pd.read_csv(log_csv))
+
+def test_reload_appended_rows(log_csv):
+    reader = IncrementalCSVReader(log_csv)
+    reader.read()
+    append(log_csv, "4,40\n5,50\n")
+
+    result = reader.reload()
+    assert result.new_rows == 2 and not result.full
+    pd.testing.assert_frame_equal(result.data, pd.read_csv(log_csv))
+
+def test_reload_without_changes(log_csv):
+    reader = IncrementalCSVReader(log_csv)
+    reader.read()
+    result = reader.reload()
+    assert result.new_rows == 0 and not result.full
+    assert len(result.data) == 3
+
+def test_reload_unfinished_line(log_csv):
+    """
+    Test that a line being written is read again once it is complete.
+    """
+    reader = IncrementalCSVReader(log_csv)
+    reader.read()
+    append(log_csv, "4,4")
+    assert reader.reload().data["value"].tolist() == [10, 20, 30, 4]
+
+    append(log_csv, "0\n5,50\n")
+    result = reader.reload()
+    assert result.new_rows == 2
+    pd.testing.assert_frame_equal(result.data, pd.read_csv(log_csv))
+
+def test_reload_truncated_file(log_csv):
+    reader = IncrementalCSVReader(log_csv)
+    reader.read()
+    log_csv.write_text("t,value\n1,10\n")
+    result = reader.reload()
+    assert result.full
+    assert len(result.data) == 1
+
+def test_reload_rewritten_file(log_csv):
+    """
+    Test that a file rewritten with more rows is not taken for an append.
+    """
+    reader = IncrementalCSVReader(log_csv)
+    reader.read()
+    log_csv.write_text("t,value\n7,70\n8,80\n9,90\n10,100\n")
+    result = reader.reload()
+    assert result.full
+    pd.testing.assert_frame_equal(result.data, pd.read_csv(log_csv))
+
+def test_reload_header_only(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text("t,value\n")
+    reader = IncrementalCSVReader(csv_path)
+    assert reader.read().empty
+    append(csv_path, "1,10\n")
+    assert reader.reload().data["value"].tolist() == [10]
+
+def test_reload_columns(log_csv):
+    reader = IncrementalCSVReader(log_csv, columns=["value"])
+    reader.read()
+    append(log_csv, "4,40\n")
+    assert list(reader.reload().data.columns) == ["value"]
+
+def test_unfinished_line_longer_than_scan_block(log_csv, monkeypatch):
+    """
+    Test that the last newline is found when the file is scanned backwards in several blocks.
+    """
+    monkeypatch.setattr(incremental_csv, "SCAN_BLOCK_SIZE", 3)
+    reader = IncrementalCSVReader(log_csv)
+    reader.read()
+    append(log_csv, "4,40\n5,5000000")
+    result = reader.reload()
+    assert result.data["value"].tolist() == [10, 20, 30, 40, 5000000]
+    append(log_csv, "0\n")
+    assert reader.reload().data["value"].tolist() == [10, 20, 30, 40, 50000000]
+
+def test_file_is_not_read_at_once(tmp_path, monkeypatch):
+    """
+    Test that the rows are parsed from the file in pieces, not from a copy of the whole file.
+    """
+    csv_path = tmp_path / "log.csv"
+    pd.DataFrame({"t": range(500_000), "value": range(500_000)}).to_csv(csv_path, index=False)
+    reads = []
+
+    class RecordedFile(io.FileIO):
+        def read(self, size=-1):
+            data = super().read(size)
+            reads.append(len(data))
+            return data
+
+        def readinto(self, buffer):
+            size = super().readinto(buffer)
+            reads.append(size)
+            return size
+
+    monkeypatch.setattr(incremental_csv, "open", lambda path, mode: RecordedFile(path, "r"),
+                        raising=False)
+    df = IncrementalCSVReader(csv_path).read()
+    assert len(df) == 500_000
+    assert max(reads) < csv_path.stat().st_size // 4
+
+def test_empty_file(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    csv_path.write_text("")
+    with pytest.raises(EmptyDataError):
+        IncrementalCSVReader(csv_path).read()
+
+def test_not_plain_csv(tmp_path):
+    with pytest.raises(FileFormatError):
+        IncrementalCSVReader(tmp_path / "log.csv.gz")
@@ -0,0 +1,93 @@
+import pytest
+import pandas as pd
+import numpy as np
+import os
+from line_index import LineIndex, LINE_INDEX_DIR
+from exceptions import FileFormatError, EmptyDataError
+
+@pytest.fixture
+def sample_csv(tmp_path):
+    """
+    Fixture to create a CSV file with 1000 rows.
+    """
+    csv_path = tmp_path / "data.csv"
+    df = pd.DataFrame({"x": np.arange(1000), "y": np.arange(1000) * 0.5,
+                       "label": [f"row {i}" for i in range(1000)]})
+    df.to_csv(csv_path, index=False)
+    return csv_path, df
+
+# -------------------------------------------------
+# Tests for LineIndex.build and read_rows
+# -------------------------------------------------
+
+@pytest.mark.parametrize("stride", [1, 7, 1024])
+def test_read_rows(sample_csv, stride):
+    csv_path, df = sample_csv
+    index = LineIndex.build(csv_path, stride=stride, block_size=100)
+    assert index.rows == 1000
+    pd.testing.assert_frame_equal(index.read_rows(123, 140), df.iloc[123:140])
+    pd.testing.assert_frame_equal(index.read_rows(990, 2000), df.iloc[990:])
+
+def test_no_final_newline(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_bytes(b"x,y\r\n1,2\r\n3,4")
+    index = LineIndex.build(csv_path, stride=1)
+    assert index.rows == 2
+    assert index.read_rows(1, 2)["x"].tolist() == [3]
+
+def test_header_only(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("x,y")
+    index = LineIndex.build(csv_path)
+    assert index.rows == 0
+    assert list(index.read_rows(0, 10).columns) == ["x", "y"]
+
+def test_empty_file(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("")
+    with pytest.raises(EmptyDataError):
+        LineIndex.build(csv_path)
+
+def test_not_plain_csv(tmp_path):
+    with pytest.raises(FileFormatError):
+        LineIndex.build(tmp_path / "data.csv.gz")
+
+def test_split_on_row_boundaries(sample_csv):
+    """
+    Test that the ranges cover every row once and their byte offsets match the rows.
+    """
+    csv_path, df = sample_csv
+    index = LineIndex.build(csv_path, stride=16)
+    ranges = index.split(3)
+    assert len(ranges) == 3
+    assert ranges[0][0] == 0 and ranges[-1][1] == 1000
+
+    content = csv_path.read_bytes()
+    header = content[:content.index(b"\n") + 1]
+    parts = []
+    for start, stop, begin, end in ranges:
+        part = pd.read_csv(pd.io.common.BytesIO(header + content[begin:end]))
+        assert len(part) == stop - start
+        parts.append(part)
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), df)
+
+# -------------------------------------------------
+# Tests for LineIndex.load_or_build
+# -------------------------------------------------
+
+def test_index_is_persisted(sample_csv, tmp_path):
+    csv_path, df = sample_csv
+    cache_dir = tmp_path / "cache"
+    LineIndex.load_or_build(csv_path, cache_dir=cache_dir, stride=10)
+    assert len(os.listdir(cache_dir / LINE_INDEX_DIR)) == 1
+
+    loaded = LineIndex.load_or_build(csv_path, cache_dir=cache_dir)
+    assert loaded.stride == 10  # Loaded, not built with the default stride
+    pd.testing.assert_frame_equal(loaded.read_rows(500, 510), df.iloc[500:510])
+
+def test_changed_file_is_indexed_again(sample_csv, tmp_path):
+    csv_path, _ = sample_csv
+    cache_dir = tmp_path / "cache"
+    LineIndex.load_or_build(csv_path, cache_dir=cache_dir)
+    csv_path.write_text("x\n1\n2\n")
+    assert LineIndex.load_or_build(csv_path, cache_dir=cache_dir).rows == 2
@@ -1,7 +1,11 @@
 import pytest
 import pandas as pd
 import numpy as np
-from linear_regression import LinearRegression
+import pickle
+from linear_regression import LinearRegression, IncrementalLinearRegression, MultipleLinearRegression
+from nan_handler import NaNHandler
+from sampling import SampleInfo
+
 
 @pytest.fixture
 def sample_data():
@@ -14,6 +18,7 @@ def sample_data():
     y = pd.Series([5, 7, 9, 11, 13], name="Sales")  # y = 2x + 3
     return x, y
 
+
 @pytest.fixture
 def linear_model(sample_data):
     """
@@ -22,6 +27,7 @@ def linear_model(sample_data):
     x, y = sample_data
     return LinearRegression(feature=x, target=y)
 
+
 # -------------------------------------------------
 # Tests for initialization and properties
 # -------------------------------------------------
@@ -43,6 +49,7 @@ def test_initialization(sample_data):
     assert model.r_squared is not None
     assert model.mse is not None
 
+
 def test_property_access(linear_model):
     """
     Test that all properties are accessible and return expected types.
@@ -55,6 +62,7 @@ def test_property_access(linear_model):
     assert isinstance(linear_model.r_squared, float)
     assert isinstance(linear_model.mse, float)
 
+
 # -------------------------------------------------
 # Tests for model calculations
 # -------------------------------------------------
@@ -73,6 +81,7 @@ def test_perfect_linear_relationship(sample_data):
     assert model.r_squared == pytest.approx(1.0, rel=1e-10)
     assert model.mse == pytest.approx(0.0, rel=1e-10)
 
+
 def test_predictions(linear_model, sample_data):
     """
     Test that predictions match expected values.
@@ -85,6 +94,64 @@ def test_predictions(linear_model, sample_data):
         expected_predictions.values
     )
 
+
+def test_from_chunks(sample_data):
+    """
+    Test that a model built from DataFrame chunks matches the one built from full series.
+    """
+    x, y = sample_data
+    df = pd.DataFrame({"Temperature": x, "Sales": y, "Other": 0})
+    chunks = (df.iloc[i:i + 2] for i in range(0, len(df), 2))
+
+    model = LinearRegression.from_chunks(chunks, "Temperature", "Sales")
+
+    assert model.feature_name == "Temperature"
+    assert model.slope == pytest.approx(2, rel=1e-10)
+    assert model.intercept == pytest.approx(3, rel=1e-10)
+
+
+def test_from_chunks_empty():
+    with pytest.raises(ValueError):
+        LinearRegression.from_chunks(iter([]), "X", "Y")
+
+
+@pytest.mark.parametrize("method, constant_value", [
+    ("Delete Rows", None),
+    ("Fill with Mean", None),
+    ("Fill with a Constant Value", 2.5),
+])
+
+
+def test_from_chunks_with_missing_values(method, constant_value):
+    """
+    Test that the missing values of each chunk are handled as NaNHandler does on
+    the whole DataFrame, without joining the chunks.
+    """
+    rng = np.random.default_rng(0)
+    x = 1e6 + rng.normal(size=1000)
+    df = pd.DataFrame({"X": x, "Y": 3 * x + rng.normal(size=1000)})
+    df.loc[rng.choice(1000, 100), "X"] = np.nan
+    df.loc[rng.choice(1000, 100), "Y"] = np.nan
+    chunks = (df.iloc[i:i + 64] for i in range(0, len(df), 64))
+
+    model = LinearRegression.from_chunks(chunks, "X", "Y", method, constant_value)
+
+    processed = NaNHandler(df, ["X", "Y"]).preprocess(method, constant_value)
+    expected = LinearRegression(processed["X"], processed["Y"])
+    assert model.predictions is None
+    assert model.slope == pytest.approx(expected.slope, rel=1e-9)
+    assert model.intercept == pytest.approx(expected.intercept, rel=1e-9)
+    assert model.r_squared == pytest.approx(expected.r_squared, rel=1e-9)
+    assert model.mse == pytest.approx(expected.mse, rel=1e-9)
+    np.testing.assert_allclose(model.predict(processed["X"]), expected.predictions)
+
+
+def test_from_chunks_fill_with_median():
+    chunks = [pd.DataFrame({"X": [1.0, np.nan, 3.0], "Y": [1.0, 2.0, 4.0]})]
+    with pytest.raises(ValueError):
+        LinearRegression.from_chunks(chunks, "X", "Y", "Fill with Median")
+
+
 # -------------------------------------------------
 # Tests for error handling
 # -------------------------------------------------
@@ -97,6 +164,7 @@ def test_empty_data():
     with pytest.raises(ValueError):
         LinearRegression(feature=empty_series, target=empty_series)
 
+
 def test_mismatched_lengths():
     """
     Test error handling when feature and target have different lengths.
@@ -107,6 +175,7 @@ def test_mismatched_lengths():
     with pytest.raises(ValueError):
         LinearRegression(feature=x, target=y)
 
+
 def test_non_numeric_data():
     """
     Test error handling with non-numeric data.
@@ -117,6 +186,7 @@ def test_non_numeric_data():
     with pytest.raises(TypeError):
         LinearRegression(feature=x, target=y)
 
+
 # -------------------------------------------------
 # Tests for different data patterns
 # -------------------------------------------------
@@ -132,6 +202,7 @@ def test_constant_target():
     assert model.slope == pytest.approx(0, abs=1e-10)
     assert model.r_squared == pytest.approx(0, abs=1e-10)
 
+
 def test_noisy_data():
     """
     Test model behavior with noisy data.
@@ -153,6 +224,7 @@ def test_noisy_data():
     assert 0.95 < model.r_squared < 1.0
     assert model.mse > 0
 
+
 def test_negative_correlation():
     """
     Test model behavior with negatively correlated data.
@@ -164,4 +236,214 @@ def test_negative_correlation():
     
     assert model.slope == pytest.approx(-2, rel=1e-10)
     assert model.intercept == pytest.approx(12, rel=1e-10)
-    assert model.r_squared == pytest.approx(1.0, rel=1e-10)
\ No newline at end of file
+    assert model.r_squared == pytest.approx(1.0, rel=1e-10)
+
+
+# -------------------------------------------------
+# Tests for models fitted on a sample
+# -------------------------------------------------
+
+def test_not_trained_on_sample(linear_model):
+    assert not linear_model.trained_on_sample
+    assert linear_model.sample is None
+
+
+def test_trained_on_sample_from_attrs(sample_data):
+    """
+    Test that the sample described by open_file in the DataFrame reaches the model.
+    """
+    x, y = sample_data
+    df = pd.DataFrame({"Temperature": x, "Sales": y})
+    df.attrs["sample"] = SampleInfo(5, 1000, 0)
+    model = LinearRegression(df["Temperature"], df["Sales"])
+    assert model.trained_on_sample
+    assert model.sample.total_rows == 1000
+
+
+# -------------------------------------------------
+# Tests for the regression engines
+# -------------------------------------------------
+
+def test_engines_give_same_results():
+    pytest.importorskip("statsmodels")
+    rng = np.random.default_rng(1)
+    x = pd.Series(rng.uniform(-50, 50, 2000), name="X")
+    y = pd.Series(-1.5 * x + 7 + rng.normal(0, 4, 2000), name="Y")
+
+    native = LinearRegression(x, y)
+    reference = LinearRegression(x, y, engine="statsmodels")
+    assert native.slope == pytest.approx(reference.slope, rel=1e-10)
+    assert native.intercept == pytest.approx(reference.intercept, rel=1e-10)
+    assert native.r_squared == pytest.approx(reference.r_squared, rel=1e-10)
+    assert native.mse == pytest.approx(reference.mse, rel=1e-10)
+    np.testing.assert_allclose(native.predictions, reference.predictions, rtol=1e-10)
+
+
+def test_unknown_engine(sample_data):
+    x, y = sample_data
+    with pytest.raises(ValueError, match="engine"):
+        LinearRegression(x, y, engine="sklearn")
+
+
+def test_constant_feature_rejected():
+    x = pd.Series([2, 2, 2, 2], name="X")
+    y = pd.Series([1, 2, 3, 4], name="Y")
+    with pytest.raises(ValueError, match="constant"):
+        LinearRegression(x, y)
+
+
+# -------------------------------------------------
+# Tests for cross-validation
+# -------------------------------------------------
+
+def test_cross_validate_stores_summary(sample_data):
+    x, y = sample_data
+    model = LinearRegression(x, y)
+    assert model.cv is None
+    scores = model.cross_validate(folds=2, repeats=3, seed=0)
+    assert len(scores.mse) == 6
+    assert model.cv["folds"] == 2 and model.cv["repeats"] == 3
+    assert model.cv["mse_mean"] == pytest.approx(np.nanmean(scores.mse))
+
+
+def test_cross_validate_without_rows():
+    model = LinearRegression.from_sums("X", "Y", 3, 6, 12, 14, 28, 56)
+    with pytest.raises(ValueError, match="no rows"):
+        model.cross_validate()
+
+
+# -------------------------------------------------
+# Tests for IncrementalLinearRegression
+# -------------------------------------------------
+
+@pytest.fixture
+def noisy_df():
+    """
+    Fixture to provide noisy linear data (y = 2x + 3 + noise).
+    """
+    rng = np.random.default_rng(5)
+    x = rng.uniform(0, 100, 3000)
+    return pd.DataFrame({"X": x, "Y": 2 * x + 3 + rng.normal(0, 5, 3000)})
+
+
+def assert_same_model(model, expected):
+    assert model.slope == pytest.approx(expected.slope, rel=1e-10)
+    assert model.intercept == pytest.approx(expected.intercept, rel=1e-10)
+    assert model.r_squared == pytest.approx(expected.r_squared, rel=1e-10)
+    assert model.mse == pytest.approx(expected.mse, rel=1e-10)
+
+
+def test_partial_fit_matches_full_fit(noisy_df):
+    incremental = IncrementalLinearRegression("X", "Y")
+    for start in range(0, len(noisy_df), 700):
+        chunk = noisy_df.iloc[start:start + 700]
+        assert incremental.partial_fit(chunk["X"], chunk["Y"]) is incremental
+    assert incremental.n == len(noisy_df)
+
+    model = incremental.finalize()
+    assert model.feature_name == "X" and model.target_name == "Y"
+    assert model.predictions is None
+    assert_same_model(model, LinearRegression(noisy_df["X"], noisy_df["Y"]))
+
+
+def test_merge_matches_full_fit(noisy_df):
+    parts = []
+    for start in range(0, len(noisy_df), 1000):
+        chunk = noisy_df.iloc[start:start + 1000]
+        parts.append(IncrementalLinearRegression("X", "Y").partial_fit(chunk["X"], chunk["Y"]))
+
+    # States are sent between processes pickled
+    parts = [pickle.loads(pickle.dumps(part)) for part in parts]
+    merged = IncrementalLinearRegression("X", "Y")
+    for part in reversed(parts):
+        merged.merge(part)
+    assert merged.n == len(noisy_df)
+    assert_same_model(merged.finalize(), LinearRegression(noisy_df["X"], noisy_df["Y"]))
+
+
+def test_partial_fit_empty_chunk(noisy_df):
+    incremental = IncrementalLinearRegression("X", "Y")
+    incremental.partial_fit(noisy_df["X"], noisy_df["Y"])
+    before = incremental.moments
+    incremental.partial_fit(noisy_df["X"].iloc[:0], noisy_df["Y"].iloc[:0])
+    assert incremental.moments == before
+
+
+def test_finalize_without_rows():
+    with pytest.raises(ValueError):
+        IncrementalLinearRegression("X", "Y").finalize()
+
+
+def test_partial_fit_invalid_chunks():
+    incremental = IncrementalLinearRegression("X", "Y")
+    with pytest.raises(ValueError):
+        incremental.partial_fit([1, 2, 3], [1, 2])
+    with pytest.raises(TypeError):
+        incremental.partial_fit(["a", "b"], [1, 2])
+
+
+def test_merge_different_columns():
+    with pytest.raises(ValueError):
+        IncrementalLinearRegression("X", "Y").merge(IncrementalLinearRegression("X", "Z"))
+
+
+# -------------------------------------------------
+# Tests for MultipleLinearRegression
+# -------------------------------------------------
+
+@pytest.fixture
+def multiple_df():
+    """
+    Fixture to provide data with an exact linear relationship (y = 1 + 2a - 3b).
+    """
+    rng = np.random.default_rng(8)
+    df = pd.DataFrame({"A": rng.uniform(0, 10, 200), "B": rng.integers(0, 5, 200)})
+    df["Y"] = 1 + 2 * df["A"] - 3 * df["B"]
+    return df
+
+
+def test_multiple_regression_coefficients(multiple_df):
+    model = MultipleLinearRegression(multiple_df[["A", "B"]], multiple_df["Y"])
+    assert model.feature_names == ["A", "B"]
+    assert model.target_name == "Y"
+    assert model.intercept == pytest.approx(1, rel=1e-10)
+    np.testing.assert_allclose(model.coefficients, [2, -3], rtol=1e-10)
+    assert model.r_squared == pytest.approx(1.0, rel=1e-10)
+    assert model.mse == pytest.approx(0.0, abs=1e-10)
+    np.testing.assert_allclose(model.predictions, multiple_df["Y"], rtol=1e-10)
+
+
+def test_multiple_regression_predict(multiple_df):
+    model = MultipleLinearRegression(multiple_df[["A", "B"]], multiple_df["Y"])
+    # Columns are picked by name, in any order
+    new_rows = pd.DataFrame({"B": [1, 0], "A": [0, 1]})
+    np.testing.assert_allclose(model.predict(new_rows), [-2, 3], rtol=1e-10)
+    np.testing.assert_allclose(model.predict([1, 1]), [0], atol=1e-10)
+
+
+def test_multiple_regression_from_chunks(multiple_df):
+    multiple_df["Y"] += np.random.default_rng(9).normal(0, 1, len(multiple_df))
+    chunks = [multiple_df.iloc[start:start + 64] for start in range(0, len(multiple_df), 64)]
+    streamed = MultipleLinearRegression.from_chunks(chunks, ["A", "B"], "Y")
+    full = MultipleLinearRegression(multiple_df[["A", "B"]], multiple_df["Y"])
+    assert streamed.predictions is None
+    assert streamed.intercept == pytest.approx(full.intercept, rel=1e-10)
+    np.testing.assert_allclose(streamed.coefficients, full.coefficients, rtol=1e-10)
+    assert streamed.adjusted_r_squared == pytest.approx(full.adjusted_r_squared, rel=1e-10)
+    assert streamed.mse == pytest.approx(full.mse, rel=1e-10)
+
+
+def test_multiple_regression_invalid_data(multiple_df):
+    with pytest.raises(TypeError):
+        MultipleLinearRegression(pd.DataFrame({"A": ["x", "y"]}), pd.Series([1, 2]))
+    with pytest.raises(ValueError):
+        MultipleLinearRegression(multiple_df[["A", "B"]], multiple_df["Y"].iloc[:10])
+    with pytest.raises(ValueError):
+        MultipleLinearRegression(multiple_df[[]], multiple_df["Y"])
+
+
+def test_multiple_regression_sample_from_attrs(multiple_df):
+    multiple_df.attrs["sample"] = SampleInfo(200, 5000, 1)
+    model = MultipleLinearRegression(multiple_df[["A", "B"]], multiple_df["Y"])
+    assert model.trained_on_sample
+    assert model.sample.total_rows == 5000
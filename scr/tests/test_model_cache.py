@@ -0,0 +1,128 @@
+import pytest
+import pandas as pd
+import numpy as np
+from linear_regression import LinearRegression, MultipleLinearRegression
+from model_cache import ModelCache, CacheStats, data_hash, fit_key, model_nbytes
+
+@pytest.fixture
+def sales_df():
+    """
+    Fixture to provide a small dataset with two features and a target.
+    """
+    rng = np.random.default_rng(25)
+    df = pd.DataFrame({"Temperature": rng.uniform(0, 30, 200), "Rain": rng.uniform(0, 10, 200)})
+    df["Sales"] = 5 + 2 * df["Temperature"] - df["Rain"] + rng.normal(0, 1, 200)
+    return df
+
+# -------------------------------------------------
+# Tests for the keys
+# -------------------------------------------------
+
+def test_same_data_same_key(sales_df):
+    copy = sales_df.copy()
+    assert fit_key(sales_df["Temperature"], sales_df["Sales"]) == \
+        fit_key(copy["Temperature"], copy["Sales"])
+    assert fit_key(sales_df[["Temperature", "Rain"]], sales_df["Sales"]) == \
+        fit_key(copy[["Temperature", "Rain"]], copy["Sales"])
+
+def test_key_depends_on_values(sales_df):
+    changed = sales_df.copy()
+    changed.loc[10, "Temperature"] += 1
+    assert data_hash(sales_df["Temperature"]) != data_hash(changed["Temperature"])
+    assert fit_key(sales_df["Temperature"], sales_df["Sales"]) != \
+        fit_key(changed["Temperature"], changed["Sales"])
+
+def test_hash_nullable_columns():
+    column = pd.Series([1, 2, None], dtype="Int64", name="A")
+    assert data_hash(column) == data_hash(column.copy())
+    assert data_hash(column) != data_hash(column.fillna(0))
+    assert data_hash(column) != data_hash(column.astype("float64"))
+
+def test_key_depends_on_columns(sales_df):
+    key = fit_key(sales_df["Temperature"], sales_df["Sales"])
+    assert key != fit_key(sales_df["Rain"], sales_df["Sales"])
+    assert key != fit_key(sales_df["Sales"], sales_df["Temperature"])
+    assert key != fit_key(sales_df["Temperature"].rename("Heat"), sales_df["Sales"])
+    assert key != fit_key(sales_df[["Temperature", "Rain"]], sales_df["Sales"])
+
+def test_key_depends_on_nan_method(sales_df):
+    x, y = sales_df["Temperature"], sales_df["Sales"]
+    keys = {
+        fit_key(x, y),
+        fit_key(x, y, "Fill with Mean"),
+        fit_key(x, y, "Fill with a Constant Value", 0.0),
+        fit_key(x, y, "Fill with a Constant Value", 1.0),
+    }
+    assert len(keys) == 4
+
+# -------------------------------------------------
+# Tests for ModelCache
+# -------------------------------------------------
+
+def test_get_or_fit_fits_once(sales_df):
+    cache = ModelCache()
+    calls = []
+
+    def fit():
+        calls.append(1)
+        return LinearRegression(sales_df["Temperature"], sales_df["Sales"])
+
+    key = fit_key(sales_df["Temperature"], sales_df["Sales"])
+    first = cache.get_or_fit(key, fit)
+    second = cache.get_or_fit(key, fit)
+    assert second is first
+    assert len(calls) == 1
+    assert cache.stats == CacheStats(1, 1, 1, model_nbytes(first))
+    assert key in cache
+
+def test_failed_fit_is_not_cached():
+    cache = ModelCache()
+
+    def fit():
+        raise ValueError("The feature must not be constant")
+
+    with pytest.raises(ValueError):
+        cache.get_or_fit("key", fit)
+    assert len(cache) == 0
+    assert cache.stats.misses == 1
+
+def test_least_recently_used_removed(sales_df):
+    cache = ModelCache(max_entries=2)
+    models = {name: LinearRegression(sales_df[name], sales_df["Sales"])
+              for name in ("Temperature", "Rain")}
+    cache.put("a", models["Temperature"])
+    cache.put("b", models["Rain"])
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("c", models["Rain"])
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.stats.nbytes == model_nbytes(models["Temperature"]) + model_nbytes(models["Rain"])
+
+def test_size_limit(sales_df):
+    model = MultipleLinearRegression(sales_df[["Temperature", "Rain"]], sales_df["Sales"])
+    nbytes = model_nbytes(model)
+    assert nbytes >= model.predictions.nbytes
+
+    cache = ModelCache(max_bytes=2 * nbytes)
+    for key in "abc":
+        cache.put(key, model)
+    assert len(cache) == 2 and "a" not in cache
+
+    # A model larger than the whole cache is not kept
+    small = ModelCache(max_bytes=nbytes - 1)
+    small.put("a", model)
+    assert len(small) == 0 and small.stats.nbytes == 0
+
+def test_put_replaces_entry(sales_df):
+    cache = ModelCache()
+    model = LinearRegression(sales_df["Temperature"], sales_df["Sales"])
+    cache.put("a", model)
+    cache.put("a", model)
+    assert len(cache) == 1 and cache.stats.nbytes == model_nbytes(model)
+
+def test_clear_keeps_counters(sales_df):
+    cache = ModelCache()
+    cache.put("a", LinearRegression(sales_df["Temperature"], sales_df["Sales"]))
+    cache.get("a")
+    cache.get("b")
+    cache.clear()
+    assert cache.stats == CacheStats(1, 1, 0, 0)
@@ -3,7 +3,7 @@ import pandas as pd
 import os
 import pickle
 import joblib
-from linear_regression import LinearRegression
+from linear_regression import LinearRegression, MultipleLinearRegression
 from model_handler import save_model, open_model, open_pkl, open_joblib
 from exceptions import FileFormatError, FileNotSelectedError
 
@@ -220,6 +220,68 @@ def test_save_model_different_formats(tmp_path, sample_model, extension, monkeyp
     assert loaded_data["target_name"] == sample_model.target_name
     assert loaded_data["intercept"] == pytest.approx(sample_model.intercept)
 
+def test_save_and_open_multiple_model(tmp_path, monkeypatch):
+    """
+    Test saving a multiple regression model and opening it again.
+    Verifies that the coefficient vector and feature names are kept.
+    """
+    df = pd.DataFrame({"A": [1, 2, 3, 4, 5], "B": [2, 1, 4, 3, 6]})
+    df["Y"] = 1 + 2 * df["A"] - df["B"]
+    model = MultipleLinearRegression(df[["A", "B"]], df["Y"])
+
+    save_path = os.path.join(tmp_path, "model.joblib")
+    monkeypatch.setattr('tkinter.filedialog.asksaveasfilename',
+                       lambda **kwargs: save_path)
+    assert save_model(model, description="Two features") == ".joblib"
+
+    loaded_data = open_model(save_path)
+    assert loaded_data["feature_names"] == ["A", "B"]
+    assert loaded_data["target_name"] == "Y"
+    assert loaded_data["coefficients"] == pytest.approx([2, -1])
+    assert loaded_data["intercept"] == pytest.approx(1)
+    assert loaded_data["adjusted_r_squared"] == pytest.approx(1.0)
+    assert loaded_data["description"] == "Two features"
+    assert "slope" not in loaded_data
+
+def test_open_multiple_model_mismatched_coefficients(tmp_path):
+    """
+    Test opening a multiple regression model with a coefficient missing.
+    """
+    file_path = tmp_path / "model.pkl"
+    with open(file_path, "wb") as f:
+        pickle.dump({"intercept": 1.0, "coefficients": [2.0], "r_squared": 1.0,
+                     "adjusted_r_squared": 1.0, "mse": 0.0, "feature_names": ["A", "B"],
+                     "target_name": "Y", "description": ""}, f)
+    with pytest.raises(ValueError, match="coefficients"):
+        open_model(str(file_path))
+
+def test_save_and_open_cross_validated_model(tmp_path, monkeypatch):
+    """
+    Test saving a cross-validated model and opening it again.
+    Verifies that the summary of the cross-validation is kept.
+    """
+    x = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], name="X")
+    model = LinearRegression(x, pd.Series([2.0, 4.5, 5.5, 8.0, 10.5, 11.5], name="Y"))
+    model.cross_validate(folds=3, seed=0)
+
+    save_path = os.path.join(tmp_path, "model.pkl")
+    monkeypatch.setattr('tkinter.filedialog.asksaveasfilename',
+                       lambda **kwargs: save_path)
+    save_model(model)
+
+    loaded_data = open_model(save_path)
+    assert loaded_data["cv"] == model.cv
+    assert loaded_data["cv"]["folds"] == 3
+
+def test_open_model_invalid_cv(temp_pkl_file, sample_model_data):
+    """
+    Test opening a model whose cross-validation summary is incomplete.
+    """
+    with open(temp_pkl_file, "wb") as f:
+        pickle.dump({**sample_model_data, "cv": {"folds": 5}}, f)
+    with pytest.raises(ValueError, match="cross-validation"):
+        open_model(str(temp_pkl_file))
+
 # -------------------------------------------------
 # Tests for corrupted or invalid model files
 # -------------------------------------------------
@@ -188,3 +188,31 @@ def test_preprocess_no_nan(nan_handler_instance):
     processed_df = nan_handler_instance.preprocess("Fill with Mean")
     pd.testing.assert_frame_equal(processed_df, 
                                   nan_handler_instance._df[nan_handler_instance._selected_columns])
+
+def test_nan_handler_from_chunks(sample_dataframe):
+    """
+    Test that NaNHandler accepts an iterable of DataFrame chunks instead of a DataFrame.
+    The chunks are preprocessed one at a time, and together they must match the full DataFrame.
+    """
+    chunks = [sample_dataframe.iloc[i:i + 2] for i in range(0, len(sample_dataframe), 2)]
+    handler = NaNHandler(chunks, ["A", "B"])
+
+    assert handler._df is None  # The chunks are not joined
+    has_nan, message = handler.check_for_nan()
+    assert has_nan
+    assert "- A: 1 missing values" in message
+    for method, constant_value in [("Delete Rows", None), ("Fill with a Constant Value", 0)]:
+        processed = handler.preprocess(method, constant_value)
+        pd.testing.assert_frame_equal(
+            pd.concat(processed),
+            NaNHandler(sample_dataframe, ["A", "B"]).preprocess(method, constant_value)
+        )
+
+@pytest.mark.parametrize("method", ["Fill with Mean", "Fill with Median"])
+def test_nan_handler_from_chunks_needs_every_row(sample_dataframe, method):
+    with pytest.raises(ValueError):
+        NaNHandler([sample_dataframe], ["A", "B"]).preprocess(method)
+
+def test_nan_handler_from_chunks_constant_value(sample_dataframe):
+    with pytest.raises(ConstantValueError):
+        NaNHandler([sample_dataframe], ["A", "B"]).preprocess("Fill with a Constant Value")
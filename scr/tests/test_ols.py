@@ -0,0 +1,171 @@
+import pytest
+import numpy as np
+from ols import (compute_moments, merge_moments, solve, fit, fit_statsmodels, Moments,
+                 compute_cross_moments, merge_cross_moments, fit_multiple)
+
+@pytest.fixture
+def noisy_data():
+    """
+    Fixture to provide noisy linear data (y = 2x + 3 + noise).
+    """
+    rng = np.random.default_rng(42)
+    x = rng.uniform(0, 10, 10_000)
+    y = 2 * x + 3 + rng.normal(0, 1, 10_000)
+    return x, y
+
+def assert_same_fit(result, expected, tolerance=1e-10):
+    """Check that two fits are equal up to a relative tolerance."""
+    assert result.intercept == pytest.approx(expected.intercept, rel=tolerance)
+    assert result.slope == pytest.approx(expected.slope, rel=tolerance)
+    assert result.r_squared == pytest.approx(expected.r_squared, rel=tolerance)
+    assert result.mse == pytest.approx(expected.mse, rel=tolerance)
+
+# -------------------------------------------------
+# Tests for compute_moments and merge_moments
+# -------------------------------------------------
+
+def test_moments_match_numpy(noisy_data):
+    x, y = noisy_data
+    moments = compute_moments(x, y, block_size=1000)
+    assert moments.n == len(x)
+    assert moments.mean_x == pytest.approx(x.mean(), rel=1e-12)
+    assert moments.mean_y == pytest.approx(y.mean(), rel=1e-12)
+    assert moments.s_xx == pytest.approx(((x - x.mean()) ** 2).sum(), rel=1e-12)
+    assert moments.s_xy == pytest.approx(((x - x.mean()) * (y - y.mean())).sum(), rel=1e-12)
+    assert moments.s_yy == pytest.approx(((y - y.mean()) ** 2).sum(), rel=1e-12)
+
+def test_block_size_does_not_change_moments(noisy_data):
+    x, y = noisy_data
+    whole = compute_moments(x, y, block_size=len(x))
+    # Uneven blocks, with a last block of one row
+    for block_size in (7, 999, len(x) - 1):
+        blocks = compute_moments(x, y, block_size=block_size)
+        np.testing.assert_allclose(blocks, whole, rtol=1e-12)
+
+def test_merge_with_empty_moments(noisy_data):
+    x, y = noisy_data
+    moments = compute_moments(x, y)
+    empty = Moments(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    assert merge_moments(empty, moments) == moments
+    assert merge_moments(moments, empty) == moments
+
+def test_empty_or_mismatched_data():
+    with pytest.raises(ValueError):
+        compute_moments([], [])
+    with pytest.raises(ValueError):
+        compute_moments([1, 2], [1])
+
+# -------------------------------------------------
+# Tests for fit
+# -------------------------------------------------
+
+def test_fit_matches_statsmodels(noisy_data):
+    pytest.importorskip("statsmodels")
+    x, y = noisy_data
+    assert_same_fit(fit(x, y, block_size=1000), fit_statsmodels(x, y))
+
+def test_fit_large_offset():
+    """
+    Values far from 0 with a small spread, where Σx² - (Σx)²/n cancels out
+    (statsmodels itself cannot fit them). The same rows shifted back to 0,
+    which is exact in floating point, give the reference slope.
+    """
+    rng = np.random.default_rng(0)
+    shift = 1e9
+    x = shift + rng.uniform(0, 1, 5000)
+    y = 0.5 * (x - shift) + rng.normal(0, 0.01, 5000)
+    result = fit(x, y, block_size=512)
+    reference = fit(x - shift, y)
+    assert result.slope == pytest.approx(reference.slope, rel=1e-9)
+    assert result.r_squared == pytest.approx(reference.r_squared, rel=1e-9)
+    # The residuals are a small difference of large sums
+    assert result.mse == pytest.approx(reference.mse, rel=1e-6)
+
+def test_fit_returns_python_floats(noisy_data):
+    result = fit(*noisy_data)
+    assert all(type(value) is float for value in result)
+
+def test_constant_feature():
+    with pytest.raises(ValueError, match="constant"):
+        fit([3, 3, 3], [1, 2, 3])
+
+def test_constant_target():
+    result = fit([1, 2, 3, 4], [5, 5, 5, 5])
+    assert result.slope == 0
+    assert result.intercept == 5
+    assert result.r_squared == 0.0
+    assert result.mse == 0.0
+
+def test_solve_empty():
+    with pytest.raises(ValueError):
+        solve(Moments(0, 0.0, 0.0, 0.0, 0.0, 0.0))
+
+# -------------------------------------------------
+# Tests for the multiple regression engine
+# -------------------------------------------------
+
+@pytest.fixture
+def multiple_data():
+    """
+    Fixture to provide noisy data of three features with different scales.
+    """
+    rng = np.random.default_rng(3)
+    X = np.column_stack([rng.uniform(0, 1, 5000),
+                         rng.uniform(1e3, 2e3, 5000),
+                         rng.normal(0, 1e-3, 5000)])
+    y = 4 + X @ np.array([1.5, -0.02, 300.0]) + rng.normal(0, 0.1, 5000)
+    return X, y
+
+def test_fit_multiple_matches_lstsq(multiple_data):
+    X, y = multiple_data
+    result = fit_multiple(X, y, block_size=999)
+    design = np.column_stack([np.ones(len(X)), X])
+    expected, *_ = np.linalg.lstsq(design, y, rcond=None)
+    residuals = y - design @ expected
+
+    assert result.intercept == pytest.approx(expected[0], rel=1e-10)
+    np.testing.assert_allclose(result.coefficients, expected[1:], rtol=1e-10)
+    assert result.mse == pytest.approx(np.mean(residuals ** 2), rel=1e-8)
+    r_squared = 1 - np.sum(residuals ** 2) / np.sum((y - y.mean()) ** 2)
+    assert result.r_squared == pytest.approx(r_squared, rel=1e-10)
+    adjusted = 1 - (1 - r_squared) * (len(X) - 1) / (len(X) - 3 - 1)
+    assert result.adjusted_r_squared == pytest.approx(adjusted, rel=1e-10)
+
+def test_fit_multiple_one_feature_matches_fit(noisy_data):
+    x, y = noisy_data
+    single = fit(x, y)
+    multiple = fit_multiple(x, y)
+    assert multiple.intercept == pytest.approx(single.intercept, rel=1e-10)
+    assert multiple.coefficients[0] == pytest.approx(single.slope, rel=1e-10)
+    assert multiple.r_squared == pytest.approx(single.r_squared, rel=1e-10)
+    assert multiple.mse == pytest.approx(single.mse, rel=1e-10)
+
+def test_merged_cross_moments_match_whole(multiple_data):
+    X, y = multiple_data
+    whole = compute_cross_moments(X, y)
+    merged = merge_cross_moments(compute_cross_moments(X[:1234], y[:1234]),
+                                 compute_cross_moments(X[1234:], y[1234:]))
+    assert merged.n == whole.n
+    np.testing.assert_allclose(merged.means, whole.means, rtol=1e-12)
+    np.testing.assert_allclose(merged.gram, whole.gram, rtol=1e-10)
+
+def test_fit_multiple_collinear_features():
+    x = np.arange(10.0)
+    with pytest.raises(ValueError, match="linear combinations"):
+        fit_multiple(np.column_stack([x, 2 * x + 1]), x ** 2)
+
+def test_fit_multiple_constant_feature():
+    x = np.arange(10.0)
+    with pytest.raises(ValueError, match="constant"):
+        fit_multiple(np.column_stack([x, np.ones(10)]), x)
+
+def test_fit_multiple_too_few_rows():
+    with pytest.raises(ValueError, match="more rows"):
+        fit_multiple(np.eye(3), np.arange(3.0))
+
+def test_fit_multiple_exact_fit_adjusted_r_squared():
+    # As many rows as parameters: the adjusted R² is not defined
+    X = np.array([[0.0, 1.0], [1.0, 0.0], [1.0, 1.0]])
+    result = fit_multiple(X, np.array([1.0, 2.0, 4.0]))
+    assert result.r_squared == pytest.approx(1.0)
+    assert np.isnan(result.adjusted_r_squared)
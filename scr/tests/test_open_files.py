@@ -2,8 +2,10 @@ import pytest
 import pandas as pd
 import sqlite3
 import os
-from open_files import open_file
-from exceptions import FileFormatError, EmptyDataError, FileNotSelectedError
+import open_files
+from open_files import (open_file, open_preview, iter_csv_chunks, probe_schema,
+                        probe_file, numeric_columns, read_csv_with_progress)
+from exceptions import FileFormatError, EmptyDataError, FileNotSelectedError, ColumnNotFoundError
 
 @pytest.fixture
 def setup_temp_files(tmp_path):
@@ -104,6 +106,20 @@ def test_open_file_valid_db(setup_temp_files):
     assert not df.empty
     assert list(df.columns) == ["col1", "col2"]
 
+def test_open_file_db_modified_result(setup_temp_files):
+    """
+    Test that modifying a table that was opened does not change it when it is reopened
+    from the cache of recent tables.
+    """
+    df = open_file(setup_temp_files["db"])
+    with pytest.raises(ValueError):  # The values are shared with the cache
+        df.loc[0, "col2"] = 0
+    df["col3"] = df["col1"] * 2
+    df.drop(columns="col1", inplace=True)
+
+    reopened = open_file(setup_temp_files["db"])
+    pd.testing.assert_frame_equal(reopened, pd.DataFrame({"col1": [1, 2], "col2": [3, 4]}))
+
 def test_open_file_empty_db(setup_temp_files):
     with pytest.raises(EmptyDataError, match="The database does not contain any tables."):
         open_file(setup_temp_files["empty_db"])
@@ -136,4 +152,304 @@ def test_open_file_no_file_selected():
     """
     # Simulate that the user does not select any file (empty file path)
     with pytest.raises(FileNotSelectedError, match="You haven't selected any files."):
-        open_file("")
\ No newline at end of file
+        open_file("")
+
+# -------------------------------------------------
+# Tests for streaming mode
+# -------------------------------------------------
+
+@pytest.fixture
+def large_csv(tmp_path):
+    """
+    Create a CSV file with enough rows to be split into several chunks.
+    """
+    csv_path = tmp_path / "large.csv"
+    pd.DataFrame({"x": range(1000), "y": [2 * i + 1 for i in range(1000)]}).to_csv(csv_path, index=False)
+    return csv_path
+
+def test_iter_csv_chunks_chunksize(large_csv):
+    chunks = list(iter_csv_chunks(large_csv, chunksize=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_csv(large_csv))
+
+def test_iter_csv_chunks_memory_limit(large_csv):
+    """
+    Test that the chunk size is derived from the memory limit.
+    """
+    row_size = pd.read_csv(large_csv).memory_usage(index=False, deep=True).sum() / 1000
+    chunks = list(iter_csv_chunks(large_csv, memory_limit=int(100 * row_size)))
+    assert len(chunks) == 10
+    assert all(chunk.memory_usage(index=False, deep=True).sum() <= 100 * row_size for chunk in chunks)
+
+def test_iter_csv_chunks_empty(setup_temp_files):
+    # The error is raised before iterating
+    with pytest.raises(EmptyDataError, match="The CSV file does not contain data."):
+        iter_csv_chunks(setup_temp_files["empty_csv"])
+
+def test_iter_csv_chunks_invalid_memory_limit(large_csv):
+    with pytest.raises(ValueError):
+        iter_csv_chunks(large_csv, memory_limit=0)
+
+def test_open_file_stream_csv(setup_temp_files):
+    chunks = open_file(setup_temp_files["csv"], stream=True)
+    df = pd.concat(chunks)
+    assert list(df.columns) == ["col1", "col2"]
+    assert len(df) == 2
+
+def test_open_file_stream_unsupported_format(setup_temp_files):
+    with pytest.raises(FileFormatError, match="Streaming mode is only available"):
+        open_file(setup_temp_files["db"], stream=True)
+
+# -------------------------------------------------
+# Tests for schema probe and column projection
+# -------------------------------------------------
+
+@pytest.mark.parametrize("file_key", ["csv", "excel", "db"])
+def test_probe_schema(setup_temp_files, file_key):
+    schema = probe_schema(setup_temp_files[file_key])
+    assert schema == {"col1": "int64", "col2": "int64"}
+    assert numeric_columns(schema) == ["col1", "col2"]
+
+def test_probe_schema_text_columns(tmp_path):
+    csv_path = tmp_path / "mixed.csv"
+    csv_path.write_text("name,value,flag\na,1.5,True\nb,2.5,False")
+    schema = probe_schema(csv_path)
+    assert schema == {"name": "object", "value": "float64", "flag": "bool"}
+    assert numeric_columns(schema) == ["value"]
+
+def test_probe_schema_untyped_db(tmp_path):
+    """
+    Test that the columns of a table without declared types, and the computed
+    columns of a view, are probed with the dtypes they are loaded with.
+    """
+    db_path = tmp_path / "untyped.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t(a, b, c)")
+    conn.execute("INSERT INTO t VALUES (1, 0.5, 'x')")
+    conn.execute("CREATE VIEW v AS SELECT a * 2 AS a2, b + 1 AS b1 FROM t")
+    conn.commit()
+    conn.close()
+
+    for table in ["t", "v"]:
+        schema = probe_schema(db_path, table=table)
+        loaded = open_file(db_path, table=table)
+        assert schema == {column: str(dtype) for column, dtype in loaded.dtypes.items()}
+    assert numeric_columns(probe_schema(db_path, table="t")) == ["a", "b"]
+
+def test_probe_schema_empty_db(setup_temp_files):
+    with pytest.raises(EmptyDataError, match="The database does not contain any tables."):
+        probe_schema(setup_temp_files["empty_db"])
+
+@pytest.mark.parametrize("file_key", ["csv", "excel", "db"])
+def test_open_file_columns(setup_temp_files, file_key):
+    """
+    Test that only the requested columns are read, in the requested order.
+    """
+    df = open_file(setup_temp_files[file_key], columns=["col2", "col1"])
+    assert list(df.columns) == ["col2", "col1"]
+    assert df["col1"].tolist() == open_file(setup_temp_files[file_key])["col1"].tolist()
+
+def test_open_file_missing_column(setup_temp_files):
+    with pytest.raises(ColumnNotFoundError, match="colX"):
+        open_file(setup_temp_files["csv"], columns=["col1", "colX"])
+
+def test_open_file_stream_columns(setup_temp_files):
+    df = pd.concat(open_file(setup_temp_files["csv"], stream=True, columns=["col2"]))
+    assert list(df.columns) == ["col2"]
+
+# -------------------------------------------------
+# Tests for table selection in SQLite databases
+# -------------------------------------------------
+
+def test_open_file_table(setup_temp_files):
+    df = open_file(setup_temp_files["multi_table_db"], table="table2")
+    assert df["colA"].tolist() == [10, 20]
+
+def test_open_file_missing_table(setup_temp_files):
+    with pytest.raises(EmptyDataError, match="table3"):
+        open_file(setup_temp_files["multi_table_db"], table="table3")
+
+def test_open_file_table_not_database(setup_temp_files):
+    with pytest.raises(FileFormatError):
+        open_file(setup_temp_files["csv"], table="table1")
+
+def test_probe_schema_table(setup_temp_files):
+    assert list(probe_schema(setup_temp_files["multi_table_db"], table="table2")) == ["colA"]
+
+def test_default_table_skips_indexes_and_views(tmp_path):
+    """
+    Test that the default table is the first table, even if a view or an index is created before it.
+    """
+    db_path = tmp_path / "objects.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE helper (x INTEGER)")
+    conn.execute("CREATE VIEW first_view AS SELECT 1 AS one")
+    conn.execute("CREATE INDEX helper_x ON helper (x)")
+    conn.execute("DROP TABLE helper")  # Its rowid in sqlite_master becomes free
+    conn.execute("CREATE TABLE data (x INTEGER, y REAL)")
+    conn.execute("INSERT INTO data VALUES (1, 2.0)")
+    conn.commit()
+    conn.close()
+
+    assert list(open_file(db_path).columns) == ["x", "y"]
+
+# -------------------------------------------------
+# Tests for compressed CSV files
+# -------------------------------------------------
+
+@pytest.mark.parametrize("suffix", [".csv.gz", ".csv.bz2", ".csv.xz", ".zip"])
+def test_open_file_compressed_csv(tmp_path, suffix):
+    df = pd.DataFrame({"x": range(1000), "y": [2 * i + 1 for i in range(1000)]})
+    path = tmp_path / f"data{suffix}"
+    df.to_csv(path, index=False)  # The compression is inferred from the suffix
+
+    pd.testing.assert_frame_equal(open_file(path), df)
+    chunks = list(iter_csv_chunks(path, chunksize=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    assert list(probe_schema(path)) == ["x", "y"]
+
+def test_open_file_compressed_not_csv(tmp_path):
+    path = tmp_path / "data.xlsx.gz"
+    path.write_bytes(b"")
+    with pytest.raises(FileFormatError, match="Invalid file format"):
+        open_file(path)
+
+def test_open_file_zip_several_files(tmp_path):
+    import zipfile
+    path = tmp_path / "data.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("a.csv", "x\n1\n")
+        archive.writestr("b.csv", "x\n2\n")
+    with pytest.raises(FileFormatError, match="single CSV file"):
+        open_file(path)
+
+# -------------------------------------------------
+# Tests for previews and load progress
+# -------------------------------------------------
+
+@pytest.mark.parametrize("suffix", [".csv", ".csv.gz", ".xlsx", ".db"])
+def test_open_preview(tmp_path, suffix):
+    df = pd.DataFrame({"x": range(50), "y": [2.5 * i for i in range(50)]})
+    path = tmp_path / f"data{suffix}"
+    if suffix == ".xlsx":
+        df.to_excel(path, index=False)
+    elif suffix == ".db":
+        conn = sqlite3.connect(path)
+        df.to_sql("data", conn, index=False)
+        conn.close()
+    else:
+        df.to_csv(path, index=False)
+
+    pd.testing.assert_frame_equal(open_preview(path, rows=20), df.head(20))
+    assert len(open_preview(path, rows=100)) == 50
+
+def test_open_preview_table(setup_temp_files):
+    preview = open_preview(setup_temp_files["multi_table_db"], table="table2")
+    assert list(preview.columns) == ["colA"]
+
+def test_open_preview_directory(tmp_path):
+    pd.DataFrame({"x": [1, 2]}).to_csv(tmp_path / "a.csv", index=False)
+    pd.DataFrame({"x": [3, 4]}).to_csv(tmp_path / "b.csv", index=False)
+    assert open_preview(tmp_path)["x"].tolist() == [1, 2]
+
+def test_open_preview_empty(setup_temp_files):
+    with pytest.raises(EmptyDataError):
+        open_preview(setup_temp_files["empty_csv"])
+
+@pytest.mark.parametrize("suffix, compression", [(".csv", None), (".csv.gz", "gzip")])
+def test_read_csv_with_progress(tmp_path, suffix, compression):
+    df = pd.DataFrame({"x": range(20000), "y": [i % 7 for i in range(20000)]})
+    path = tmp_path / f"data{suffix}"
+    df.to_csv(path, index=False)
+
+    fractions = []
+    result = read_csv_with_progress(path, fractions.append, compression=compression,
+                                    memory_limit=16 * 1024)
+    pd.testing.assert_frame_equal(result, df)
+    assert len(fractions) > 1
+    assert fractions == sorted(fractions) and fractions[-1] == pytest.approx(1.0, abs=1e-3)
+
+def test_open_file_progress(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"x": range(100)}).to_csv(path, index=False)
+    fractions = []
+    open_file(path, progress=fractions.append)
+    assert fractions[-1] == 1.0
+
+# -------------------------------------------------
+# Tests for probe_file
+# -------------------------------------------------
+
+@pytest.mark.parametrize("file_key", ["csv", "excel", "db"])
+def test_probe_file(setup_temp_files, file_key):
+    probe = probe_file(setup_temp_files[file_key])
+    assert list(probe.columns) == ["col1", "col2"]
+    assert not probe.empty
+
+@pytest.mark.parametrize("file_key", ["empty_excel", "empty_table_db"])
+def test_probe_file_empty(setup_temp_files, file_key):
+    assert probe_file(setup_temp_files[file_key]).empty
+
+def test_probe_file_header_only_csv(tmp_path):
+    csv_path = tmp_path / "header.csv"
+    csv_path.write_text("x,y\n")
+    probe = probe_file(csv_path)
+    assert list(probe.columns) == ["x", "y"] and probe.empty
+    with pytest.raises(EmptyDataError, match="The CSV file does not contain data."):
+        open_file(csv_path)
+
+def test_empty_table_fails_before_reading(setup_temp_files, monkeypatch):
+    """
+    Test that an empty table is detected by the probe, without reading the table.
+    """
+    def read_table(*args, **kwargs):
+        raise AssertionError("The table should not be read.")
+    monkeypatch.setattr(open_files, "read_table", read_table)
+    with pytest.raises(EmptyDataError, match="The database table does not contain data."):
+        open_file(setup_temp_files["empty_table_db"])
+
+# -------------------------------------------------
+# Tests for samples
+# -------------------------------------------------
+
+@pytest.mark.parametrize("suffix", [".csv", ".csv.gz", ".xlsx", ".db"])
+def test_open_file_sample(tmp_path, suffix):
+    df = pd.DataFrame({"x": range(600), "y": [2 * i for i in range(600)]})
+    path = tmp_path / f"data{suffix}"
+    if suffix == ".xlsx":
+        df.to_excel(path, index=False)
+    elif suffix == ".db":
+        conn = sqlite3.connect(path)
+        df.to_sql("data", conn, index=False)
+        conn.close()
+    else:
+        df.to_csv(path, index=False)
+
+    sample = open_file(path, sample=50, seed=1, memory_limit=1024)
+    assert len(sample) == 50
+    assert sample.attrs["sample"] == (50, 600, 1)
+    assert sample["x"].is_unique and sample["x"].is_monotonic_increasing
+    assert (sample["y"] == 2 * sample["x"]).all()
+    pd.testing.assert_frame_equal(open_file(path, sample=50, seed=1, memory_limit=1024), sample)
+
+def test_open_file_sample_whole_file(setup_temp_files):
+    df = open_file(setup_temp_files["csv"], sample=10)
+    assert len(df) == 2
+    assert "sample" not in df.attrs
+
+def test_open_file_sample_directory(tmp_path):
+    pd.DataFrame({"x": range(100)}).to_csv(tmp_path / "a.csv", index=False)
+    pd.DataFrame({"x": range(100, 200)}).to_csv(tmp_path / "b.csv", index=False)
+    sample = open_file(tmp_path, sample=30, seed=0)
+    assert sample.attrs["sample"].total_rows == 200
+
+def test_open_file_sample_unsupported(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"x": range(10)}).to_parquet(path)
+    with pytest.raises(FileFormatError, match="Samples"):
+        open_file(path, sample=5)
+
+def test_open_file_sample_stream(setup_temp_files):
+    with pytest.raises(FileFormatError):
+        open_file(setup_temp_files["csv"], stream=True, sample=5)
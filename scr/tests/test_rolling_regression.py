@@ -0,0 +1,108 @@
+import pytest
+import pandas as pd
+import numpy as np
+from linear_regression import LinearRegression
+from rolling_regression import rolling_regression, ROLLING_COLUMNS
+
+@pytest.fixture
+def series_df():
+    """
+    Fixture to provide a time series whose slope drifts over time.
+    """
+    rng = np.random.default_rng(22)
+    times = pd.date_range("2024-01-01", periods=300, freq="h")
+    x = rng.uniform(1000, 1010, 300)  # Far from 0, to check the accuracy
+    slope = np.linspace(1, 3, 300)
+    y = 5 + slope * x + rng.normal(0, 0.5, 300)
+    return pd.DataFrame({"x": x, "y": y}, index=times)
+
+def assert_window_fit(result, rows):
+    """Check a row of the result against a model fitted on the window rows."""
+    model = LinearRegression(rows["x"], rows["y"])
+    assert result["rows"] == len(rows)
+    assert result["slope"] == pytest.approx(model.slope, rel=1e-8)
+    assert result["intercept"] == pytest.approx(model.intercept, rel=1e-8)
+    assert result["r_squared"] == pytest.approx(model.r_squared, rel=1e-8)
+    assert result["mse"] == pytest.approx(model.mse, rel=1e-6)
+
+# -------------------------------------------------
+# Tests for row windows
+# -------------------------------------------------
+
+def test_row_window_matches_refits(series_df):
+    result = rolling_regression(series_df["x"], series_df["y"], 50)
+    assert list(result.columns) == ROLLING_COLUMNS
+    assert result.index.equals(series_df.index)
+    # The first windows do not have 50 rows yet
+    assert result["slope"].iloc[:49].isna().all()
+    for end in (49, 120, 299):
+        assert_window_fit(result.iloc[end], series_df.iloc[end - 49:end + 1])
+
+def test_min_periods(series_df):
+    result = rolling_regression(series_df["x"], series_df["y"], 50, min_periods=10)
+    assert result["slope"].iloc[:9].isna().all()
+    assert_window_fit(result.iloc[9], series_df.iloc[:10])
+
+def test_missing_values_are_not_counted(series_df):
+    series_df.iloc[100, 0] = np.nan
+    result = rolling_regression(series_df["x"], series_df["y"], 20, min_periods=2)
+    assert result["rows"].iloc[110] == 19
+    assert_window_fit(result.iloc[110], series_df.iloc[91:111].dropna())
+
+def test_long_series_with_trend():
+    # Cumulative sums over the whole series would cancel every digit here
+    rng = np.random.default_rng(7)
+    x = np.arange(1_000_000) + rng.normal(0, 1, 1_000_000)
+    df = pd.DataFrame({"x": x, "y": 2 * x + rng.normal(0, 1, 1_000_000)})
+    result = rolling_regression(df["x"], df["y"], 50)
+    for end in (950_000, 999_999):
+        rows = df.iloc[end - 49:end + 1]
+        slope, intercept = np.polyfit(rows["x"], rows["y"], 1)
+        assert result["slope"].iloc[end] == pytest.approx(slope, rel=1e-8)
+        assert result["intercept"].iloc[end] == pytest.approx(intercept, rel=1e-6)
+        assert_window_fit(result.iloc[end], rows)
+
+def test_empty_series():
+    empty = pd.Series([], dtype=np.float64)
+    assert len(rolling_regression(empty, empty, 5)) == 0
+
+def test_slope_drift_is_followed(series_df):
+    result = rolling_regression(series_df["x"], series_df["y"], 100)
+    assert result["slope"].iloc[99] < result["slope"].iloc[-1]
+
+# -------------------------------------------------
+# Tests for time windows
+# -------------------------------------------------
+
+def test_time_window_matches_refits(series_df):
+    result = rolling_regression(series_df["x"], series_df["y"], "1D")
+    # A window of one day holds the last 24 hourly rows
+    assert result["rows"].iloc[100] == 24
+    assert_window_fit(result.iloc[100], series_df.iloc[77:101])
+    # The first row is alone in its window
+    assert np.isnan(result["slope"].iloc[0])
+
+def test_time_window_with_times_column(series_df):
+    times = pd.Series(series_df.index)
+    df = series_df.reset_index(drop=True)
+    result = rolling_regression(df["x"], df["y"], pd.Timedelta(hours=12), times=times)
+    assert result.index.equals(df.index)
+    assert_window_fit(result.iloc[50], df.iloc[39:51])
+
+def test_invalid_windows(series_df):
+    with pytest.raises(ValueError):
+        rolling_regression(series_df["x"], series_df["y"], 0)
+    with pytest.raises(ValueError):
+        rolling_regression(series_df["x"], series_df["y"], "not a window")
+    with pytest.raises(ValueError):  # No times for a time window
+        rolling_regression(series_df["x"].reset_index(drop=True),
+                           series_df["y"].reset_index(drop=True), "1D")
+    with pytest.raises(ValueError):  # Times not sorted
+        rolling_regression(series_df["x"].iloc[::-1], series_df["y"].iloc[::-1], "1D")
+
+def test_constant_feature_window():
+    x = pd.Series([1.0, 1.0, 1.0, 2.0, 3.0])
+    y = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0])
+    result = rolling_regression(x, y, 3)
+    assert np.isnan(result["slope"].iloc[2])
+    assert result["slope"].iloc[4] == pytest.approx(1.0)
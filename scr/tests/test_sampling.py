@@ -0,0 +1,65 @@
+import pytest
+import pandas as pd
+import numpy as np
+from sampling import reservoir_sample
+
+@pytest.fixture
+def numbered_df():
+    """
+    Fixture to provide a DataFrame whose rows can be identified by their id.
+    """
+    return pd.DataFrame({"id": np.arange(1000), "value": np.arange(1000) * 0.5})
+
+def split(df, size):
+    """Split a DataFrame in chunks of size rows."""
+    return [df.iloc[start:start + size] for start in range(0, len(df), size)]
+
+# -------------------------------------------------
+# Tests for reservoir_sample
+# -------------------------------------------------
+
+def test_sample_size_and_total(numbered_df):
+    sample, total = reservoir_sample(split(numbered_df, 64), 100, seed=0)
+    assert len(sample) == 100 and total == 1000
+    assert sample["id"].is_unique
+    assert sample["id"].is_monotonic_increasing  # Rows keep the file order
+    assert sample.index.equals(pd.RangeIndex(100))
+    # Rows are kept whole
+    np.testing.assert_array_equal(sample["value"], sample["id"] * 0.5)
+
+def test_seed_gives_same_sample(numbered_df):
+    first, _ = reservoir_sample(split(numbered_df, 64), 50, seed=7)
+    second, _ = reservoir_sample(split(numbered_df, 64), 50, seed=7)
+    other, _ = reservoir_sample(split(numbered_df, 64), 50, seed=8)
+    pd.testing.assert_frame_equal(first, second)
+    assert not first.equals(other)
+
+def test_chunk_size_does_not_change_sample(numbered_df):
+    small, _ = reservoir_sample(split(numbered_df, 7), 50, seed=3)
+    large, _ = reservoir_sample(split(numbered_df, 500), 50, seed=3)
+    pd.testing.assert_frame_equal(small, large)
+
+def test_sample_larger_than_data(numbered_df):
+    sample, total = reservoir_sample(split(numbered_df, 300), 5000, seed=0)
+    pd.testing.assert_frame_equal(sample, numbered_df)
+    assert total == 1000
+
+def test_sample_is_uniform(numbered_df):
+    """
+    Test that every row has the same probability of being in the sample.
+    """
+    counts = np.zeros(len(numbered_df))
+    for seed in range(400):
+        sample, _ = reservoir_sample(split(numbered_df, 100), 100, seed=seed)
+        counts[sample["id"]] += 1
+    # Each row is expected 40 times; compare the first and last halves of the file
+    assert abs(counts[:500].mean() - 40) < 2
+    assert abs(counts[500:].mean() - 40) < 2
+
+def test_invalid_size(numbered_df):
+    with pytest.raises(ValueError):
+        reservoir_sample([numbered_df], 0)
+
+def test_no_chunks():
+    with pytest.raises(ValueError):
+        reservoir_sample([], 10)
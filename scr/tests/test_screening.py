@@ -0,0 +1,72 @@
+import pytest
+import pandas as pd
+import numpy as np
+from linear_regression import LinearRegression
+from screening import screen_regressions, LEADERBOARD_COLUMNS
+
+@pytest.fixture
+def numeric_df():
+    """
+    Fixture to provide columns with known relationships and a text column.
+    """
+    rng = np.random.default_rng(11)
+    a = rng.uniform(0, 10, 500)
+    return pd.DataFrame({
+        "a": a,
+        "b": 3 * a - 2 + rng.normal(0, 0.5, 500),  # Almost a line of a
+        "c": rng.normal(0, 1, 500),  # Unrelated
+        "d": (a > 5).astype(np.int64),
+        "label": rng.choice(["x", "y"], 500),
+    })
+
+# -------------------------------------------------
+# Tests for screen_regressions
+# -------------------------------------------------
+
+def test_every_pair_is_ranked(numeric_df):
+    leaderboard = screen_regressions(numeric_df)
+    assert list(leaderboard.columns) == LEADERBOARD_COLUMNS
+    assert len(leaderboard) == 4 * 3  # Ordered pairs of the numeric columns
+    assert leaderboard["r_squared"].is_monotonic_decreasing
+    assert set(leaderboard.iloc[0][["feature", "target"]]) == {"a", "b"}
+    assert leaderboard.attrs["rows"] == 500
+
+def test_matches_linear_regression(numeric_df):
+    leaderboard = screen_regressions(numeric_df, columns=["a", "b", "c", "d"])
+    for row in leaderboard.itertuples():
+        model = LinearRegression(numeric_df[row.feature], numeric_df[row.target])
+        assert row.slope == pytest.approx(model.slope, rel=1e-9)
+        assert row.intercept == pytest.approx(model.intercept, rel=1e-9, abs=1e-12)
+        assert row.r_squared == pytest.approx(model.r_squared, rel=1e-9)
+        assert row.mse == pytest.approx(model.mse, rel=1e-9)
+
+def test_target_and_top(numeric_df):
+    leaderboard = screen_regressions(numeric_df, columns=["a", "b", "c"], target="b", top=1)
+    assert len(leaderboard) == 1
+    assert leaderboard.iloc[0]["feature"] == "a"
+    assert leaderboard.iloc[0]["target"] == "b"
+    assert leaderboard.iloc[0]["slope"] == pytest.approx(3, rel=1e-2)
+
+def test_missing_values_drop_rows(numeric_df):
+    numeric_df.loc[:9, "c"] = np.nan
+    leaderboard = screen_regressions(numeric_df, columns=["a", "b", "c"], block_size=64)
+    assert leaderboard.attrs["rows"] == 490
+    complete = numeric_df.iloc[10:]
+    model = LinearRegression(complete["a"], complete["b"])
+    row = leaderboard[(leaderboard["feature"] == "a") & (leaderboard["target"] == "b")].iloc[0]
+    assert row["slope"] == pytest.approx(model.slope, rel=1e-9)
+
+def test_constant_column_is_not_a_feature(numeric_df):
+    numeric_df["constant"] = 4.0
+    leaderboard = screen_regressions(numeric_df, columns=["a", "b", "constant"])
+    assert "constant" not in set(leaderboard["feature"])
+    # As a target it cannot be explained
+    assert (leaderboard.loc[leaderboard["target"] == "constant", "r_squared"] == 0).all()
+
+def test_invalid_requests(numeric_df):
+    with pytest.raises(ValueError):
+        screen_regressions(numeric_df, columns=["a"])
+    with pytest.raises(ValueError):
+        screen_regressions(numeric_df, columns=["a", "b"], target="c")
+    with pytest.raises(ValueError):
+        screen_regressions(pd.DataFrame({"a": [np.nan], "b": [1.0]}))
@@ -0,0 +1,112 @@
+import pytest
+import pandas as pd
+from scroll_table import ScrollTable
+
+
+class FakeTable:
+    """
+    Stand-in for the Tkinter side of a ScrollTable, so its paging can be tested
+    without a display. The view shows VISIBLE_ROWS rows, and every move of the
+    view calls yscrollcommand at once, as Tkinter eventually does.
+    """
+
+    VISIBLE_ROWS = 20
+
+    def __init__(self, table):
+        self.items = []
+        self.top = 0  # Position of the first visible row
+        self._table = table
+
+    def delete(self, *iids):
+        self.items = [item for item in self.items if item not in iids]
+
+    def get_children(self):
+        return list(self.items)
+
+    def insert(self, parent, position, iid, values):
+        if position == "end":
+            self.items.append(iid)
+        else:
+            self.items.insert(position, iid)
+
+    def selection_set(self, iid):
+        pass
+
+    def see(self, iid):
+        self.top = self.items.index(iid)
+
+    def yview_moveto(self, fraction):
+        self.top = round(fraction * len(self.items))
+        self.scroll_event()
+
+    def scroll_event(self):
+        """Call yscrollcommand with the fractions of the current view."""
+        rows = len(self.items)
+        self._table._on_vertical_scroll(str(self.top / rows),
+                                        str(min(self.top + self.VISIBLE_ROWS, rows) / rows))
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        pass
+
+
+@pytest.fixture
+def table():
+    """
+    Fixture to provide a ScrollTable of 5000 rows whose widget calls go to a FakeTable.
+    Every fetch of rows is recorded in table.fetched.
+    """
+    df = pd.DataFrame({"a": range(5000)})
+    table = ScrollTable.__new__(ScrollTable)
+    view = FakeTable(table)
+    for name in ("delete", "get_children", "insert", "selection_set", "see", "yview_moveto"):
+        setattr(table, name, getattr(view, name))
+    table.view = view
+    table.fetched = []
+    table._scroll_y = FakeScrollbar()
+    table._prepending = False
+
+    def fetch_rows(start, stop):
+        table.fetched.append((start, stop))
+        return df.iloc[start:stop]
+
+    table._start_paging(fetch_rows, len(df))
+    return table
+
+# -------------------------------------------------
+# Tests for jump_to_row
+# -------------------------------------------------
+
+def test_jump_to_row(table):
+    table.jump_to_row(3210)
+    assert table.fetched[-1] == (3000, 3500)
+    assert table.view.items[table.view.top] == "3210"
+
+def test_jump_to_row_clipped(table):
+    table.jump_to_row(10 ** 9)
+    assert table.view.items[table.view.top] == "4999"
+
+# -------------------------------------------------
+# Tests for the pages loaded while scrolling
+# -------------------------------------------------
+
+def test_scroll_to_top_loads_one_page(table):
+    """
+    Test that scrolling to the top loads exactly the page before the first row,
+    and keeps the same rows in view.
+    """
+    table.jump_to_row(3000)
+    table.fetched.clear()
+    table.view.top = 0
+    table.view.scroll_event()
+
+    assert table.fetched == [(2500, 3000)]
+    assert table.view.items[0] == "2500"
+    assert table.view.items[table.view.top] == "3000"
+
+def test_scroll_to_end_loads_next_page(table):
+    table.fetched.clear()
+    table.view.top = len(table.view.items) - table.view.VISIBLE_ROWS
+    table.view.scroll_event()
+    assert table.fetched == [(500, 1000)]
@@ -0,0 +1,106 @@
+import pytest
+import pandas as pd
+import numpy as np
+from open_files import open_file
+from shard_loader import is_shard_pattern, expand_shards
+from exceptions import SchemaMismatchError, EmptyDataError, ColumnNotFoundError
+
+@pytest.fixture
+def shards(tmp_path):
+    """
+    Fixture to create a directory with three daily CSV shards and an unrelated file.
+    """
+    directory = tmp_path / "daily"
+    directory.mkdir()
+    frames = []
+    for day in range(3):
+        df = pd.DataFrame({
+            "x": np.arange(day * 100, (day + 1) * 100),
+            "y": np.linspace(0, 1, 100) + day,
+            "label": ["a", "b"] * 50,
+        })
+        df.to_csv(directory / f"2024-01-0{day + 1}.csv", index=False)
+        frames.append(df)
+    (directory / "notes.txt").write_text("not data")
+    return directory, pd.concat(frames, ignore_index=True)
+
+# -------------------------------------------------
+# Tests for shard expansion
+# -------------------------------------------------
+
+def test_is_shard_pattern(shards, tmp_path):
+    directory, _ = shards
+    assert is_shard_pattern(directory)
+    assert is_shard_pattern(str(directory / "*.csv"))
+    assert not is_shard_pattern(str(directory / "2024-01-01.csv"))
+
+    # A file whose name has glob characters is a single file
+    bracket = tmp_path / "data[1].csv"
+    bracket.write_text("x\n1\n")
+    assert not is_shard_pattern(str(bracket))
+
+def test_expand_shards_sorted(shards):
+    directory, _ = shards
+    paths = expand_shards(directory, (".csv",))
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["2024-01-01.csv", "2024-01-02.csv",
+                                                      "2024-01-03.csv"]
+
+def test_expand_shards_no_match(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        expand_shards(str(tmp_path / "*.csv"), (".csv",))
+
+# -------------------------------------------------
+# Tests for open_file with several files
+# -------------------------------------------------
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_open_directory(shards, workers):
+    directory, expected = shards
+    pd.testing.assert_frame_equal(open_file(directory, workers=workers), expected)
+
+def test_open_glob_columns(shards):
+    directory, expected = shards
+    df = open_file(str(directory / "2024-01-0[12].csv"), columns=["y"], workers=1)
+    pd.testing.assert_frame_equal(df, expected.loc[:199, ["y"]])
+
+def test_open_glob_stream(shards):
+    directory, expected = shards
+    chunks = list(open_file(str(directory / "*.csv"), stream=True))
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+def test_dtypes_are_combined(tmp_path):
+    """
+    Test that an integer column in one shard and a float column in another become float.
+    """
+    pd.DataFrame({"x": [1, 2]}).to_csv(tmp_path / "a.csv", index=False)
+    pd.DataFrame({"x": [2.5, None]}).to_csv(tmp_path / "b.csv", index=False)
+    df = open_file(tmp_path, workers=1)
+    assert df["x"].dtype == np.float64
+    assert df["x"].tolist()[:3] == [1.0, 2.0, 2.5]
+
+def test_different_columns(shards):
+    directory, _ = shards
+    pd.DataFrame({"x": [1], "z": [2]}).to_csv(directory / "2024-01-04.csv", index=False)
+    with pytest.raises(SchemaMismatchError, match="2024-01-04.csv"):
+        open_file(directory, workers=1)
+
+def test_incompatible_types(tmp_path):
+    pd.DataFrame({"x": [1, 2]}).to_csv(tmp_path / "a.csv", index=False)
+    pd.DataFrame({"x": ["one", "two"]}).to_csv(tmp_path / "b.csv", index=False)
+    with pytest.raises(SchemaMismatchError, match="'x'"):
+        open_file(tmp_path, workers=1)
+
+def test_missing_column(shards):
+    directory, _ = shards
+    with pytest.raises(ColumnNotFoundError):
+        open_file(directory, columns=["z"], workers=1)
+
+def test_empty_shards_are_skipped(tmp_path):
+    pd.DataFrame({"x": [1, 2]}).to_csv(tmp_path / "a.csv", index=False)
+    (tmp_path / "b.csv").write_text("x\n")
+    assert open_file(tmp_path, workers=1)["x"].tolist() == [1, 2]
+
+def test_only_empty_shards(tmp_path):
+    (tmp_path / "a.csv").write_text("x\n")
+    with pytest.raises(EmptyDataError):
+        open_file(tmp_path, workers=1)
@@ -0,0 +1,121 @@
+import pytest
+import pandas as pd
+import numpy as np
+import sqlite3
+from linear_regression import LinearRegression
+from nan_handler import NaNHandler, ConstantValueError
+from sql_regression import fit_sqlite_regression
+from exceptions import ColumnNotFoundError
+
+@pytest.fixture
+def sample_dataframe():
+    """
+    Fixture to provide noisy linear data with missing values in both columns.
+    """
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 10, 200)
+    y = 3 + 2 * x + rng.normal(0, 1, 200)
+    x[[5, 50, 120]] = np.nan
+    y[[7, 50, 180]] = np.nan
+    return pd.DataFrame({"X": x, "Y": y, "Label": ["a"] * 200})
+
+@pytest.fixture
+def sample_db(tmp_path, sample_dataframe):
+    """
+    Fixture to store the sample data in a SQLite database.
+    """
+    db_path = tmp_path / "data.db"
+    conn = sqlite3.connect(db_path)
+    sample_dataframe.to_sql("measures", conn, index=False)
+    conn.close()
+    return db_path
+
+def assert_same_model(model, expected):
+    """
+    Check that two models have the same parameters and metrics.
+    """
+    assert model.slope == pytest.approx(expected.slope, rel=1e-9)
+    assert model.intercept == pytest.approx(expected.intercept, rel=1e-9)
+    assert model.r_squared == pytest.approx(expected.r_squared, rel=1e-9)
+    assert model.mse == pytest.approx(expected.mse, rel=1e-9)
+
+@pytest.mark.parametrize("method, constant_value", [
+    ("Delete Rows", None),
+    ("Fill with Mean", None),
+    ("Fill with Median", None),
+    ("Fill with a Constant Value", 4.5),
+])
+def test_matches_pandas_regression(sample_db, sample_dataframe, method, constant_value):
+    """
+    Test that the model fitted in the database matches the one fitted on the preprocessed DataFrame.
+    """
+    processed = NaNHandler(sample_dataframe, ["X", "Y"]).preprocess(method, constant_value)
+    expected = LinearRegression(processed["X"], processed["Y"])
+
+    model = fit_sqlite_regression(sample_db, "X", "Y", method, constant_value)
+
+    assert_same_model(model, expected)
+    assert model.feature_name == "X"
+    assert model.predictions is None
+
+def test_large_offset(tmp_path):
+    """
+    Test a timestamp-like feature, where raw sums of products cancel every digit.
+    """
+    rng = np.random.default_rng(4)
+    x = 1.7e9 + 60.0 * np.arange(100_000)
+    df = pd.DataFrame({"X": x, "Y": 5 + 0.001 * (x - 1.7e9) + rng.normal(0, 1, 100_000)})
+    db_path = tmp_path / "times.db"
+    conn = sqlite3.connect(db_path)
+    df.to_sql("measures", conn, index=False)
+    conn.close()
+
+    model = fit_sqlite_regression(db_path, "X", "Y")
+    expected = LinearRegression(df["X"], df["Y"])
+    assert model.slope == pytest.approx(expected.slope, rel=1e-9)
+    assert model.intercept == pytest.approx(expected.intercept, rel=1e-9)
+    assert model.r_squared == pytest.approx(expected.r_squared, rel=1e-9)
+    # R² is 1 - 3e-7, so the MSE is the difference of two close sums, which
+    # SQLite adds without compensation. Raw sums of products were 2.6% off.
+    assert model.mse == pytest.approx(expected.mse, rel=1e-5)
+
+def test_empty_table(tmp_path):
+    """
+    Test a table without rows.
+    """
+    db_path = tmp_path / "empty.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE measures (X REAL, Y REAL)")
+    conn.close()
+    with pytest.raises(ValueError, match="empty"):
+        fit_sqlite_regression(db_path, "X", "Y")
+
+def test_median_even_count(tmp_path):
+    """
+    Test the SQL median with an even number of values.
+    """
+    df = pd.DataFrame({"X": [1.0, 2.0, 3.0, 4.0, 5.0], "Y": [1.0, None, 10.0, 2.0, 4.0]})
+    db_path = tmp_path / "even.db"
+    conn = sqlite3.connect(db_path)
+    df.to_sql("t", conn, index=False)
+    conn.close()
+
+    processed = NaNHandler(df, ["X", "Y"]).preprocess("Fill with Median")
+    expected = LinearRegression(processed["X"], processed["Y"])
+    assert_same_model(fit_sqlite_regression(db_path, "X", "Y", "Fill with Median"), expected)
+
+def test_missing_values_without_method(sample_db):
+    with pytest.raises(ValueError, match="non-existent values"):
+        fit_sqlite_regression(sample_db, "X", "Y")
+
+def test_constant_method_without_value(sample_db):
+    with pytest.raises(ConstantValueError):
+        fit_sqlite_regression(sample_db, "X", "Y", "Fill with a Constant Value")
+
+def test_non_numeric_column(sample_db):
+    with pytest.raises(TypeError):
+        fit_sqlite_regression(sample_db, "Label", "Y", "Delete Rows")
+
+def test_missing_column(sample_db):
+    with pytest.raises(ColumnNotFoundError):
+        fit_sqlite_regression(sample_db, "Z", "Y", "Delete Rows")
@@ -0,0 +1,270 @@
+import pytest
+import pandas as pd
+import numpy as np
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine
+from sqlite_reader import (get_connection, read_table, close_connections,
+                           SQLiteCatalog, TableLRU, sample_table)
+
+@pytest.fixture
+def sample_db(tmp_path):
+    """
+    Fixture to create a database with integer, real, text, date and nullable columns.
+    """
+    db_path = tmp_path / "sample.db"
+    df = pd.DataFrame({
+        "id": np.arange(10),
+        "value": np.linspace(0, 1, 10),
+        "name": [f"item {i}" for i in range(10)],
+        "nullable": [1, 2, 3, None, 5, 6, 7, 8, 9, 10],
+        "date": pd.date_range("2024-01-01", periods=10),
+    })
+    engine = create_engine(f"sqlite:///{db_path}")
+    df.to_sql("items", engine, index=False)
+    engine.dispose()
+    return db_path
+
+@pytest.mark.parametrize("batch_size", [3, 1000])
+def test_read_table_matches_read_sql_table(sample_db, batch_size):
+    """
+    Test that the batched reader returns the same data and dtypes as pandas.
+    """
+    engine = create_engine(f"sqlite:///{sample_db}")
+    expected = pd.read_sql_table("items", engine)
+    engine.dispose()
+
+    df = read_table(sample_db, "items", batch_size=batch_size)
+    pd.testing.assert_frame_equal(df, expected)
+
+def test_read_table_untyped_columns(tmp_path):
+    """
+    Test that columns without a declared type, and computed columns of a view,
+    get the same dtypes as pandas infers.
+    """
+    db_path = tmp_path / "untyped.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t(a, b, c, d)")
+    conn.executemany("INSERT INTO t VALUES (?, ?, ?, ?)",
+                     [(i, i / 2, f"text {i}", None if i == 1 else i) for i in range(5)])
+    conn.execute("CREATE VIEW v AS SELECT a * 2 AS a2, b + 1 AS b1 FROM t")
+    conn.commit()
+    conn.close()
+
+    table = read_table(db_path, "t", batch_size=2)
+    assert table["a"].dtype == np.int64
+    assert table["b"].dtype == np.float64
+    assert table["c"].dtype == object
+    assert table["d"].dtype == np.float64  # The NULL becomes NaN
+    assert table["a"].tolist() == [0, 1, 2, 3, 4]
+    assert table["c"].tolist() == [f"text {i}" for i in range(5)]
+
+    view = read_table(db_path, "v")
+    assert view["a2"].dtype == np.int64
+    assert view["b1"].dtype == np.float64
+    assert view["a2"].tolist() == [0, 2, 4, 6, 8]
+
+def test_read_table_columns(sample_db):
+    df = read_table(sample_db, "items", columns=["name", "id"])
+    assert list(df.columns) == ["name", "id"]
+    assert df["id"].dtype == np.int64
+
+def test_read_table_limit(sample_db):
+    df = read_table(sample_db, "items", limit=4)
+    assert df["id"].tolist() == [0, 1, 2, 3]
+    assert len(read_table(sample_db, "items", limit=100)) == 10
+
+def test_read_table_rowids(sample_db):
+    df = read_table(sample_db, "items", rowids=[8, 2, 5])
+    assert df["id"].tolist() == [1, 4, 7]  # Rowids start at 1, rows in rowid order
+
+def test_sample_table(sample_db):
+    sample, total = sample_table(sample_db, "items", 4, seed=0)
+    assert total == 10 and len(sample) == 4
+    assert sample["id"].is_monotonic_increasing
+    assert sample["date"].dtype == "datetime64[ns]"  # Same dtypes as read_table
+
+def test_sample_view_and_without_rowid(tmp_path):
+    db_path = tmp_path / "kinds.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE keyed (k INTEGER PRIMARY KEY, v REAL) WITHOUT ROWID")
+    conn.executemany("INSERT INTO keyed VALUES (?, ?)", [(i, i / 2) for i in range(20)])
+    conn.execute("CREATE VIEW doubled AS SELECT k, 2 * v AS v FROM keyed")
+    conn.commit()
+    conn.close()
+
+    for table in ("keyed", "doubled"):
+        sample, total = sample_table(db_path, table, 5, seed=1)
+        assert total == 20 and len(sample) == 5
+
+def test_integer_column_widens(tmp_path):
+    """
+    Test that integer columns become float with NULLs and object with text, as in pandas.
+    """
+    db_path = tmp_path / "mixed.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (a INTEGER, b INTEGER)")
+    conn.executemany("INSERT INTO t VALUES (?, ?)", [(1, 1), (2, None), (3, "text")])
+    conn.commit()
+    conn.close()
+
+    df = read_table(db_path, "t", batch_size=1)
+    assert df["a"].dtype == np.int64
+    assert df["b"].dtype == object
+    assert df["b"].tolist()[0] == 1 and df["b"].tolist()[2] == "text"
+
+def test_connection_is_pooled(sample_db):
+    assert get_connection(sample_db) is get_connection(sample_db)
+
+def test_connection_is_read_only(sample_db):
+    with pytest.raises(sqlite3.OperationalError):
+        get_connection(sample_db).execute("DELETE FROM items")
+
+def test_modified_file_gets_new_connection(sample_db):
+    """
+    Test that a database modified on disk is not read through a stale connection.
+    """
+    first = get_connection(sample_db)
+    conn = sqlite3.connect(sample_db)
+    conn.executemany("INSERT INTO items (id) VALUES (?)", [(i,) for i in range(10, 5000)])
+    conn.commit()
+    conn.close()
+
+    assert get_connection(sample_db) is not first
+    assert len(read_table(sample_db, "items")) == 5000
+
+def test_stale_connection_is_not_closed(sample_db):
+    """
+    Test that a connection replaced because the file changed can still finish its reads.
+    """
+    first = get_connection(sample_db)
+    cursor = first.execute("SELECT id FROM items")
+    conn = sqlite3.connect(sample_db)
+    conn.execute("INSERT INTO items (id) VALUES (10)")
+    conn.commit()
+    conn.close()
+
+    assert get_connection(sample_db) is not first
+    assert len(cursor.fetchall()) == 10
+
+def test_each_thread_gets_its_own_connection(sample_db):
+    """
+    Test that threads reading the same database at once do not share a connection.
+    """
+    barrier = threading.Barrier(4)
+
+    def read(_):
+        conn = get_connection(sample_db)
+        barrier.wait()  # Every thread holds its connection at the same time
+        rows = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert get_connection(sample_db) is conn  # Reused within the thread
+        return id(conn), rows
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(read, range(4)))
+    assert len({conn for conn, _ in results}) == 4
+    assert all(rows == 10 for _, rows in results)
+
+def test_close_connections(sample_db):
+    first = get_connection(sample_db)
+    close_connections()
+    assert get_connection(sample_db) is not first
+
+# -------------------------------------------------
+# Tests for SQLiteCatalog
+# -------------------------------------------------
+
+@pytest.fixture
+def catalog_db(tmp_path):
+    """
+    Fixture to create a database with two tables, a view and an index.
+    """
+    db_path = tmp_path / "catalog.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE VIEW summary AS SELECT 1 AS total")
+    conn.execute("CREATE TABLE sales (amount REAL, units INTEGER)")
+    conn.executemany("INSERT INTO sales VALUES (?, ?)", [(i * 1.5, i) for i in range(50)])
+    conn.execute("CREATE INDEX sales_units ON sales (units)")
+    conn.execute("CREATE TABLE costs (amount REAL)")
+    conn.commit()
+    conn.close()
+    return db_path
+
+def test_catalog_names(catalog_db):
+    catalog = SQLiteCatalog(catalog_db)
+    assert catalog.names == ["summary", "sales", "costs"]
+    assert catalog.tables == ["sales", "costs"]
+    assert catalog.kind("summary") == "view"
+    assert catalog.default_table() == "sales"
+
+def test_catalog_columns(catalog_db):
+    catalog = SQLiteCatalog(catalog_db)
+    assert catalog.columns("sales") == {"amount": "REAL", "units": "INTEGER"}
+
+def test_catalog_estimated_rows(catalog_db):
+    catalog = SQLiteCatalog(catalog_db)
+    assert catalog.estimated_rows("sales") == 50
+    assert catalog.estimated_rows("costs") == 0
+    assert catalog.estimated_rows("summary") is None
+
+def test_catalog_estimated_rows_analyze(catalog_db):
+    """
+    Test that the statistics of ANALYZE are used when they exist.
+    """
+    conn = sqlite3.connect(catalog_db)
+    conn.execute("DELETE FROM sales WHERE units < 40")  # The largest rowid stays 50
+    conn.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+    assert SQLiteCatalog(catalog_db).estimated_rows("sales") == 10
+
+# -------------------------------------------------
+# Tests for TableLRU
+# -------------------------------------------------
+
+def test_table_lru_evicts_oldest(catalog_db):
+    cache = TableLRU(max_tables=2)
+    frames = {name: pd.DataFrame({"x": [i]}) for i, name in enumerate("abc")}
+    cache.put(catalog_db, "a", frames["a"])
+    cache.put(catalog_db, "b", frames["b"])
+    cache.get(catalog_db, "a")  # "a" becomes the most recently used
+    cache.put(catalog_db, "c", frames["c"])
+
+    assert len(cache) == 2
+    pd.testing.assert_frame_equal(cache.get(catalog_db, "a"), frames["a"])
+    assert cache.get(catalog_db, "b") is None
+
+def test_table_lru_returns_copies(catalog_db):
+    """
+    Test that changing a table returned by the cache does not change the cached table.
+    """
+    cache = TableLRU()
+    first = cache.put(catalog_db, "a", pd.DataFrame({"x": [1.0, 2.0]}))
+    first["y"] = 0
+    second = cache.get(catalog_db, "a")
+    second.attrs["note"] = "changed"
+    with pytest.raises(ValueError):
+        second.loc[0, "x"] = 5.0
+
+    cached = cache.get(catalog_db, "a")
+    assert cached is not second
+    pd.testing.assert_frame_equal(cached, pd.DataFrame({"x": [1.0, 2.0]}))
+    assert cached.attrs == {}
+
+def test_table_lru_memory_limit(catalog_db):
+    cache = TableLRU(max_bytes=1000)
+    cache.put(catalog_db, "big", pd.DataFrame({"x": np.zeros(1000)}))
+    assert len(cache) == 0
+
+def test_table_lru_modified_file(catalog_db):
+    """
+    Test that a table cached before the database was modified is not returned.
+    """
+    cache = TableLRU()
+    cache.put(catalog_db, "sales", read_table(catalog_db, "sales"))
+    conn = sqlite3.connect(catalog_db)
+    conn.execute("INSERT INTO sales VALUES (0, 0)")
+    conn.commit()
+    conn.close()
+    assert cache.get(catalog_db, "sales") is None